@@ -31,6 +31,7 @@ class BrandProfile(BaseModel):
     brand_values: List[str]
     preferred_content_types: List[str]
     social_media_presence: Dict[str, Any]
+    embedding: Optional[List[float]] = Field(default=None, description="Precomputed brand embedding for semantic matching")
 
 
 class CreatorProfile(BaseModel):
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import time
+from dataclasses import asdict
 from src.core.config import settings
 from src.core.logger import ai_logger, log_api_request, log_api_response
 from src.core.exceptions import (
@@ -221,11 +222,11 @@ async def predict_content_performance(
         # Ensure types match the Pydantic models (fill sensible defaults if missing)
         # accept either dict from service or dataclass instance
         raw_pm = performance_prediction.get("performance_metrics", {})
-        pm = raw_pm if isinstance(raw_pm, dict) else raw_pm.__dict__
+        pm = raw_pm if isinstance(raw_pm, dict) else asdict(raw_pm)
         raw_ot = performance_prediction.get("optimal_timing", {})
-        ot = raw_ot if isinstance(raw_ot, dict) else raw_ot.__dict__
+        ot = raw_ot if isinstance(raw_ot, dict) else asdict(raw_ot)
         raw_co = performance_prediction.get("content_optimization", {})
-        co = raw_co if isinstance(raw_co, dict) else raw_co.__dict__
+        co = raw_co if isinstance(raw_co, dict) else asdict(raw_co)
         rf = performance_prediction.get("risk_factors", [])
         sp = performance_prediction.get("success_probability", 0.5)
 
@@ -351,7 +352,7 @@ async def predict_campaign_performance(
         
         # Normalize campaign prediction structure to match model
         raw_cm = campaign_prediction.get("campaign_metrics", {})
-        cm = raw_cm if isinstance(raw_cm, dict) else getattr(raw_cm, "__dict__", {})
+        cm = raw_cm if isinstance(raw_cm, dict) else asdict(raw_cm)
         pb = campaign_prediction.get("platform_breakdown", {})
         oba = campaign_prediction.get("optimal_budget_allocation", {})
         ra = campaign_prediction.get("risk_assessment", {})
@@ -0,0 +1,21 @@
+"""
+Response classes shared by the API routers
+"""
+from typing import Any
+from fastapi.responses import JSONResponse
+
+# Optional orjson import for fast response serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson when available, falling back to the stdlib encoder"""
+    
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return super().render(content)
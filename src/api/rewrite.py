@@ -136,7 +136,7 @@ async def rewrite_content(
         suggestions = []
         
         # Calculate confidence score based on content quality
-        quality_analysis = nlp_service.analyze_content_quality(
+        quality_analysis = await nlp_service.a_analyze_content_quality(
             rewritten_content, 
             request.content_type or "post", 
             platform
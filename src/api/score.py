@@ -5,6 +5,7 @@ Provides real-time scoring for titles, descriptions, and other content fields
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
+import asyncio
 import time
 from src.core.config import settings
 from src.core.logger import ai_logger, log_api_request, log_api_response
@@ -93,16 +94,14 @@ async def calculate_ai_score(
     mentions = nlp_service.extract_mentions(content)
     urls = nlp_service.extract_urls(content)
     
-    # Analyze sentiment
-    sentiment = nlp_service.analyze_sentiment(content)
-    
-    # Calculate readability
-    readability = nlp_service.calculate_readability_score(content)
+    # Sentiment, readability and keywords are CPU-bound; run them off the event loop
+    sentiment, readability, keywords = await asyncio.gather(
+        asyncio.to_thread(nlp_service.analyze_sentiment, content),
+        asyncio.to_thread(nlp_service.calculate_readability_score, content),
+        asyncio.to_thread(nlp_service.extract_keywords, content, 10)
+    )
     readability_score = readability.get('score', 0.5) if isinstance(readability, dict) else 0.5
     
-    # Extract keywords
-    keywords = nlp_service.extract_keywords(content, max_keywords=10)
-    
     # Platform-specific scoring
     platform_score = _calculate_platform_score(content, field, platform, {
         "word_count": word_count,
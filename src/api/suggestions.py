@@ -249,7 +249,7 @@ async def generate_content_suggestions(
         
         # Generate content optimization suggestions
         if request.content:
-            optimization_suggestions = nlp_service.analyze_content_quality(
+            optimization_suggestions = await nlp_service.a_analyze_content_quality(
                 content=request.content,
                 content_type=content_type,
                 platform=platform
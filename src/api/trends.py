@@ -15,8 +15,9 @@ from src.core.exceptions import (
 )
 from src.services.trend_analysis_service import TrendAnalysisService
 from src.services.rag_service import RAGService
+from src.api.responses import FastJSONResponse
 
-router = APIRouter(prefix="/ai/trends", tags=["trend-analysis"])
+router = APIRouter(prefix="/ai/trends", tags=["trend-analysis"], default_response_class=FastJSONResponse)
 
 
 class TrendAnalysisRequest(BaseModel):
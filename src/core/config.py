@@ -41,6 +41,8 @@ class Settings(BaseSettings):
     
     # Embedding Models
     embedding_model: str = Field(default="text-embedding-3-large", env="EMBEDDING_MODEL")
+    enable_embedding_cache: bool = Field(default=True, env="ENABLE_EMBEDDING_CACHE")
+    embedding_cache_path: str = Field(default="./data/embedding_cache.db", env="EMBEDDING_CACHE_PATH")
     
     # Fallback Configuration
     enable_fallback: bool = Field(default=True, env="ENABLE_AI_FALLBACK")
@@ -53,6 +55,10 @@ class Settings(BaseSettings):
     
     # Alternative Vector DB
     faiss_index_path: str = Field(default="./data/faiss_index", env="FAISS_INDEX_PATH")
+    vector_quantization: str = Field(default="none", env="VECTOR_QUANTIZATION")  # none, fp16 or sq8
+    faiss_ivf_threshold: int = Field(default=100000, env="FAISS_IVF_THRESHOLD")
+    faiss_ivf_nprobe: int = Field(default=16, env="FAISS_IVF_NPROBE")
+    vector_search_workers: int = Field(default=os.cpu_count() or 4, env="VECTOR_SEARCH_WORKERS")
     chroma_persist_directory: str = Field(default="./data/chroma_db", env="CHROMA_PERSIST_DIRECTORY")
     
     # Social Media API Keys (REMOVED - Backend handles data collection)
@@ -69,6 +75,9 @@ class Settings(BaseSettings):
     # facebook_app_secret: Optional[str] = Field(default=None, env="FACEBOOK_APP_SECRET")
     # linkedin_client_id: Optional[str] = Field(default=None, env="LINKEDIN_CLIENT_ID")
     # linkedin_client_secret: Optional[str] = Field(default=None, env="LINKEDIN_CLIENT_SECRET")
+    # Off while the social services return mock data; enable once they call the real APIs
+    social_rate_limits_enabled: bool = Field(default=False, env="SOCIAL_RATE_LIMITS_ENABLED")
+    social_max_concurrency: int = Field(default=64, env="SOCIAL_MAX_CONCURRENCY")
     
     # Backend Service Configuration (CRITICAL for stateless mode)
     backend_service_url: str = Field(default="http://localhost:5000", env="BACKEND_SERVICE_URL")
@@ -112,6 +121,9 @@ class Settings(BaseSettings):
     # Data Processing
     max_content_length: int = Field(default=10000, env="MAX_CONTENT_LENGTH")
     batch_size: int = Field(default=32, env="BATCH_SIZE")
+    spacy_batch_size: int = Field(default=64, env="SPACY_BATCH_SIZE")
+    nlp_n_process: int = Field(default=1, env="NLP_N_PROCESS")
+    nlp_bulk_threshold: int = Field(default=200, env="NLP_BULK_THRESHOLD")
 
     # CORS / Hosts
     allowed_cors_origins: Optional[str] = Field(default=None, env="ALLOWED_CORS_ORIGINS")
@@ -122,6 +134,13 @@ class Settings(BaseSettings):
     # Cache Configuration
     cache_ttl: int = Field(default=3600, env="CACHE_TTL")
     cache_max_size: int = Field(default=1000, env="CACHE_MAX_SIZE")
+    profile_cache_ttl: int = Field(default=300, env="PROFILE_CACHE_TTL")
+    prediction_cache_ttl: int = Field(default=300, env="PREDICTION_CACHE_TTL")
+    historical_data_path: str = Field(default="./data/historical_performance.arrow", env="HISTORICAL_DATA_PATH")
+    enable_prompt_cache: bool = Field(default=True, env="ENABLE_PROMPT_CACHE")
+    prompt_cache_size: int = Field(default=10000, env="PROMPT_CACHE_SIZE")
+    prompt_cache_similarity: float = Field(default=0.95, env="PROMPT_CACHE_SIMILARITY")
+    llm_max_concurrency: int = Field(default=5, env="LLM_MAX_CONCURRENCY")
     
     # Background Tasks
     celery_broker_url: str = Field(default="redis://localhost:6379/1", env="CELERY_BROKER_URL")
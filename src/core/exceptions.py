@@ -106,12 +106,12 @@ class ValidationError(AIServiceException):
 class ExternalServiceError(AIServiceException):
     """Raised when external service call fails"""
     
-    def __init__(self, service: str, status_code: int = None, response: str = None):
+    def __init__(self, service: str, status_code: int = None, response: str = None, message: str = None):
         self.service = service
         self.status_code = status_code
         self.response = response
         super().__init__(
-            f"External service '{service}' error",
+            message or f"External service '{service}' error",
             "EXTERNAL_SERVICE_ERROR",
             {
                 "service": service,
@@ -98,7 +98,8 @@ class AIServiceLogger:
         """Log AI operation details"""
         level = "info" if success else "error"
         getattr(self.logger, level)(
-            f"AI operation {operation}",
+            "AI operation {}",
+            operation,
             operation=operation,
             model=model,
             tokens_used=tokens_used,
@@ -145,7 +146,8 @@ class AIServiceLogger:
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
         """Log error with context"""
         self.logger.error(
-            f"Error occurred: {str(error)}",
+            "Error occurred: {}",
+            error,
             error_type=type(error).__name__,
             error_message=str(error),
             context=context or {}
@@ -155,7 +157,8 @@ class AIServiceLogger:
                        memory_usage_mb: float = None, **kwargs):
         """Log performance metrics"""
         self.logger.info(
-            f"Performance metric: {operation}",
+            "Performance metric: {}",
+            operation,
             operation=operation,
             duration_ms=duration_ms,
             memory_usage_mb=memory_usage_mb,
@@ -200,7 +203,8 @@ def log_data_processing(operation: str, records_processed: int,
                        duration_ms: int, **kwargs):
     """Log data processing operations"""
     ai_logger.logger.info(
-        f"Data processing: {operation}",
+        "Data processing: {}",
+        operation,
         operation=operation,
         records_processed=records_processed,
         duration_ms=duration_ms,
@@ -212,7 +216,8 @@ def log_vector_operation(operation: str, vector_count: int,
                         index_name: str = None, **kwargs):
     """Log vector database operations"""
     ai_logger.logger.info(
-        f"Vector operation: {operation}",
+        "Vector operation: {}",
+        operation,
         operation=operation,
         vector_count=vector_count,
         index_name=index_name,
@@ -223,7 +228,8 @@ def log_vector_operation(operation: str, vector_count: int,
 def log_cache_operation(operation: str, key: str, hit: bool = None, **kwargs):
     """Log cache operations"""
     ai_logger.logger.info(
-        f"Cache operation: {operation}",
+        "Cache operation: {}",
+        operation,
         operation=operation,
         key=key,
         hit=hit,
@@ -16,6 +16,13 @@ from src.core.logger import setup_logging, ai_logger
 from src.core.exceptions import AIServiceException, get_http_status_from_error
 from src.api import health, competitor, suggestions, matchmaking, trends, predictions, ai_providers, rewrite, score
 
+# Optional uvloop import for a faster event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Setup logging
 setup_logging()
 
@@ -23,6 +30,9 @@ setup_logging()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
+    # Background startup work, awaited or cancelled on shutdown
+    app.state.startup_tasks = []
+
     # Startup
     try:
         port_env = os.environ.get("PORT")
@@ -46,22 +56,39 @@ async def lifespan(app: FastAPI):
             ai_logger.logger.warning("No primary LLM key configured (OPENAI_API_KEY/GEMINI_API_KEY); using fallbacks only")
         if not settings.chroma_persist_directory:
             ai_logger.logger.warning("CHROMA_PERSIST_DIRECTORY not set; using default in-memory/on-disk path")
+        if UVLOOP_AVAILABLE and not isinstance(asyncio.get_running_loop(), uvloop.Loop):
+            ai_logger.logger.warning("uvloop is installed but not in use; start uvicorn with --loop uvloop")
 
         # Test critical services (non-blocking)
         try:
             from src.models.vector_store import get_vector_store
             # Initialize vector store asynchronously but don't block startup
-            asyncio.create_task(get_vector_store())
+            app.state.startup_tasks.append(asyncio.create_task(get_vector_store()))
             ai_logger.logger.info("Vector store initialization started")
         except Exception as e:
-            ai_logger.logger.warning(f"Vector store initialization failed: {e}")
+            ai_logger.logger.warning("Vector store initialization failed: {}", e)
+
+        try:
+            from src.models.embedding_model import preseed_embedding_cache
+            # Warm the embedding cache in the background
+            app.state.startup_tasks.append(asyncio.create_task(preseed_embedding_cache()))
+        except Exception as e:
+            ai_logger.logger.warning("Embedding cache preseed failed: {}", e)
+
+        try:
+            from src.services.nlp_utils import NLPService
+            # Load NLP models before serving; pipelines are shared process-wide
+            await asyncio.to_thread(NLPService().warmup)
+            ai_logger.logger.info("NLP models warmed up")
+        except Exception as e:
+            ai_logger.logger.warning("NLP warmup failed: {}", e)
 
         try:
             from src.models.multi_llm_client import MultiLLMClient
             llm_client = MultiLLMClient()
             ai_logger.logger.info("LLM client initialized successfully")
         except Exception as e:
-            ai_logger.logger.warning(f"LLM client initialization failed: {e}")
+            ai_logger.logger.warning("LLM client initialization failed: {}", e)
 
         ai_logger.logger.info("Bloocube AI Service startup completed successfully")
     except Exception as e:
@@ -73,7 +100,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     try:
         ai_logger.logger.info("Shutting down Bloocube AI Service")
-        # Cleanup any resources if needed
+        for task in app.state.startup_tasks:
+            task.cancel()
+        await asyncio.gather(*app.state.startup_tasks, return_exceptions=True)
+        from src.services.social._http import close_session
+        await close_session()
     except Exception as e:
         ai_logger.log_error(e, {"stage": "shutdown"})
 
@@ -268,5 +299,6 @@ if __name__ == "__main__":
         host=host_to_use,
         port=port_to_use,
         reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
         log_level=settings.log_level.lower()
     )
@@ -0,0 +1,108 @@
+"""
+Disk-backed embedding cache
+"""
+from typing import List, Optional, Sequence
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+import numpy as np
+
+from src.core.config import settings
+from src.core.logger import ai_logger
+from src.utils.constants import CONTENT_CATEGORIES
+
+
+# Common industry/category terms embedded up front so the first requests hit the cache
+PRESEED_TERMS = tuple(CONTENT_CATEGORIES.values()) + (
+    "beauty", "gaming", "tech", "fitness", "finance", "parenting", "music",
+    "art", "photography", "automotive", "home decor", "pets", "sustainability",
+    "brand awareness", "engagement", "conversions", "product launch",
+    "educational", "entertaining", "inspirational", "tech enthusiasts"
+)
+
+# Ids per SELECT, well under SQLite's bound-parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of embeddings keyed by normalized text hash and model
+    
+    Vectors are stored as float32, so a hit returns exactly what the model computed.
+    Methods block on disk I/O; async callers run them in a worker thread.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.embedding_cache_path
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb ("
+            "text_hash BLOB NOT NULL, model TEXT NOT NULL, dim INTEGER NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (text_hash, model))"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Hash of the normalized text"""
+        return hashlib.sha1(text.lower().strip().encode("utf-8")).digest()
+    
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        """Get a cached embedding, or None on a miss"""
+        return self.get_many([text], model)[0]
+    
+    def get_many(self, texts: Sequence[str], model: str) -> List[Optional[np.ndarray]]:
+        """Get cached embeddings for several texts; misses are None"""
+        keys = [self._key(text) for text in texts]
+        rows = []
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+                chunk = keys[start:start + _QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT text_hash, dim, vector FROM emb WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *chunk)
+                ).fetchall())
+        
+        # Rows whose size disagrees with their dim (e.g. written in another format) count as misses
+        found = {
+            text_hash: np.frombuffer(vector, dtype=np.float32)
+            for text_hash, dim, vector in rows
+            if len(vector) == dim * 4
+        }
+        return [found.get(key) for key in keys]
+    
+    def put(self, text: str, model: str, vector: Sequence[float]) -> None:
+        """Store an embedding"""
+        self.put_many([text], model, [vector])
+    
+    def put_many(self, texts: Sequence[str], model: str, vectors: Sequence[Sequence[float]]) -> None:
+        """Store embeddings for several texts"""
+        rows = []
+        for text, vector in zip(texts, vectors):
+            packed = np.asarray(vector, dtype=np.float32)
+            rows.append((self._key(text), model, len(packed), packed.tobytes()))
+        
+        try:
+            with self._lock:
+                self._conn.executemany("INSERT OR REPLACE INTO emb VALUES (?, ?, ?, ?)", rows)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            # A failed write only costs a recomputation later
+            ai_logger.log_error(e, {"operation": "embedding_cache_put", "count": len(rows)})
+
+
+# Global embedding cache instance
+_embedding_cache = None
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create the global embedding cache instance"""
+    global _embedding_cache
+    
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache()
+    
+    return _embedding_cache
@@ -10,15 +10,27 @@ import openai
 from src.core.config import settings
 from src.core.logger import ai_logger
 from src.core.exceptions import EmbeddingError
+from src.models.embedding_cache import EmbeddingCache, get_embedding_cache, PRESEED_TERMS
 
 
 class EmbeddingModel:
     """Embedding model for generating vector representations"""
     
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, cache: Optional[EmbeddingCache] = None):
         self.model_name = model_name or "all-MiniLM-L6-v2"
         self.model = None
         self.embedding_dimension = 384  # Default for all-MiniLM-L6-v2
+        self.cache = cache  # Resolved lazily from settings when not given
+    
+    def _get_cache(self) -> Optional[EmbeddingCache]:
+        """Get the embedding cache, if caching is enabled"""
+        if self.cache is None and settings.enable_embedding_cache:
+            try:
+                self.cache = get_embedding_cache()
+            except Exception as e:
+                ai_logger.log_error(e, {"operation": "embedding_cache_init"})
+                return None
+        return self.cache
         
     async def initialize(self):
         """Initialize the embedding model"""
@@ -35,7 +47,7 @@ class EmbeddingModel:
                 )
                 self.embedding_dimension = self.model.get_sentence_embedding_dimension()
                 
-            ai_logger.logger.info(f"Initialized embedding model: {self.model_name}")
+            ai_logger.logger.info("Initialized embedding model: {}", self.model_name)
         except Exception as e:
             ai_logger.log_error(e, {"model_name": self.model_name})
             raise EmbeddingError(f"Failed to initialize embedding model: {str(e)}")
@@ -43,10 +55,20 @@ class EmbeddingModel:
     async def embed_text(self, text: str) -> List[float]:
         """Generate embedding for a single text"""
         try:
+            cache = self._get_cache()
+            if cache:
+                cached = await asyncio.to_thread(cache.get, text, self.model_name)
+                if cached is not None:
+                    return cached.tolist()
+            
             if self.model_name.startswith("text-embedding"):
-                return await self._embed_with_openai(text)
+                embedding = await self._embed_with_openai(text)
             else:
-                return await self._embed_with_sentence_transformer(text)
+                embedding = await self._embed_with_sentence_transformer(text)
+            
+            if cache:
+                await asyncio.to_thread(cache.put, text, self.model_name, embedding)
+            return embedding
         except Exception as e:
             ai_logger.log_error(e, {"text_length": len(text)})
             raise EmbeddingError(f"Failed to generate embedding: {str(e)}")
@@ -54,14 +76,32 @@ class EmbeddingModel:
     async def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts"""
         try:
-            if self.model_name.startswith("text-embedding"):
-                return await self._embed_batch_with_openai(texts)
-            else:
-                return await self._embed_batch_with_sentence_transformer(texts)
+            cache = self._get_cache()
+            if not cache:
+                return await self._embed_batch(texts)
+            
+            # Only the cache misses go to the model, in one batch
+            cached = await asyncio.to_thread(cache.get_many, texts, self.model_name)
+            embeddings = [vec.tolist() if vec is not None else None for vec in cached]
+            missing = [i for i, vec in enumerate(cached) if vec is None]
+            if missing:
+                missing_texts = [texts[i] for i in missing]
+                computed = await self._embed_batch(missing_texts)
+                await asyncio.to_thread(cache.put_many, missing_texts, self.model_name, computed)
+                for i, embedding in zip(missing, computed):
+                    embeddings[i] = embedding
+            
+            return embeddings
         except Exception as e:
             ai_logger.log_error(e, {"batch_size": len(texts)})
             raise EmbeddingError(f"Failed to generate batch embeddings: {str(e)}")
     
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate batch embeddings with the configured backend"""
+        if self.model_name.startswith("text-embedding"):
+            return await self._embed_batch_with_openai(texts)
+        return await self._embed_batch_with_sentence_transformer(texts)
+    
     async def _embed_with_openai(self, text: str) -> List[float]:
         """Generate embedding using OpenAI API"""
         client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
@@ -136,4 +176,17 @@ async def get_embedding_model(model_name: Optional[str] = None) -> EmbeddingMode
         _embedding_model = EmbeddingModel(model_name)
         await _embedding_model.initialize()
     
-    return _embedding_model
\ No newline at end of file
+    return _embedding_model
+
+
+async def preseed_embedding_cache(model_name: Optional[str] = None) -> None:
+    """Embed common industry/category terms so early lookups hit the cache"""
+    if not settings.enable_embedding_cache:
+        return
+    
+    try:
+        embedding_model = await get_embedding_model(model_name)
+        await embedding_model.embed_texts(list(PRESEED_TERMS))
+        ai_logger.logger.info("Preseeded embedding cache with {} terms", len(PRESEED_TERMS))
+    except Exception as e:
+        ai_logger.log_error(e, {"operation": "preseed_embedding_cache"})
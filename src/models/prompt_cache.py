@@ -0,0 +1,140 @@
+"""
+Semantic prompt-response cache for LLM calls
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import hashlib
+import json
+import numpy as np
+from cachetools import LRUCache
+
+from src.core.config import settings
+from src.core.logger import ai_logger
+
+
+class _EvictingLRUCache(LRUCache):
+    """LRUCache that reports evicted keys"""
+    
+    def __init__(self, maxsize: int, on_evict: Callable[[Any], None]):
+        super().__init__(maxsize)
+        self._on_evict = on_evict
+    
+    def popitem(self):
+        key, value = super().popitem()
+        self._on_evict(key)
+        return key, value
+
+
+class SemanticPromptCache:
+    """LLM responses keyed by prompt: exact hash hits first, then near-duplicate prompts by embedding"""
+    
+    def __init__(self, maxsize: Optional[int] = None, threshold: Optional[float] = None):
+        self.maxsize = maxsize or settings.prompt_cache_size
+        self.threshold = threshold if threshold is not None else settings.prompt_cache_similarity
+        self._responses = _EvictingLRUCache(self.maxsize, self._release_slot)
+        # Normalized prompt embeddings, one row per cached key; free rows are zero
+        self._vectors: Optional[np.ndarray] = None
+        self._slot_params = np.zeros(self.maxsize, dtype=np.int64)
+        self._slot_keys: List[Optional[bytes]] = [None] * self.maxsize
+        self._key_slots: Dict[bytes, int] = {}
+        self._free_slots = list(range(self.maxsize - 1, -1, -1))
+    
+    @staticmethod
+    def _params_digest(params: Dict[str, Any]) -> bytes:
+        """Digest of the generation parameters; only prompts with equal parameters may share a response"""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+    
+    @staticmethod
+    def _key(prompt: str, params_digest: bytes) -> bytes:
+        """Exact-match key for a prompt under the given parameters"""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16, key=params_digest).digest()
+    
+    def _release_slot(self, key: bytes) -> None:
+        """Free the embedding row of an evicted key"""
+        slot = self._key_slots.pop(key, None)
+        if slot is not None:
+            self._vectors[slot] = 0.0
+            self._slot_keys[slot] = None
+            self._free_slots.append(slot)
+    
+    def _store_vector(self, key: bytes, params_tag: int, vector: np.ndarray) -> None:
+        """Record a prompt embedding for fuzzy lookups"""
+        if self._vectors is None:
+            self._vectors = np.zeros((self.maxsize, len(vector)), dtype=np.float32)
+        if key in self._key_slots or not self._free_slots or len(vector) != self._vectors.shape[1]:
+            return
+        slot = self._free_slots.pop()
+        self._vectors[slot] = vector
+        self._slot_params[slot] = params_tag
+        self._slot_keys[slot] = key
+        self._key_slots[key] = slot
+    
+    def _nearest(self, params_tag: int, vector: np.ndarray) -> Optional[Any]:
+        """Cached response of the most similar prompt above the threshold, if any"""
+        if self._vectors is None or not self._key_slots or len(vector) != self._vectors.shape[1]:
+            return None
+        similarities = self._vectors @ vector
+        similarities[self._slot_params != params_tag] = -1.0
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return self._responses.get(self._slot_keys[best])
+    
+    async def get_or_compute(
+        self,
+        prompt: str,
+        params: Dict[str, Any],
+        factory: Callable[[], Awaitable[Any]],
+        embed: Optional[Callable[[str], Awaitable[List[float]]]] = None
+    ) -> Any:
+        """
+        Get a cached response for a prompt or compute and store it
+        
+        Args:
+            prompt: Prompt text
+            params: Generation parameters that must match for a cache hit
+            factory: Coroutine factory producing the response on a miss
+            embed: Optional prompt embedder enabling near-duplicate hits
+        
+        Returns:
+            Cached or freshly computed response
+        """
+        params_digest = self._params_digest(params)
+        key = self._key(prompt, params_digest)
+        cached = self._responses.get(key)
+        if cached is not None:
+            return cached
+        
+        vector = None
+        params_tag = int.from_bytes(params_digest, "little", signed=True)
+        if embed is not None:
+            try:
+                vector = np.asarray(await embed(prompt), dtype=np.float32)
+                norm = float(np.linalg.norm(vector))
+                vector = vector / norm if norm > 0 else None
+            except Exception as e:
+                ai_logger.log_error(e, {"operation": "prompt_cache_embed"})
+                vector = None
+            if vector is not None:
+                cached = self._nearest(params_tag, vector)
+                if cached is not None:
+                    return cached
+        
+        response = await factory()
+        self._responses[key] = response
+        if vector is not None:
+            self._store_vector(key, params_tag, vector)
+        return response
+
+
+# Global prompt cache instance
+_prompt_cache = None
+
+def get_prompt_cache() -> SemanticPromptCache:
+    """Get or create the global prompt cache instance"""
+    global _prompt_cache
+    
+    if _prompt_cache is None:
+        _prompt_cache = SemanticPromptCache()
+    
+    return _prompt_cache
@@ -3,6 +3,7 @@ Vector store implementations for similarity search
 """
 from typing import List, Dict, Any, Optional, Tuple
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import faiss
 import json
@@ -45,6 +46,10 @@ class VectorStore(ABC):
         """Search for similar documents"""
         pass
     
+    async def search_batch(self, query_embeddings: np.ndarray, k: int = 5) -> List[List[SearchResult]]:
+        """Search for several queries (one per row); stores with native batching override this"""
+        return [await self.search(query.tolist(), k) for query in query_embeddings]
+    
     @abstractmethod
     async def delete_document(self, doc_id: str) -> bool:
         """Delete a document by ID"""
@@ -56,11 +61,74 @@ class VectorStore(ABC):
         pass
 
 
+# FAISS releases the GIL while searching, so searches run in parallel on a pool of
+# their own instead of queueing behind embedding and file I/O in the default executor
+_search_executor: Optional[ThreadPoolExecutor] = None
+
+
+async def _run_search(index: "faiss.Index", query_vecs: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Run index.search on the bounded search pool"""
+    global _search_executor
+    if _search_executor is None:
+        _search_executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.vector_search_workers), thread_name_prefix="faiss-search"
+        )
+    return await asyncio.get_running_loop().run_in_executor(_search_executor, index.search, query_vecs, k)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length in one pass; zero rows stay zero"""
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+
+
+def _build_faiss_index(dimension: int, quantization: str) -> "faiss.Index":
+    """Inner-product index storing vectors as float32, float16 or 8-bit codes"""
+    if quantization == "fp16":
+        return faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT)
+    if quantization == "sq8":
+        index = faiss.IndexScalarQuantizer(
+            dimension, faiss.ScalarQuantizer.QT_8bit_uniform, faiss.METRIC_INNER_PRODUCT
+        )
+        # Stored vectors are unit length, so every component lies in [-1, 1]
+        bounds = np.vstack([-np.ones(dimension, dtype=np.float32), np.ones(dimension, dtype=np.float32)])
+        index.train(bounds)
+        return index
+    return faiss.IndexFlatIP(dimension)
+
+
+def _index_quantization(index: "faiss.Index") -> Optional[str]:
+    """VECTOR_QUANTIZATION name of a flat index's storage; None for other index types"""
+    if isinstance(index, faiss.IndexScalarQuantizer):
+        return {
+            faiss.ScalarQuantizer.QT_fp16: "fp16",
+            faiss.ScalarQuantizer.QT_8bit_uniform: "sq8"
+        }.get(index.sq.qtype)
+    if isinstance(index, faiss.IndexFlat):
+        return "none"
+    return None
+
+
+def _build_ivfpq_index(vectors: np.ndarray, nprobe: int) -> "faiss.Index":
+    """Approximate IVF-PQ inner-product index trained on and filled with the given unit vectors"""
+    count, dimension = vectors.shape
+    nlist = min(4096, max(1, int(4 * np.sqrt(count))))
+    # PQ sub-quantizers must split the dimension evenly
+    subquantizers = max(m for m in range(1, min(64, dimension) + 1) if dimension % m == 0)
+    index = faiss.index_factory(dimension, f"IVF{nlist},PQ{subquantizers}", faiss.METRIC_INNER_PRODUCT)
+    sample_size = min(count, nlist * 64)
+    sample = vectors[np.random.default_rng(0).choice(count, sample_size, replace=False)] if sample_size < count else vectors
+    index.train(sample)
+    index.add(vectors)
+    index.nprobe = nprobe
+    return index
+
+
 class FAISSVectorStore(VectorStore):
     """FAISS-based vector store implementation"""
     
-    def __init__(self, dimension: int = 384, index_path: Optional[str] = None):
+    def __init__(self, dimension: int = 384, index_path: Optional[str] = None, quantization: Optional[str] = None):
         self.dimension = dimension
+        self.quantization = quantization or settings.vector_quantization
         self.index_path = index_path or "faiss_index"
         self.index = None
         self.documents: Dict[int, Document] = {}
@@ -71,13 +139,18 @@ class FAISSVectorStore(VectorStore):
         """Initialize the FAISS index"""
         try:
             # Create FAISS index
-            self.index = faiss.IndexFlatIP(self.dimension)  # Inner product (cosine similarity)
+            self.index = _build_faiss_index(self.dimension, self.quantization)  # Inner product (cosine similarity)
             
             # Try to load existing index
             if os.path.exists(f"{self.index_path}.index"):
                 await self._load_index()
+                rebuilt = await self._maybe_reencode_index()
+                if await self._maybe_upgrade_index() or rebuilt:
+                    await self._save_index()
             
-            ai_logger.logger.info(f"Initialized FAISS vector store with dimension {self.dimension}")
+            ai_logger.logger.info(
+                "Initialized FAISS vector store with dimension {} ({} storage)", self.dimension, self.quantization
+            )
         except Exception as e:
             ai_logger.log_error(e, {"dimension": self.dimension})
             raise VectorDatabaseError(f"Failed to initialize FAISS index: {str(e)}")
@@ -88,16 +161,14 @@ class FAISSVectorStore(VectorStore):
             await self.initialize()
         
         try:
-            embeddings = []
             for doc in documents:
                 if doc.embedding is None:
                     raise VectorDatabaseError(f"Document {doc.id} has no embedding")
-                
-                # Normalize embedding for cosine similarity
-                embedding = np.array(doc.embedding, dtype=np.float32)
-                embedding = embedding / np.linalg.norm(embedding)
-                embeddings.append(embedding)
-                
+            
+            # Normalize once at insertion so inner product equals cosine similarity
+            embeddings_array = _normalize_rows(np.array([doc.embedding for doc in documents], dtype=np.float32))
+            
+            for doc in documents:
                 # Store document with internal ID
                 internal_id = self.next_id
                 self.documents[internal_id] = doc
@@ -105,10 +176,10 @@ class FAISSVectorStore(VectorStore):
                 self.next_id += 1
             
             # Add to FAISS index
-            embeddings_array = np.vstack(embeddings)
             await asyncio.to_thread(self.index.add, embeddings_array)
             
-            ai_logger.logger.info(f"Added {len(documents)} documents to vector store")
+            ai_logger.logger.info("Added {} documents to vector store", len(documents))
+            await self._maybe_upgrade_index()
             
             # Save index if path is specified
             if self.index_path:
@@ -123,15 +194,16 @@ class FAISSVectorStore(VectorStore):
         if not self.index:
             await self.initialize()
         
+        # FAISS rejects k=0, and an empty index has nothing to return anyway
+        if self.index.ntotal == 0:
+            return []
+        
         try:
             # Normalize query embedding
-            query_vec = np.array(query_embedding, dtype=np.float32).reshape(1, -1)
-            query_vec = query_vec / np.linalg.norm(query_vec)
+            query_vec = _normalize_rows(np.array(query_embedding, dtype=np.float32).reshape(1, -1))
             
             # Search in FAISS
-            scores, indices = await asyncio.to_thread(
-                self.index.search, query_vec, min(k, self.index.ntotal)
-            )
+            scores, indices = await _run_search(self.index, query_vec, min(k, self.index.ntotal))
             
             # Convert results
             results = []
@@ -148,6 +220,78 @@ class FAISSVectorStore(VectorStore):
             ai_logger.log_error(e, {"k": k})
             raise VectorDatabaseError(f"Failed to search: {str(e)}")
     
+    async def search_batch(self, query_embeddings: np.ndarray, k: int = 5) -> List[List[SearchResult]]:
+        """Search for several queries in one FAISS call, which parallelizes across them"""
+        if not self.index:
+            await self.initialize()
+        
+        if self.index.ntotal == 0:
+            return [[] for _ in range(len(query_embeddings))]
+        
+        try:
+            query_vecs = _normalize_rows(np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1))
+            scores, indices = await _run_search(self.index, query_vecs, min(k, self.index.ntotal))
+            
+            return [
+                [
+                    SearchResult(document=self.documents[idx], score=float(score))
+                    for score, idx in zip(row_scores, row_indices)
+                    if idx != -1 and idx in self.documents
+                ]
+                for row_scores, row_indices in zip(scores.tolist(), indices.tolist())
+            ]
+            
+        except Exception as e:
+            ai_logger.log_error(e, {"k": k, "queries": len(query_embeddings)})
+            raise VectorDatabaseError(f"Failed to search: {str(e)}")
+    
+    async def _maybe_reencode_index(self) -> bool:
+        """Rebuild a loaded flat index whose storage differs from vector_quantization; True if rebuilt"""
+        loaded = _index_quantization(self.index)
+        configured = self.quantization if self.quantization in ("fp16", "sq8") else "none"
+        if loaded is None or loaded == configured:
+            return False
+        if len(self.documents) != self.index.ntotal:
+            ai_logger.logger.warning(
+                "Loaded FAISS index uses {} storage, not the configured {}; "
+                "its metadata does not cover every vector, so it is kept as is",
+                loaded, configured
+            )
+            return False
+        
+        index = _build_faiss_index(self.dimension, configured)
+        if self.index.ntotal:
+            # Internal ids are assigned sequentially and never reused, so row i is document i
+            vectors = _normalize_rows(np.array(
+                [self.documents[i].embedding for i in range(self.index.ntotal)], dtype=np.float32
+            ))
+            await asyncio.to_thread(index.add, vectors)
+        self.index = index
+        ai_logger.logger.warning("Re-encoded loaded FAISS index from {} to {} storage", loaded, configured)
+        return True
+    
+    async def _maybe_upgrade_index(self) -> bool:
+        """Rebuild an exact index as IVF-PQ once the corpus outgrows exact search; True if rebuilt"""
+        if isinstance(self.index, faiss.IndexIVF):
+            self.index.nprobe = settings.faiss_ivf_nprobe
+            return False
+        if self.index.ntotal <= settings.faiss_ivf_threshold:
+            return False
+        if len(self.documents) != self.index.ntotal:
+            ai_logger.logger.warning(
+                "FAISS index has {} vectors but metadata for {} documents; keeping the exact index",
+                self.index.ntotal, len(self.documents)
+            )
+            return False
+        
+        # Internal ids are assigned sequentially and never reused, so row i is document i
+        vectors = _normalize_rows(np.array(
+            [self.documents[i].embedding for i in range(self.index.ntotal)], dtype=np.float32
+        ))
+        self.index = await asyncio.to_thread(_build_ivfpq_index, vectors, settings.faiss_ivf_nprobe)
+        ai_logger.logger.info("Rebuilt FAISS index as IVF-PQ over {} documents", self.index.ntotal)
+        return True
+    
     async def delete_document(self, doc_id: str) -> bool:
         """Delete a document by ID (not supported in basic FAISS)"""
         # Note: FAISS doesn't support deletion easily
@@ -213,7 +357,7 @@ class FAISSVectorStore(VectorStore):
                 self.next_id = metadata["next_id"]
                 self.dimension = metadata["dimension"]
             
-            ai_logger.logger.info(f"Loaded FAISS index with {self.index.ntotal} documents")
+            ai_logger.logger.info("Loaded FAISS index with {} documents", self.index.ntotal)
             
         except Exception as e:
             ai_logger.log_error(e, {"index_path": self.index_path})
@@ -267,20 +411,27 @@ class InMemoryVectorStore(VectorStore):
 
 # Global vector store instance
 _vector_store = None
+# Serializes first-time initialization so concurrent callers share one instance
+_vector_store_lock = asyncio.Lock()
 
 async def get_vector_store(store_type: str = "faiss", **kwargs) -> VectorStore:
     """Get or create the global vector store instance"""
     global _vector_store
     
-    if _vector_store is None:
-        if store_type == "faiss":
-            embedding_model = await get_embedding_model()
-            dimension = embedding_model.get_dimension()
-            _vector_store = FAISSVectorStore(dimension=dimension, **kwargs)
-            await _vector_store.initialize()
-        elif store_type == "memory":
-            _vector_store = InMemoryVectorStore()
-        else:
-            raise VectorDatabaseError(f"Unsupported vector store type: {store_type}")
+    if _vector_store is not None:
+        return _vector_store
+    
+    async with _vector_store_lock:
+        if _vector_store is None:
+            if store_type == "faiss":
+                embedding_model = await get_embedding_model()
+                dimension = embedding_model.get_dimension()
+                vector_store = FAISSVectorStore(dimension=dimension, **kwargs)
+                await vector_store.initialize()
+                _vector_store = vector_store
+            elif store_type == "memory":
+                _vector_store = InMemoryVectorStore()
+            else:
+                raise VectorDatabaseError(f"Unsupported vector store type: {store_type}")
     
     return _vector_store
\ No newline at end of file
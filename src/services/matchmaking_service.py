@@ -2,14 +2,160 @@
 Matchmaking Service for Brand-Creator Matching
 """
 import asyncio
+import heapq
 import time
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import weakref
+from statistics import fmean
+from typing import List, Dict, Any, Optional, Tuple, Callable, AsyncIterator, Sequence, Iterable
+from dataclasses import dataclass, field
 import numpy as np
+import faiss
+from cachetools import TTLCache
+
+# Optional SimSIMD import for vectorized cosine kernels
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    simsimd = None
+    SIMSIMD_AVAILABLE = False
+
+from src.core.config import settings
 from src.core.logger import ai_logger
 from src.core.exceptions import MatchmakingError, InsufficientDataError
 from src.services.rag_service import RAGService
 from src.services.nlp_utils import NLPService
+from src.utils.constants import CONTENT_CATEGORIES
+
+
+# Weights for the seven compatibility components, in CompatibilityScore field
+# order: audience, content style, platform reach, engagement, budget, brand
+# values, collaboration history
+_COMPONENT_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.15, 0.10, 0.10, 0.05], dtype=np.float32)
+
+# Number of creators shortlisted by candidate generation before full scoring
+_SHORTLIST_SIZE = 200
+
+# Creators scored per streamed batch; keeps each batch's columns cache-resident
+_CREATOR_BATCH_SIZE = 128
+
+# Size of the mock creator database
+_MOCK_CREATOR_COUNT = 50
+
+# Below this many creators an exact int8 scan beats building an HNSW graph
+_HNSW_MIN_SIZE = 10000
+
+# Profile caches shared by all service instances (one is created per request)
+_brand_profile_cache = TTLCache(maxsize=settings.cache_max_size, ttl=settings.profile_cache_ttl)
+_creator_profile_cache = TTLCache(maxsize=settings.cache_max_size, ttl=settings.profile_cache_ttl)
+# Per-key locks so concurrent misses on the same profile trigger a single fetch
+_profile_fetch_locks: "weakref.WeakValueDictionary[Tuple[str, str], asyncio.Lock]" = weakref.WeakValueDictionary()
+# Candidate generator over the whole creator pool, shared by all service instances and
+# rebuilt on expiry so new creators become retrievable
+_candidate_generator_cache = TTLCache(maxsize=1, ttl=settings.profile_cache_ttl)
+
+# One bit per content category: the known ones, then unseen ones appended on first use.
+# Once every bit but the last is taken, further unseen categories share that last bit,
+# so the vocabulary stays bounded and masks always fit in uint64
+_OTHER_CATEGORY_BIT = 63
+_CATEGORY_ID: Dict[str, int] = {name: i for i, name in enumerate(CONTENT_CATEGORIES.values())}
+
+
+def _category_mask(categories: Iterable[str]) -> int:
+    """Pack a collection of categories into an int bitmask"""
+    mask = 0
+    for category in categories:
+        bit = _CATEGORY_ID.get(category)
+        if bit is None:
+            if len(_CATEGORY_ID) < _OTHER_CATEGORY_BIT:
+                bit = _CATEGORY_ID.setdefault(category, len(_CATEGORY_ID))
+            else:
+                bit = _OTHER_CATEGORY_BIT
+        mask |= 1 << bit
+    return mask
+
+
+def _pack_category_masks(masks: List[int]) -> np.ndarray:
+    """Pack bitmasks into a uint64 array"""
+    return np.array(masks, dtype=np.uint64)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Count set bits per mask"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks).astype(np.int32)
+    return np.fromiter((int(mask).bit_count() for mask in masks), dtype=np.int32, count=len(masks))
+
+
+def _cosine_similarities(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarity between one query vector and every row of a matrix"""
+    if SIMSIMD_AVAILABLE and simsimd:
+        # SimSIMD returns cosine distances; one call covers the whole matrix
+        distances = np.asarray(simsimd.cdist(query[np.newaxis, :], matrix, metric="cosine"))
+        return (1.0 - distances.reshape(-1)).astype(np.float32)
+    
+    # Fallback: plain matrix-vector product on normalized float32 vectors
+    query = query.astype(np.float32)
+    matrix = matrix.astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return np.divide(matrix @ query, norms, out=np.zeros(len(matrix), dtype=np.float32), where=norms > 0)
+
+
+def _quantize_embeddings(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize embedding rows to int8 with a per-row scale"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    max_abs = np.abs(matrix).max(axis=1)
+    scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+    quantized = np.clip(np.rint(matrix / scales[:, np.newaxis]), -127, 127).astype(np.int8)
+    return quantized, scales
+
+
+def _approximate_cosine_int8(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Approximate cosine similarity over int8-quantized embeddings"""
+    # Per-row scales cancel out under cosine, so the int8 codes are enough
+    if SIMSIMD_AVAILABLE and simsimd:
+        distances = np.asarray(simsimd.cdist(query[np.newaxis, :], matrix, metric="cosine"))
+        return 1.0 - distances.reshape(-1)
+    
+    query = query.astype(np.int32)
+    matrix = matrix.astype(np.int32)
+    norms = np.sqrt((matrix * matrix).sum(axis=1) * float(query @ query))
+    return np.divide(matrix @ query, norms, out=np.zeros(len(matrix)), where=norms > 0)
+
+
+class CandidateGenerator:
+    """Candidate generation over the creator embedding table (retrieve stage)"""
+    
+    def __init__(self, embeddings: np.ndarray, hnsw_neighbors: int = 32):
+        self.size = len(embeddings)
+        self.index = None
+        self.codes = None
+        
+        if self.size >= _HNSW_MIN_SIZE:
+            # Approximate nearest neighbours; inner product on normalized vectors is cosine
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+            faiss.normalize_L2(vectors)
+            self.index = faiss.IndexHNSWFlat(vectors.shape[1], hnsw_neighbors, faiss.METRIC_INNER_PRODUCT)
+            self.index.add(vectors)
+        else:
+            self.codes, _ = _quantize_embeddings(embeddings)
+    
+    def search(self, query: List[float], top_k: int) -> np.ndarray:
+        """Return indices of the top_k creators closest to the query embedding"""
+        top_k = min(top_k, self.size)
+        if top_k <= 0:
+            return np.empty(0, dtype=np.int64)
+        
+        if self.index is not None:
+            query_vec = np.asarray(query, dtype=np.float32).reshape(1, -1).copy()
+            faiss.normalize_L2(query_vec)
+            _, indices = self.index.search(query_vec, top_k)
+            return indices[0][indices[0] >= 0]
+        
+        query_codes, _ = _quantize_embeddings([query])
+        similarities = _approximate_cosine_int8(query_codes[0], self.codes)
+        # argpartition avoids a full sort of the candidate pool
+        return np.argpartition(-similarities, top_k - 1)[:top_k]
 
 
 @dataclass
@@ -25,6 +171,7 @@ class BrandProfile:
     brand_values: List[str]
     preferred_content_types: List[str]
     social_media_presence: Dict[str, Any]
+    embedding: Optional[List[float]] = None
 
 
 @dataclass
@@ -41,6 +188,111 @@ class CreatorProfile:
     collaboration_history: List[Dict[str, Any]]
     availability: str
     rates: Dict[str, float]
+    embedding: Optional[List[float]] = None
+    # Derived once at construction so scorers don't rebuild them per comparison
+    content_categories_set: frozenset = field(init=False, repr=False, compare=False)
+    platforms_set: frozenset = field(init=False, repr=False, compare=False)
+    category_mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.content_categories_set = frozenset(self.content_categories)
+        self.platforms_set = frozenset(self.platforms)
+        self.category_mask = _category_mask(self.content_categories_set)
+
+
+@dataclass
+class CreatorTable:
+    """Column-oriented creator pool: one row per creator, one array per field"""
+    creator_ids: List[str]
+    usernames: List[str]
+    platform_names: Tuple[str, ...]  # Column order of the per-platform matrices
+    follower_count: np.ndarray       # N x P float64, NaN where the platform is absent
+    engagement_rate: np.ndarray      # N x P float64, NaN where absent
+    rates: np.ndarray                # N x P float64, NaN where absent
+    category_masks: np.ndarray       # N content-category bitmasks (see _CATEGORY_ID)
+    platforms: List[List[str]]
+    content_categories: List[List[str]]
+    audience_demographics: List[Dict[str, Any]]
+    content_styles: List[str]
+    collaboration_history: List[List[Dict[str, Any]]]
+    availability: List[str]
+    embeddings: Optional[np.ndarray] = None  # N x D float16, when every row has one
+    
+    def __len__(self) -> int:
+        return len(self.creator_ids)
+    
+    @classmethod
+    def from_profiles(cls, profiles: List[CreatorProfile]) -> "CreatorTable":
+        """Build a table from row-oriented creator profiles"""
+        platform_names = tuple(dict.fromkeys(
+            platform
+            for profile in profiles
+            for metrics in (profile.follower_count, profile.engagement_rate, profile.rates)
+            for platform in metrics
+        ))
+        platform_index = {name: j for j, name in enumerate(platform_names)}
+        
+        n, p = len(profiles), len(platform_names)
+        follower_count = np.full((n, p), np.nan, dtype=np.float64)
+        engagement_rate = np.full((n, p), np.nan, dtype=np.float64)
+        rates = np.full((n, p), np.nan, dtype=np.float64)
+        
+        for i, profile in enumerate(profiles):
+            for platform, value in profile.follower_count.items():
+                follower_count[i, platform_index[platform]] = value
+            for platform, value in profile.engagement_rate.items():
+                engagement_rate[i, platform_index[platform]] = value
+            for platform, value in profile.rates.items():
+                rates[i, platform_index[platform]] = value
+        category_masks = _pack_category_masks([profile.category_mask for profile in profiles])
+        
+        embeddings = None
+        if profiles and all(profile.embedding for profile in profiles):
+            # Contiguous float16 matrix halves memory traffic for the cosine kernel
+            embeddings = np.ascontiguousarray(
+                [profile.embedding for profile in profiles], dtype=np.float16
+            )
+        
+        return cls(
+            creator_ids=[profile.creator_id for profile in profiles],
+            usernames=[profile.username for profile in profiles],
+            platform_names=platform_names,
+            follower_count=follower_count,
+            engagement_rate=engagement_rate,
+            rates=rates,
+            category_masks=category_masks,
+            platforms=[profile.platforms for profile in profiles],
+            content_categories=[profile.content_categories for profile in profiles],
+            audience_demographics=[profile.audience_demographics for profile in profiles],
+            content_styles=[profile.content_style for profile in profiles],
+            collaboration_history=[profile.collaboration_history for profile in profiles],
+            availability=[profile.availability for profile in profiles],
+            embeddings=embeddings
+        )
+    
+    def to_profile(self, idx: int) -> CreatorProfile:
+        """Reconstruct the row-oriented profile for one creator"""
+        def row_dict(matrix: np.ndarray, cast) -> Dict[str, Any]:
+            return {
+                platform: cast(value)
+                for platform, value in zip(self.platform_names, matrix[idx])
+                if not np.isnan(value)
+            }
+        
+        return CreatorProfile(
+            creator_id=self.creator_ids[idx],
+            username=self.usernames[idx],
+            platforms=self.platforms[idx],
+            follower_count=row_dict(self.follower_count, int),
+            engagement_rate=row_dict(self.engagement_rate, float),
+            content_categories=self.content_categories[idx],
+            audience_demographics=self.audience_demographics[idx],
+            content_style=self.content_styles[idx],
+            collaboration_history=self.collaboration_history[idx],
+            availability=self.availability[idx],
+            rates=row_dict(self.rates, float),
+            embedding=self.embeddings[idx].astype(np.float32).tolist() if self.embeddings is not None else None
+        )
 
 
 @dataclass
@@ -59,11 +311,14 @@ class CompatibilityScore:
 class MatchmakingService:
     """Service for brand-creator matchmaking"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.rag_service = RAGService()
         self.nlp_service = NLPService()
         self.creator_database = {}  # In production, this would be a real database
         self.brand_database = {}    # In production, this would be a real database
+        # Per-instance generator; pass a seed for reproducible scores in tests
+        self._rng = np.random.default_rng(seed)
+        self._candidate_generator: Optional[CandidateGenerator] = None
         
     async def find_compatible_creators(
         self,
@@ -96,65 +351,58 @@ class MatchmakingService:
                 min_score=min_compatibility_score
             )
             
-            # Get potential creators from database
-            potential_creators = await self._get_potential_creators(
+            # Retrieve: shortlist candidates on embeddings when an index exists
+            candidate_indices = await self._shortlist(brand_profile, top=_SHORTLIST_SIZE)
+            
+            # Rank: full scorer, specialized once for this brand, runs only on the retrieved candidates
+            scorer = self._make_scorer(brand_profile, budget_constraints)
+            
+            # Stream candidate batches through the scorer, keeping only the best
+            # max_matches in a min-heap of (score, -arrival order, profile, score detail)
+            top_matches: List[Tuple[float, int, CreatorProfile, CompatibilityScore]] = []
+            evaluated = 0
+            compatible_count = 0
+            async for creator_batch in self._iter_potential_creators(
                 platforms=platforms,
-                criteria=creator_criteria
-            )
+                criteria=creator_criteria,
+                candidate_indices=candidate_indices
+            ):
+                for idx, compatibility_score in enumerate(scorer(creator_batch)):
+                    overall_score = compatibility_score.overall_score
+                    if overall_score < min_compatibility_score:
+                        continue
+                    compatible_count += 1
+                    
+                    # Earlier creators win ties, as with a stable sort
+                    key = (overall_score, -(evaluated + idx))
+                    if len(top_matches) < max_matches:
+                        heapq.heappush(top_matches, (*key, creator_batch.to_profile(idx), compatibility_score))
+                    elif key > top_matches[0][:2]:
+                        heapq.heapreplace(top_matches, (*key, creator_batch.to_profile(idx), compatibility_score))
+                evaluated += len(creator_batch)
             
-            if not potential_creators:
+            if not evaluated:
                 raise InsufficientDataError("No creators found matching criteria")
             
-            # Calculate compatibility scores
-            matches = []
-            for creator in potential_creators:
-                compatibility_score = await self._calculate_compatibility(
-                    brand_profile, creator, budget_constraints
-                )
-                
-                if compatibility_score.overall_score >= min_compatibility_score:
-                    match_reasons = await self._generate_match_reasons(
-                        brand_profile, creator, compatibility_score
-                    )
-                    
-                    potential_campaign_ideas = await self._generate_campaign_ideas(
-                        brand_profile, creator
-                    )
-                    
-                    estimated_performance = await self._estimate_performance(
-                        brand_profile, creator, compatibility_score
-                    )
-                    
-                    recommended_budget = await self._calculate_recommended_budget(
-                        brand_profile, creator, budget_constraints
-                    )
-                    
-                    risk_assessment = await self._assess_collaboration_risk(
-                        brand_profile, creator, compatibility_score
-                    )
-                    
-                    matches.append({
-                        "creator_profile": creator,
-                        "compatibility_score": compatibility_score,
-                        "match_reasons": match_reasons,
-                        "potential_campaign_ideas": potential_campaign_ideas,
-                        "estimated_performance": estimated_performance,
-                        "recommended_budget": recommended_budget,
-                        "risk_assessment": risk_assessment
-                    })
-            
-            # Sort by compatibility score and return top matches
-            matches.sort(key=lambda x: x["compatibility_score"].overall_score, reverse=True)
+            total_candidates = (
+                self._candidate_generator.size if candidate_indices is not None
+                else evaluated
+            )
+            
+            matches = [
+                self._build_match_result(brand_profile, creator, compatibility_score, budget_constraints)
+                for _, _, creator, compatibility_score in sorted(top_matches, key=lambda m: m[:2], reverse=True)
+            ]
             
             ai_logger.logger.info(
                 "Matchmaking completed",
                 brand_id=brand_profile.brand_id,
-                total_candidates=len(potential_creators),
-                compatible_matches=len(matches),
+                total_candidates=total_candidates,
+                compatible_matches=compatible_count,
                 top_score=matches[0]["compatibility_score"].overall_score if matches else 0
             )
             
-            return matches[:max_matches]
+            return matches
             
         except Exception as e:
             ai_logger.log_error(e, {
@@ -267,17 +515,34 @@ class MatchmakingService:
             })
             raise MatchmakingError(f"Failed to get trending creators: {str(e)}")
     
-    async def _get_potential_creators(
+    async def _iter_potential_creators(
         self,
         platforms: Optional[List[str]] = None,
-        criteria: Optional[Dict[str, Any]] = None
-    ) -> List[CreatorProfile]:
-        """Get potential creators from database"""
-        # In production, this would query a real database
+        criteria: Optional[Dict[str, Any]] = None,
+        candidate_indices: Optional[np.ndarray] = None,
+        batch_size: int = _CREATOR_BATCH_SIZE
+    ) -> AsyncIterator[CreatorTable]:
+        """Yield potential creators in CreatorTable batches, optionally restricted to candidate rows"""
+        rows = candidate_indices if candidate_indices is not None else range(self._creator_pool_size())
+        for start in range(0, len(rows), batch_size):
+            creator_batch = await self._fetch_creator_batch(rows[start:start + batch_size])
+            if len(creator_batch):
+                yield creator_batch
+    
+    def _creator_pool_size(self) -> int:
+        """Number of rows in the creator database"""
+        # In production, this would be a count query
+        return _MOCK_CREATOR_COUNT
+    
+    async def _fetch_creator_batch(self, rows: Sequence[int]) -> CreatorTable:
+        """Get one batch of creators from database by row"""
+        # In production, this would be one paged database query
         # For now, return mock data
         creators = []
         
-        for i in range(50):  # Mock 50 creators
+        for i in rows:
+            if not 0 <= i < _MOCK_CREATOR_COUNT:
+                continue
             creator = CreatorProfile(
                 creator_id=f"creator_{i+1}",
                 username=f"creator_{i+1}",
@@ -293,7 +558,42 @@ class MatchmakingService:
             )
             creators.append(creator)
         
-        return creators
+        return CreatorTable.from_profiles(creators)
+    
+    async def _load_creator_embeddings(self) -> Optional[np.ndarray]:
+        """Embedding table aligned with the creator database rows, or None unless every creator has one"""
+        chunks = []
+        async for creator_batch in self._iter_potential_creators():
+            if creator_batch.embeddings is None:
+                return None
+            chunks.append(creator_batch.embeddings)
+        return np.concatenate(chunks) if chunks else None
+    
+    async def _build_candidate_generator(self, _key: str) -> Optional[CandidateGenerator]:
+        """Build a candidate generator over the creator embedding table"""
+        embeddings = await self._load_creator_embeddings()
+        return CandidateGenerator(embeddings) if embeddings is not None else None
+    
+    async def _get_candidate_generator(self) -> Optional[CandidateGenerator]:
+        """Get the shared candidate generator, building it on first use"""
+        if self._candidate_generator is None:
+            self._candidate_generator = await self._get_cached_profile(
+                _candidate_generator_cache, "candidates", "creators", self._build_candidate_generator
+            )
+        return self._candidate_generator
+    
+    async def _shortlist(self, brand_profile: BrandProfile, top: int = _SHORTLIST_SIZE) -> Optional[np.ndarray]:
+        """Return indices of the creators worth fully scoring, or None to score all"""
+        brand_embedding = getattr(brand_profile, "embedding", None)
+        # Small pools are cheaper to score in full than to index
+        if not brand_embedding or self._creator_pool_size() <= top:
+            return None
+        
+        generator = await self._get_candidate_generator()
+        if generator is None:
+            return None
+        
+        return generator.search(brand_embedding, top)
     
     async def _calculate_compatibility(
         self,
@@ -302,129 +602,191 @@ class MatchmakingService:
         budget_constraints: Optional[Dict[str, Any]] = None
     ) -> CompatibilityScore:
         """Calculate compatibility score between brand and creator"""
+        return self._calculate_compatibility_batch(
+            brand_profile, CreatorTable.from_profiles([creator_profile]), budget_constraints
+        )[0]
+    
+    def _calculate_compatibility_batch(
+        self,
+        brand_profile: BrandProfile,
+        creators: CreatorTable,
+        budget_constraints: Optional[Dict[str, Any]] = None
+    ) -> List[CompatibilityScore]:
+        """Calculate compatibility scores between a brand and a table of creators"""
+        return self._make_scorer(brand_profile, budget_constraints)(creators)
+    
+    def _make_scorer(
+        self,
+        brand_profile: BrandProfile,
+        budget_constraints: Optional[Dict[str, Any]] = None
+    ) -> Callable[[CreatorTable], List[CompatibilityScore]]:
+        """Specialize the compatibility scorer for one brand"""
+        # Brand-side inputs are constant for the whole request; resolve them once
+        target_audience = brand_profile.target_audience
+        brand_mask = _category_mask(brand_profile.content_preferences)
+        social_media_presence = brand_profile.social_media_presence
+        budget_range = brand_profile.budget_range
+        brand_values = brand_profile.brand_values
+        brand_embedding = getattr(brand_profile, "embedding", None)
+        brand_vector = np.asarray(brand_embedding, dtype=np.float16) if brand_embedding else None
         
-        # Audience alignment (0-1)
-        audience_alignment = self._calculate_audience_alignment(
-            brand_profile.target_audience, creator_profile.audience_demographics
-        )
-        
-        # Content style match (0-1)
-        content_style_match = self._calculate_content_style_match(
-            brand_profile.content_preferences, creator_profile.content_categories
-        )
-        
-        # Platform reach (0-1)
-        platform_reach = self._calculate_platform_reach(
-            brand_profile.social_media_presence, creator_profile.platforms
-        )
-        
-        # Engagement potential (0-1)
-        engagement_potential = self._calculate_engagement_potential(
-            creator_profile.engagement_rate
-        )
-        
-        # Budget fit (0-1)
-        budget_fit = self._calculate_budget_fit(
-            brand_profile.budget_range, creator_profile.rates, budget_constraints
-        )
-        
-        # Brand values alignment (0-1)
-        brand_values_alignment = self._calculate_brand_values_alignment(
-            brand_profile.brand_values, creator_profile.content_categories
-        )
-        
-        # Collaboration history score (0-1)
-        collaboration_history_score = self._calculate_collaboration_history_score(
-            creator_profile.collaboration_history
-        )
-        
-        # Calculate overall score (weighted average)
-        weights = {
-            "audience_alignment": 0.25,
-            "content_style_match": 0.20,
-            "platform_reach": 0.15,
-            "engagement_potential": 0.15,
-            "budget_fit": 0.10,
-            "brand_values_alignment": 0.10,
-            "collaboration_history_score": 0.05
-        }
-        
-        overall_score = (
-            audience_alignment * weights["audience_alignment"] +
-            content_style_match * weights["content_style_match"] +
-            platform_reach * weights["platform_reach"] +
-            engagement_potential * weights["engagement_potential"] +
-            budget_fit * weights["budget_fit"] +
-            brand_values_alignment * weights["brand_values_alignment"] +
-            collaboration_history_score * weights["collaboration_history_score"]
-        )
+        def scorer(creators: CreatorTable) -> List[CompatibilityScore]:
+            n = len(creators)
+            
+            # Draw the jitter for all four stub scorers in one call instead of
+            # going through the legacy global RNG once per (brand, creator) pair
+            noise = self._rng.random((n, 4), dtype=np.float32)
+            
+            # Semantic similarity, only when both sides carry embeddings
+            semantic_similarity = None
+            if brand_vector is not None and creators.embeddings is not None:
+                semantic_similarity = _cosine_similarities(brand_vector, creators.embeddings)
+            
+            # Audience alignment (0-1)
+            audience_alignment = self._calculate_audience_alignment(
+                target_audience,
+                creators.audience_demographics,
+                noise[:, 0],
+                semantic_similarity
+            )
+            
+            # Content style match (0-1)
+            content_style_match = self._calculate_content_style_match(
+                brand_mask,
+                creators.category_masks
+            )
+            
+            # Platform reach (0-1)
+            platform_reach = self._calculate_platform_reach(
+                social_media_presence,
+                creators.platforms,
+                noise[:, 1]
+            )
+            
+            # Engagement potential (0-1)
+            engagement_potential = self._calculate_engagement_potential(
+                creators.engagement_rate
+            )
+            
+            # Budget fit (0-1)
+            budget_fit = self._calculate_budget_fit(
+                budget_range,
+                creators.rates,
+                noise[:, 2],
+                budget_constraints
+            )
+            
+            # Brand values alignment (0-1)
+            brand_values_alignment = self._calculate_brand_values_alignment(
+                brand_values,
+                creators.content_categories,
+                noise[:, 3]
+            )
+            
+            # Collaboration history score (0-1)
+            collaboration_history_score = np.array([
+                self._calculate_collaboration_history_score(history)
+                for history in creators.collaboration_history
+            ], dtype=np.float32)
+            
+            # Calculate overall score (weighted average) as one matrix-vector product
+            component_matrix = np.column_stack([
+                audience_alignment,
+                content_style_match,
+                platform_reach,
+                engagement_potential,
+                budget_fit,
+                brand_values_alignment,
+                collaboration_history_score
+            ]).astype(np.float32, copy=False)
+            overall_score = component_matrix @ _COMPONENT_WEIGHTS
+            
+            return [
+                CompatibilityScore(
+                    overall_score=float(overall_score[i]),
+                    audience_alignment=float(audience_alignment[i]),
+                    content_style_match=float(content_style_match[i]),
+                    platform_reach=float(platform_reach[i]),
+                    engagement_potential=float(engagement_potential[i]),
+                    budget_fit=float(budget_fit[i]),
+                    brand_values_alignment=float(brand_values_alignment[i]),
+                    collaboration_history_score=float(collaboration_history_score[i])
+                )
+                for i in range(n)
+            ]
         
-        return CompatibilityScore(
-            overall_score=overall_score,
-            audience_alignment=audience_alignment,
-            content_style_match=content_style_match,
-            platform_reach=platform_reach,
-            engagement_potential=engagement_potential,
-            budget_fit=budget_fit,
-            brand_values_alignment=brand_values_alignment,
-            collaboration_history_score=collaboration_history_score
-        )
+        return scorer
     
     def _calculate_audience_alignment(
         self,
         brand_audience: List[str],
-        creator_demographics: Dict[str, Any]
-    ) -> float:
-        """Calculate audience alignment score"""
+        creator_demographics: List[Dict[str, Any]],
+        noise: np.ndarray,
+        semantic_similarity: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Calculate audience alignment scores for a batch of creators"""
+        if semantic_similarity is not None:
+            return np.clip(semantic_similarity, 0.0, 1.0)
+        
         # Simplified calculation - in production, this would be more sophisticated
-        return 0.7 + np.random.random() * 0.3
+        return 0.7 + noise * 0.3
     
     def _calculate_content_style_match(
         self,
-        brand_preferences: List[str],
-        creator_categories: List[str]
-    ) -> float:
-        """Calculate content style match score"""
+        brand_mask: int,
+        creator_masks: np.ndarray
+    ) -> np.ndarray:
+        """Calculate content style match (Jaccard overlap of category bitmasks) for a batch of creators"""
         # Simplified calculation
-        overlap = len(set(brand_preferences) & set(creator_categories))
-        total = len(set(brand_preferences) | set(creator_categories))
-        return overlap / total if total > 0 else 0.5
+        brand = np.uint64(brand_mask)
+        overlap = _popcount(creator_masks & brand)
+        total = _popcount(creator_masks | brand)
+        return np.divide(
+            overlap, total, out=np.full(len(creator_masks), 0.5, dtype=np.float32), where=total > 0
+        )
     
     def _calculate_platform_reach(
         self,
         brand_presence: Dict[str, Any],
-        creator_platforms: List[str]
-    ) -> float:
-        """Calculate platform reach score"""
+        creator_platforms: List[List[str]],
+        noise: np.ndarray
+    ) -> np.ndarray:
+        """Calculate platform reach scores for a batch of creators"""
         # Simplified calculation
-        return 0.6 + np.random.random() * 0.4
+        return 0.6 + noise * 0.4
     
     def _calculate_engagement_potential(
         self,
-        engagement_rates: Dict[str, float]
-    ) -> float:
-        """Calculate engagement potential score"""
-        avg_engagement = sum(engagement_rates.values()) / len(engagement_rates)
-        return min(avg_engagement * 10, 1.0)  # Normalize to 0-1
+        engagement_rates: np.ndarray
+    ) -> np.ndarray:
+        """Calculate engagement potential scores from the N x P engagement matrix"""
+        # Mean over the platforms each creator is on; creators with none score 0
+        present = ~np.isnan(engagement_rates)
+        counts = present.sum(axis=1)
+        totals = np.where(present, engagement_rates, 0.0).sum(axis=1)
+        avg_engagement = np.divide(totals, counts, out=np.zeros(len(counts)), where=counts > 0)
+        return np.clip(avg_engagement * 10.0, 0.0, 1.0).astype(np.float32)  # Normalize to 0-1
     
     def _calculate_budget_fit(
         self,
         brand_budget: str,
-        creator_rates: Dict[str, float],
+        creator_rates: np.ndarray,
+        noise: np.ndarray,
         budget_constraints: Optional[Dict[str, Any]] = None
-    ) -> float:
-        """Calculate budget fit score"""
+    ) -> np.ndarray:
+        """Calculate budget fit scores for a batch of creators"""
         # Simplified calculation
-        return 0.8 + np.random.random() * 0.2
+        return 0.8 + noise * 0.2
     
     def _calculate_brand_values_alignment(
         self,
         brand_values: List[str],
-        creator_categories: List[str]
-    ) -> float:
-        """Calculate brand values alignment score"""
+        creator_categories: List[List[str]],
+        noise: np.ndarray
+    ) -> np.ndarray:
+        """Calculate brand values alignment scores for a batch of creators"""
         # Simplified calculation
-        return 0.7 + np.random.random() * 0.3
+        return 0.7 + noise * 0.3
     
     def _calculate_collaboration_history_score(
         self,
@@ -439,86 +801,98 @@ class MatchmakingService:
                                      if collab.get("success_rate", 0) > 0.7)
         return min(successful_collaborations / len(collaboration_history), 1.0)
     
-    async def _generate_match_reasons(
+    def _build_match_result(
         self,
         brand_profile: BrandProfile,
         creator_profile: CreatorProfile,
-        compatibility_score: CompatibilityScore
-    ) -> List[str]:
-        """Generate reasons why this creator is a good match"""
-        reasons = []
+        compatibility_score: CompatibilityScore,
+        budget_constraints: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build one match entry: reasons, campaign ideas, performance, budget and risk"""
+        # Quantities shared by several of the sections below, computed once
+        overall_score = compatibility_score.overall_score
+        total_followers = sum(creator_profile.follower_count.values())
+        avg_rate = fmean(creator_profile.rates.values())
         
+        # Reasons why this creator is a good match
+        match_reasons = []
         if compatibility_score.audience_alignment > 0.8:
-            reasons.append("High audience alignment with brand target demographic")
-        
+            match_reasons.append("High audience alignment with brand target demographic")
         if compatibility_score.content_style_match > 0.7:
-            reasons.append("Content style matches brand preferences")
-        
+            match_reasons.append("Content style matches brand preferences")
         if compatibility_score.engagement_potential > 0.6:
-            reasons.append("Strong engagement rates indicate active audience")
-        
+            match_reasons.append("Strong engagement rates indicate active audience")
         if compatibility_score.budget_fit > 0.8:
-            reasons.append("Creator rates align well with brand budget")
+            match_reasons.append("Creator rates align well with brand budget")
         
-        return reasons
-    
-    async def _generate_campaign_ideas(
-        self,
-        brand_profile: BrandProfile,
-        creator_profile: CreatorProfile
-    ) -> List[str]:
-        """Generate campaign ideas for brand-creator collaboration"""
-        # This would use AI to generate creative campaign ideas
-        ideas = [
+        # Campaign ideas for the collaboration (this would use AI to generate creative ideas)
+        potential_campaign_ideas = [
             f"Collaborative {brand_profile.preferred_content_types[0]} campaign",
             f"Behind-the-scenes content with {creator_profile.username}",
-            f"Product showcase in {creator_profile.content_categories[0]} style",
-            f"Interactive Q&A session about {brand_profile.industry}"
+            f"Product showcase in {creator_profile.content_categories[0]} style"
         ]
-        return ideas[:3]  # Return top 3 ideas
-    
-    async def _estimate_performance(
-        self,
-        brand_profile: BrandProfile,
-        creator_profile: CreatorProfile,
-        compatibility_score: CompatibilityScore
-    ) -> Dict[str, Any]:
-        """Estimate campaign performance"""
-        base_reach = sum(creator_profile.follower_count.values())
-        estimated_reach = int(base_reach * compatibility_score.overall_score)
         
-        return {
+        # Estimated campaign performance
+        estimated_reach = int(total_followers * overall_score)
+        estimated_performance = {
             "estimated_reach": estimated_reach,
             "estimated_engagement": int(estimated_reach * 0.05),
             "estimated_clicks": int(estimated_reach * 0.02),
             "estimated_conversions": int(estimated_reach * 0.01)
         }
-    
-    async def _calculate_recommended_budget(
-        self,
-        brand_profile: BrandProfile,
-        creator_profile: CreatorProfile,
-        budget_constraints: Optional[Dict[str, Any]] = None
-    ) -> float:
-        """Calculate recommended budget for collaboration"""
-        avg_rate = sum(creator_profile.rates.values()) / len(creator_profile.rates)
-        return avg_rate * 1.2  # 20% premium for collaboration
-    
-    async def _assess_collaboration_risk(
-        self,
-        brand_profile: BrandProfile,
-        creator_profile: CreatorProfile,
-        compatibility_score: CompatibilityScore
-    ) -> str:
-        """Assess collaboration risk level"""
-        if compatibility_score.overall_score > 0.8:
-            return "Low risk - High compatibility"
-        elif compatibility_score.overall_score > 0.6:
-            return "Medium risk - Good compatibility"
+        
+        # Collaboration risk level
+        if overall_score > 0.8:
+            risk_assessment = "Low risk - High compatibility"
+        elif overall_score > 0.6:
+            risk_assessment = "Medium risk - Good compatibility"
         else:
-            return "High risk - Low compatibility"
+            risk_assessment = "High risk - Low compatibility"
+        
+        return {
+            "creator_profile": creator_profile,
+            "compatibility_score": compatibility_score,
+            "match_reasons": match_reasons,
+            "potential_campaign_ideas": potential_campaign_ideas,
+            "estimated_performance": estimated_performance,
+            "recommended_budget": avg_rate * 1.2,  # 20% premium for collaboration
+            "risk_assessment": risk_assessment
+        }
+    
+    async def _get_cached_profile(self, cache: TTLCache, kind: str, profile_id: str, fetch):
+        """Get a profile (or other shared value) through a TTL cache, fetching at most once per key concurrently"""
+        profile = cache.get(profile_id)
+        if profile is not None:
+            return profile
+        
+        lock_key = (kind, profile_id)
+        lock = _profile_fetch_locks.get(lock_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            _profile_fetch_locks[lock_key] = lock
+        
+        async with lock:
+            # Another request may have filled the cache while we waited
+            profile = cache.get(profile_id)
+            if profile is None:
+                profile = await fetch(profile_id)
+                if profile is not None:
+                    cache[profile_id] = profile
+        return profile
     
     async def _get_brand_profile(self, brand_id: str) -> Optional[BrandProfile]:
+        """Get brand profile, served from cache when fresh"""
+        return await self._get_cached_profile(
+            _brand_profile_cache, "brand", brand_id, self._fetch_brand_profile
+        )
+    
+    async def _get_creator_profile(self, creator_id: str) -> Optional[CreatorProfile]:
+        """Get creator profile, served from cache when fresh"""
+        return await self._get_cached_profile(
+            _creator_profile_cache, "creator", creator_id, self._fetch_creator_profile
+        )
+    
+    async def _fetch_brand_profile(self, brand_id: str) -> Optional[BrandProfile]:
         """Get brand profile from database"""
         # Mock implementation
         return BrandProfile(
@@ -534,7 +908,7 @@ class MatchmakingService:
             social_media_presence={"instagram": True, "youtube": True}
         )
     
-    async def _get_creator_profile(self, creator_id: str) -> Optional[CreatorProfile]:
+    async def _fetch_creator_profile(self, creator_id: str) -> Optional[CreatorProfile]:
         """Get creator profile from database"""
         # Mock implementation
         return CreatorProfile(
@@ -1,93 +1,215 @@
 """
 NLP utilities and text processing service
 """
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator
+import asyncio
+import copy
+import hashlib
+import os
 import re
 import string
+import threading
 from collections import Counter
-import nltk
-from textblob import TextBlob
+from functools import lru_cache
+from importlib.util import find_spec
+from cachetools import LRUCache
 
-# Optional spacy import
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    spacy = None
-    SPACY_AVAILABLE = False
+# Optional spacy dependency; spaCy, NLTK, TextBlob and VADER are imported on first
+# use so light callers (clean_text, extractors) don't pay for loading them
+SPACY_AVAILABLE = find_spec("spacy") is not None
 
 from src.core.config import settings
 from src.core.logger import ai_logger
 
 
+# Only tokens and entities are used, so everything but ner is skipped at load time
+_SPACY_MODEL = "en_core_web_sm"
+_SPACY_DISABLE = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+_NLTK_RESOURCES = (
+    ("tokenizers/punkt", "punkt"),
+    ("corpora/stopwords", "stopwords"),
+)
+
+# Precompiled text patterns
+_WS_RE = re.compile(r"\s+")
+_ALLOWED_RE = re.compile(r"[^\w\s.,!?;:()\-]")
+_HASHTAG_RE = re.compile(r"#\w+")
+_MENTION_RE = re.compile(r"@\w+")
+_URL_RE = re.compile(r"https?://\S+")
+_ELEMENTS_RE = re.compile(r"(?P<url>https?://\S+)|(?P<hashtag>#\w+)|(?P<mention>@\w+)")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+_SENT_RE = re.compile(r"[.!?]+(?:\s|$)")
+_WORD_RE = re.compile(r"[A-Za-z']+")
+
+# ASCII characters clean_text drops, removed with str.translate on the common all-ASCII path
+_KEEP_CHARS = set(string.ascii_letters + string.digits + string.whitespace + "_.,!?;:()-")
+_KEEP_TRANSLATE = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in _KEEP_CHARS))
+
+
+# Analysis results keyed by (content digest, content_type, platform); the analysis
+# is deterministic, and the same draft is often re-analyzed while being edited
+_quality_cache: LRUCache = LRUCache(maxsize=4096)
+_quality_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_spacy(name: str, disable: Tuple[str, ...]) -> Any:
+    """Load a spaCy pipeline once per process; None if the model is missing"""
+    import spacy
+    try:
+        return spacy.load(name, disable=list(disable))
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _blank_spacy() -> Any:
+    """Tokenizer-only English pipeline shared across instances"""
+    # A blank pipeline tokenizes without loading any model weights
+    import spacy
+    return spacy.blank("en")
+
+
+@lru_cache(maxsize=1)
+def _ensure_nltk_data() -> None:
+    """Check for (and download) NLTK data once per process"""
+    import nltk
+    # Images ship NLTK data and point NLTK_DATA at it; never download at request time there
+    baked = bool(os.environ.get("NLTK_DATA"))
+    for path, package in _NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            if baked:
+                ai_logger.logger.warning("NLTK resource {} missing from NLTK_DATA; using fallbacks", package)
+            else:
+                nltk.download(package, quiet=True)
+
+
+@lru_cache(maxsize=1)
+def _get_textblob_cls() -> Any:
+    """Import TextBlob on first use"""
+    from textblob import TextBlob
+    return TextBlob
+
+
+@lru_cache(maxsize=1 << 16)
+def _count_syllables(word: str) -> int:
+    """Count syllables in a word (simplified); memoized since common words repeat"""
+    word = word.lower()
+    syllable_count = len(_VOWEL_GROUP_RE.findall(word))
+    
+    # Handle silent 'e'
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+    
+    return max(1, syllable_count)
+
+
+@lru_cache(maxsize=1)
+def _get_vader() -> Any:
+    """Shared VADER analyzer, or None if vaderSentiment isn't installed"""
+    try:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    except ImportError:
+        return None
+    return SentimentIntensityAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def _stopwords() -> frozenset:
+    """English stopwords, loaded once"""
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except Exception:
+        # Fallback: basic stopword list
+        return frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'})
+
+
 class NLPService:
     """Natural Language Processing service for text analysis and processing"""
     
     def __init__(self):
         self.logger = ai_logger
         self.nlp = None  # Lazy-loaded
+        self.nlp_tok = None  # Tokenizer-only pipeline, lazy-loaded
+        self._models_loaded = False
     
     def _load_models(self):
         """Load NLP models"""
         try:
             # Load spaCy model (optional). If unavailable, continue with basic NLP.
-            if SPACY_AVAILABLE and spacy:
-                try:
-                    self.nlp = spacy.load("en_core_web_sm")
-                except Exception:
-                    self.nlp = None
+            if SPACY_AVAILABLE:
+                self.nlp = _load_spacy(_SPACY_MODEL, _SPACY_DISABLE)
+                self.nlp_tok = _blank_spacy()
             else:
                 self.nlp = None
+                self.nlp_tok = None
             
             # Download required NLTK data
-            try:
-                nltk.data.find('tokenizers/punkt')
-            except LookupError:
-                nltk.download('punkt')
-            
-            try:
-                nltk.data.find('corpora/stopwords')
-            except LookupError:
-                nltk.download('stopwords')
-            
-            try:
-                nltk.data.find('taggers/averaged_perceptron_tagger')
-            except LookupError:
-                nltk.download('averaged_perceptron_tagger')
+            _ensure_nltk_data()
                 
         except Exception as e:
             self.logger.log_error(e, {"operation": "load_nlp_models"})
             # Fallback to basic text processing
             self.nlp = None
+        finally:
+            self._models_loaded = True
 
     def _ensure_loaded(self):
         """Ensure heavy models are loaded lazily."""
-        if self.nlp is None:
+        if not self._models_loaded:
             self._load_models()
     
+    def warmup(self):
+        """Load models and run a tiny input through each so first requests skip cold-start costs"""
+        self._ensure_loaded()
+        try:
+            if self.nlp:
+                self.nlp("warmup")
+            if self.nlp_tok:
+                self.nlp_tok("warmup")
+            _stopwords()
+            self.analyze_sentiment("warmup")
+        except Exception as e:
+            self.logger.log_error(e, {"operation": "nlp_warmup"})
+    
+    def _pipe(self, texts: Iterable[str], nlp: Any = None, disable: Optional[List[str]] = None) -> Iterator[Any]:
+        """Run texts through a spaCy pipeline in batches, yielding one Doc per text"""
+        return (nlp or self.nlp).pipe(
+            texts,
+            batch_size=settings.spacy_batch_size,
+            n_process=self._n_process(texts),
+            disable=disable or []
+        )
+    
+    def _n_process(self, texts: Iterable[str]) -> int:
+        """Worker processes for a pipe call; multiprocessing only pays off on bulk inputs"""
+        if settings.nlp_n_process == 1 or not isinstance(texts, list) or len(texts) <= settings.nlp_bulk_threshold:
+            return 1
+        if settings.nlp_n_process < 1:
+            # Non-positive means "all cores but one"
+            return max(1, (os.cpu_count() or 1) - 1)
+        return settings.nlp_n_process
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?;:()\-]', '', text)
+        text = text.translate(_KEEP_TRANSLATE) if text.isascii() else _ALLOWED_RE.sub('', text)
         
-        # Normalize case
-        text = text.lower()
-        
-        return text
+        # Normalize case and collapse whitespace
+        return _WS_RE.sub(' ', text.lower()).strip()
     
     def extract_hashtags(self, text: str) -> List[str]:
         """Extract hashtags from text"""
         if not text:
             return []
         
-        hashtag_pattern = r'#\w+'
-        hashtags = re.findall(hashtag_pattern, text)
+        hashtags = _HASHTAG_RE.findall(text)
         
         # Clean hashtags
         cleaned_hashtags = []
@@ -104,8 +226,7 @@ class NLPService:
         if not text:
             return []
         
-        mention_pattern = r'@\w+'
-        mentions = re.findall(mention_pattern, text)
+        mentions = _MENTION_RE.findall(text)
         
         # Clean mentions
         cleaned_mentions = []
@@ -121,34 +242,46 @@ class NLPService:
         if not text:
             return []
         
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        
-        return urls
+        return _URL_RE.findall(text)
+    
+    def _extract_elements(self, text: str) -> Tuple[List[str], List[str], List[str]]:
+        """Extract hashtags, mentions and URLs in a single regex pass"""
+        hashtags, mentions, urls = [], [], []
+        for match in _ELEMENTS_RE.finditer(text):
+            kind = match.lastgroup
+            value = match.group()
+            if kind == "url":
+                urls.append(value)
+            elif len(value) > 2:  # Avoid single character hashtags/mentions
+                (hashtags if kind == "hashtag" else mentions).append(value[1:].lower())
+        
+        return hashtags, mentions, urls
     
-    def tokenize_text(self, text: str) -> List[str]:
-        """Tokenize text into words"""
+    def tokenize_text(self, text: Union[str, List[str]]) -> Union[List[str], List[List[str]]]:
+        """Tokenize text into words; a list of texts is tokenized in one batch"""
+        if isinstance(text, list):
+            return self.tokenize_texts(text)
         if not text:
             return []
         
+        return self.tokenize_texts([text])[0]
+    
+    def tokenize_texts(self, texts: List[str]) -> List[List[str]]:
+        """Tokenize several texts with a single spaCy pass"""
         self._ensure_loaded()
-        if self.nlp:
-            doc = self.nlp(text)
-            return [token.text for token in doc if not token.is_space]
-        else:
+        if not self.nlp_tok:
             # Fallback to simple tokenization
-            return text.split()
+            return [text.split() if text else [] for text in texts]
+        
+        return [
+            [token.text for token in doc if not token.is_space]
+            for doc in self._pipe(texts, nlp=self.nlp_tok)
+        ]
     
     def remove_stopwords(self, tokens: List[str]) -> List[str]:
         """Remove stopwords from tokenized text"""
-        try:
-            from nltk.corpus import stopwords
-            stop_words = set(stopwords.words('english'))
-            return [token for token in tokens if token.lower() not in stop_words]
-        except:
-            # Fallback: basic stopword removal
-            basic_stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'}
-            return [token for token in tokens if token.lower() not in basic_stopwords]
+        stop_words = _stopwords()
+        return [token for token in tokens if token.lower() not in stop_words]
     
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[Dict[str, Any]]:
         """Extract keywords from text with importance scores"""
@@ -158,25 +291,28 @@ class NLPService:
         # Clean and tokenize text
         cleaned_text = self.clean_text(text)
         tokens = self.tokenize_text(cleaned_text)
-        tokens = self.remove_stopwords(tokens)
+        return self._keywords_from_tokens(tokens, max_keywords)
+    
+    def _keywords_from_tokens(self, tokens: List[str], max_keywords: int) -> List[Dict[str, Any]]:
+        """Score keywords from tokens of already cleaned (lowercased) text"""
+        # Tokens come from clean_text output, so they are already lowercase and
+        # can be checked against the stopword set directly
+        stop_words = _stopwords()
         
-        # Count word frequency
-        word_counts = Counter(tokens)
+        # Count word frequency, filtering out stopwords and very short words before counting
+        word_counts = Counter(token for token in tokens if len(token) > 2 and token not in stop_words)
         
         # Calculate importance scores (simple TF-based scoring)
-        total_words = len(tokens)
-        keywords = []
+        total_words = sum(word_counts.values())
         
-        for word, count in word_counts.most_common(max_keywords):
-            if len(word) > 2:  # Filter out very short words
-                importance_score = count / total_words
-                keywords.append({
-                    "word": word,
-                    "count": count,
-                    "importance_score": round(importance_score, 4)
-                })
-        
-        return keywords
+        return [
+            {
+                "word": word,
+                "count": count,
+                "importance_score": round(count / total_words, 4)
+            }
+            for word, count in word_counts.most_common(max_keywords)
+        ]
     
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text"""
@@ -184,14 +320,23 @@ class NLPService:
             return {"sentiment": "neutral", "score": 0.0}
         
         try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
+            vader = _get_vader()
+            if vader is not None:
+                # Lexicon lookup; the non-neutral share of the text stands in for subjectivity
+                scores = vader.polarity_scores(text)
+                polarity = scores["compound"]
+                subjectivity = 1.0 - scores["neu"]
+                threshold = 0.05
+            else:
+                blob = _get_textblob_cls()(text)
+                polarity = blob.sentiment.polarity
+                subjectivity = blob.sentiment.subjectivity
+                threshold = 0.1
             
             # Categorize sentiment
-            if polarity > 0.1:
+            if polarity > threshold:
                 sentiment = "positive"
-            elif polarity < -0.1:
+            elif polarity < -threshold:
                 sentiment = "negative"
             else:
                 sentiment = "neutral"
@@ -212,92 +357,95 @@ class NLPService:
             return {"score": 0, "level": "unknown"}
         
         try:
-            blob = TextBlob(text)
-            
             # Count sentences, words, and syllables
-            sentences = len(blob.sentences)
-            words = len(blob.words)
-            
-            if sentences == 0 or words == 0:
-                return {"score": 0, "level": "unknown"}
-            
-            # Estimate syllables (simplified)
-            syllables = sum(self._count_syllables(word) for word in blob.words)
-            
-            # Calculate Flesch Reading Ease
-            score = 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
-            
-            # Categorize readability level
-            if score >= 90:
-                level = "very_easy"
-            elif score >= 80:
-                level = "easy"
-            elif score >= 70:
-                level = "fairly_easy"
-            elif score >= 60:
-                level = "standard"
-            elif score >= 50:
-                level = "fairly_difficult"
-            elif score >= 30:
-                level = "difficult"
-            else:
-                level = "very_difficult"
-            
-            return {
-                "score": round(score, 2),
-                "level": level,
-                "sentences": sentences,
-                "words": words,
-                "syllables": syllables
-            }
+            sentences, word_list = self._split_sentences_and_words(text)
+            return self._readability_from_counts(sentences, word_list)
         except Exception as e:
             self.logger.log_error(e, {"operation": "calculate_readability_score"})
             return {"score": 0, "level": "unknown"}
     
-    def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word (simplified)"""
-        word = word.lower()
-        vowels = "aeiouy"
-        syllable_count = 0
-        prev_was_vowel = False
+    def _readability_from_counts(self, sentences: int, word_list: List[str]) -> Dict[str, Any]:
+        """Flesch Reading Ease from a sentence count and the list of words"""
+        words = len(word_list)
         
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_was_vowel:
-                syllable_count += 1
-            prev_was_vowel = is_vowel
+        if sentences == 0 or words == 0:
+            return {"score": 0, "level": "unknown"}
         
-        # Handle silent 'e'
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
+        # Estimate syllables (simplified)
+        syllables = sum(map(_count_syllables, word_list))
+        
+        # Calculate Flesch Reading Ease
+        score = 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
+        
+        # Categorize readability level
+        if score >= 90:
+            level = "very_easy"
+        elif score >= 80:
+            level = "easy"
+        elif score >= 70:
+            level = "fairly_easy"
+        elif score >= 60:
+            level = "standard"
+        elif score >= 50:
+            level = "fairly_difficult"
+        elif score >= 30:
+            level = "difficult"
+        else:
+            level = "very_difficult"
         
-        return max(1, syllable_count)
+        return {
+            "score": round(score, 2),
+            "level": level,
+            "sentences": sentences,
+            "words": words,
+            "syllables": syllables
+        }
     
-    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
-        """Extract named entities from text"""
+    def _split_sentences_and_words(self, text: str) -> Tuple[int, List[str]]:
+        """Count sentences and collect words with compiled regexes (no tokenizer pipeline)"""
+        words = _WORD_RE.findall(text)
+        # A sentence is any terminator-delimited segment that contains a word
+        sentences = sum(1 for segment in _SENT_RE.split(text) if _WORD_RE.search(segment))
+        return sentences, words
+    
+    def extract_entities(
+        self,
+        text: Union[str, List[str]]
+    ) -> Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+        """Extract named entities from text; a list of texts is processed in one batch"""
+        if isinstance(text, list):
+            return self.extract_entities_batch(text)
         if not text:
             return []
+        
+        return self.extract_entities_batch([text])[0]
+    
+    def extract_entities_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract named entities from several texts with a single spaCy pass"""
         self._ensure_loaded()
         if not self.nlp:
-            return []
+            return [[] for _ in texts]
         
         try:
-            doc = self.nlp(text)
-            entities = []
-            
-            for ent in doc.ents:
-                entities.append({
-                    "text": ent.text,
-                    "label": ent.label_,
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                    "description": spacy.explain(ent.label_) if SPACY_AVAILABLE and spacy else ent.label_
-                })
-            
-            return entities
+            return [self._entities_from_doc(doc) for doc in self._pipe(texts)]
         except Exception as e:
             self.logger.log_error(e, {"operation": "extract_entities"})
-            return []
+            return [[] for _ in texts]
+    
+    def _entities_from_doc(self, doc: Any) -> List[Dict[str, Any]]:
+        """Convert a Doc's entity spans to dicts"""
+        # Only reached once a spaCy pipeline is loaded, so the import is cached
+        import spacy
+        return [
+            {
+                "text": ent.text,
+                "label": ent.label_,
+                "start": ent.start_char,
+                "end": ent.end_char,
+                "description": spacy.explain(ent.label_)
+            }
+            for ent in doc.ents
+        ]
     
     def analyze_content_quality(
         self, 
@@ -309,26 +457,108 @@ class NLPService:
         if not content:
             return {"error": "No content provided"}
         
+        return self.analyze_content_quality_batch([content], content_type, platform)[0]
+    
+    def analyze_content_quality_batch(
+        self,
+        contents: List[str],
+        content_type: str,
+        platform: str
+    ) -> List[Dict[str, Any]]:
+        """Analyze several pieces of content, tokenizing them all in one spaCy pass"""
+        keys = [
+            (hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest(), content_type, platform)
+            if content else None
+            for content in contents
+        ]
+        with _quality_cache_lock:
+            results = [_quality_cache.get(key) if key else None for key in keys]
+        
+        misses = [i for i, (key, result) in enumerate(zip(keys, results)) if key and result is None]
+        if misses:
+            fresh = self._analyze_content_quality_uncached([contents[i] for i in misses], content_type, platform)
+            with _quality_cache_lock:
+                for i, result in zip(misses, fresh):
+                    _quality_cache[keys[i]] = result
+                    results[i] = result
+        
+        # Hand out copies so callers can't mutate cached results
+        return [
+            copy.deepcopy(result) if result is not None else {"error": "No content provided"}
+            for result in results
+        ]
+    
+    def _analyze_content_quality_uncached(
+        self,
+        contents: List[str],
+        content_type: str,
+        platform: str
+    ) -> List[Dict[str, Any]]:
+        """Analyze non-empty contents, tokenizing them all in one spaCy pass"""
+        cleaned_texts = [self.clean_text(content) for content in contents]
+        token_lists = self.tokenize_texts(cleaned_texts)
+        
+        # Readability counts the raw content with the same regexes as calculate_readability_score,
+        # so the quality report and the standalone score agree
+        counts = [self._split_sentences_and_words(content) for content in contents]
+        readabilities = [self._readability_from_counts(sentences, words) for sentences, words in counts]
+        word_counts = [len(words) for _, words in counts]
+        
+        return [
+            self._analyze_content_quality(content, content_type, platform, tokens, readability, word_count)
+            for content, tokens, readability, word_count in zip(contents, token_lists, readabilities, word_counts)
+        ]
+    
+    async def a_analyze_content_quality(
+        self,
+        content: str,
+        content_type: str,
+        platform: str
+    ) -> Dict[str, Any]:
+        """Async analyze_content_quality; runs the CPU-bound work in a worker thread"""
+        return await asyncio.to_thread(self.analyze_content_quality, content, content_type, platform)
+    
+    async def a_analyze_content_quality_batch(
+        self,
+        contents: List[str],
+        content_type: str,
+        platform: str
+    ) -> List[Dict[str, Any]]:
+        """Async analyze_content_quality_batch; runs the CPU-bound work in a worker thread"""
+        return await asyncio.to_thread(self.analyze_content_quality_batch, contents, content_type, platform)
+    
+    def _analyze_content_quality(
+        self,
+        content: str,
+        content_type: str,
+        platform: str,
+        tokens: List[str],
+        readability: Optional[Dict[str, Any]] = None,
+        word_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Analyze one piece of content given its cleaned tokens (and readability/word count, if already computed)"""
         # Basic metrics
-        word_count = len(content.split())
+        if word_count is None:
+            word_count = len(content.split())
         char_count = len(content)
         
         # Extract elements
-        hashtags = self.extract_hashtags(content)
-        mentions = self.extract_mentions(content)
-        urls = self.extract_urls(content)
+        hashtags, mentions, urls = self._extract_elements(content)
         
         # Analyze sentiment
         sentiment = self.analyze_sentiment(content)
         
         # Calculate readability
-        readability = self.calculate_readability_score(content)
+        if readability is None:
+            readability = self.calculate_readability_score(content)
         
         # Extract keywords
-        keywords = self.extract_keywords(content, max_keywords=5)
+        keywords = self._keywords_from_tokens(tokens, max_keywords=5)
         
         # Platform-specific analysis
-        platform_analysis = self._analyze_for_platform(content, content_type, platform)
+        platform_analysis = self._analyze_for_platform(
+            content, content_type, platform, hashtag_count=len(hashtags)
+        )
         
         # Generate suggestions
         suggestions = self._generate_content_suggestions(
@@ -363,7 +593,13 @@ class NLPService:
             "suggestions": suggestions
         }
     
-    def _analyze_for_platform(self, content: str, content_type: str, platform: str) -> Dict[str, Any]:
+    def _analyze_for_platform(
+        self,
+        content: str,
+        content_type: str,
+        platform: str,
+        hashtag_count: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Analyze content for platform-specific requirements"""
         analysis = {
             "platform": platform,
@@ -375,7 +611,9 @@ class NLPService:
         if platform == "instagram":
             if len(content) > 2200:
                 analysis["recommendations"].append("Content is too long for Instagram (max 2200 characters)")
-            if len(self.extract_hashtags(content)) > 30:
+            if hashtag_count is None:
+                hashtag_count = len(self.extract_hashtags(content))
+            if hashtag_count > 30:
                 analysis["recommendations"].append("Too many hashtags (max 30 recommended)")
         
         elif platform == "twitter":
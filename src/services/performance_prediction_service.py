@@ -2,18 +2,216 @@
 Performance Prediction Service for Content and Campaign Performance
 """
 import asyncio
+import copy
+import hashlib
+import json
 import time
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import weakref
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
+from dataclasses import dataclass, fields
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+from cachetools import TTLCache
+
+# Optional numba import
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels run as plain Python without numba"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Optional pyarrow import
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from src.core.config import settings
 from src.core.logger import ai_logger
 from src.core.exceptions import PerformancePredictionError, InsufficientDataError
 from src.services.rag_service import RAGService
 from src.services.nlp_utils import NLPService
 
 
-@dataclass
+# Explicit signatures compile eagerly at import (or load from the on-disk
+# cache) instead of on the first request, and pin the argument dtypes
+@njit("UniTuple(int64, 8)(float64, float64, float64)", cache=True)
+def _perf_metrics_kernel(base_reach, trending_potential, engagement_rate):
+    """Content metric estimates: reach, impressions, likes, comments, shares, saves, clicks, conversions"""
+    reach = int(base_reach * trending_potential)
+    impressions = int(reach * 1.5)
+    likes = int(reach * engagement_rate)
+    comments = int(likes * 0.1)
+    shares = int(likes * 0.05)
+    saves = int(likes * 0.02)
+    clicks = int(reach * 0.02)
+    conversions = int(clicks * 0.1)
+    return reach, impressions, likes, comments, shares, saves, clicks, conversions
+
+
+
+def _perf_metrics_batch(
+    base_reach: np.ndarray,
+    trending_potential: np.ndarray,
+    engagement_rate: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Vectorized _perf_metrics_kernel: the same estimates as int64 columns"""
+    reach = (base_reach * trending_potential).astype(np.int64)
+    likes = (reach * engagement_rate).astype(np.int64)
+    clicks = (reach * 0.02).astype(np.int64)
+    return {
+        "estimated_reach": reach,
+        "estimated_impressions": (reach * 1.5).astype(np.int64),
+        "estimated_likes": likes,
+        "estimated_comments": (likes * 0.1).astype(np.int64),
+        "estimated_shares": (likes * 0.05).astype(np.int64),
+        "estimated_saves": (likes * 0.02).astype(np.int64),
+        "estimated_clicks": clicks,
+        "estimated_conversions": (clicks * 0.1).astype(np.int64)
+    }
+
+# Success probability: base confidence minus a penalty per risk, floored
+_RISK_PENALTY_CONTENT = 0.05
+_RISK_PENALTY_CAMPAIGN = 0.1
+_MIN_PROB = 0.1
+
+# Upper bound on campaign audience size; far above any real audience, and low enough
+# that reach and impressions derived from it stay within the kernel's int64 range
+_MAX_AUDIENCE_SIZE = 10 ** 12
+
+
+def _success_prob_batch(base: np.ndarray, risk_counts: np.ndarray, penalty: float) -> np.ndarray:
+    """Success probabilities for many predictions in one vector expression"""
+    return np.maximum(_MIN_PROB, base - risk_counts * penalty)
+
+
+# Content risk messages, in the order their masks are stacked
+_CONTENT_RISK_MESSAGES = (
+    "Too many hashtags may reduce reach",
+    "Short descriptions may reduce engagement",
+    "Low trending potential"
+)
+
+
+def _content_risks_batch(
+    hashtag_counts: np.ndarray,
+    description_lengths: np.ndarray,
+    trending_potential: np.ndarray
+) -> List[List[str]]:
+    """Vectorized _assess_content_risk_factors: all thresholds in one pass, then one list per item"""
+    masks = np.stack((hashtag_counts > 30, description_lengths < 50, trending_potential < 0.3), axis=1)
+    return [
+        [message for message, hit in zip(_CONTENT_RISK_MESSAGES, row) if hit] if any(row) else []
+        for row in masks.tolist()
+    ]
+
+@njit("Tuple((int64, int64, int64, int64, float64, float64, float64, float64))(int64, int64, float64)", cache=True)
+def _campaign_metrics_kernel(audience_size, num_platforms, budget):
+    """Campaign estimates: reach, impressions, clicks, conversions, roi, cpm, cpc, cpa"""
+    reach = max(int(audience_size * 0.1) * num_platforms, 0)
+    impressions = max(int(reach * 1.5), 0)
+    clicks = max(int(reach * 0.02), 0)
+    conversions = max(int(clicks * 0.1), 0)
+    
+    # Zero when the denominator is empty rather than dividing by zero; the
+    # budget reciprocal is taken once and reused as a multiply
+    inv_budget = 1.0 / budget if budget > 0 else 0.0
+    roi = conversions * 50.0 * inv_budget
+    cpm = budget * (1000.0 / impressions) if impressions > 0 else 0.0
+    cpc = budget / clicks if clicks > 0 else 0.0
+    cpa = budget / conversions if conversions > 0 else 0.0
+    return reach, impressions, clicks, conversions, roi, cpm, cpc, cpa
+
+
+@njit("UniTuple(int64, 4)(float64, float64)", cache=True)
+def _creator_metrics_kernel(base_reach, engagement_rate):
+    """Creator estimates: reach, engagement, clicks, conversions"""
+    return (
+        int(base_reach * 0.8),
+        int(base_reach * engagement_rate),
+        int(base_reach * 0.02),
+        int(base_reach * 0.001)
+    )
+
+
+
+# Shared across service instances (the API builds one per request)
+_prediction_cache = TTLCache(maxsize=settings.cache_max_size, ttl=settings.prediction_cache_ttl)
+_creator_profile_cache = TTLCache(maxsize=settings.cache_max_size, ttl=settings.profile_cache_ttl)
+# One lock per in-flight key so concurrent identical requests compute once
+_prediction_locks: "weakref.WeakValueDictionary[Any, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Uniform draws pre-generated per refill of the scalar random buffer
+_RAND_BUFFER_SIZE = 4096
+
+# Platform-specific optimal posting windows, best first
+_OPTIMAL_TIMES = {
+    "instagram": ("18:00-20:00", "12:00-14:00"),
+    "youtube": ("19:00-21:00", "14:00-16:00"),
+    "tiktok": ("18:00-20:00", "21:00-23:00"),
+    "twitter": ("12:00-14:00", "17:00-19:00")
+}
+_DEFAULT_TIMES = ("18:00-20:00",)
+
+
+# Static content optimization suggestions, shared by every result
+_CAPTION_IMPROVEMENTS = ("Add call-to-action", "Include emojis", "Ask questions")
+_FORMAT_SUGGESTIONS = ("Use carousel posts", "Add stories", "Create reels")
+_VISUAL_ELEMENTS = ("High-quality images", "Brand colors", "Clear text overlay")
+_CTA_SUGGESTIONS = ("Follow for more", "Tag friends", "Share your thoughts")
+
+
+@lru_cache(maxsize=32)
+def _hashtag_suggestions(platform: str) -> Tuple[str, ...]:
+    """Trending hashtag placeholders for a platform"""
+    return tuple(f"#{platform}_trending_{i}" for i in range(5))
+
+
+@lru_cache(maxsize=32)
+def _timing_for(platform: str) -> Tuple[str, Tuple[str, ...], str]:
+    """Deterministic part of the timing recommendation: best window, alternatives, reasoning"""
+    times = _OPTIMAL_TIMES.get(platform, _DEFAULT_TIMES)
+    return times[0], times, f"Optimal for {platform} audience engagement"
+
+
+def _prediction_key(kind: str, args: Dict[str, Any]) -> bytes:
+    """Stable digest of a prediction request's arguments"""
+    payload = json.dumps({"kind": kind, "args": args}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+@lru_cache(maxsize=4)
+def _load_history_table(path: str) -> Optional["pa.Table"]:
+    """Memory-map the Arrow IPC history file so worker processes share its pages"""
+    if not PYARROW_AVAILABLE:
+        return None
+    try:
+        with pa.memory_map(path, "r") as source:
+            return pa.ipc.open_file(source).read_all()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        ai_logger.logger.warning("Failed to load historical data from {}: {}", path, e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _warmup_kernels() -> None:
+    """Exercise each kernel once per process so dispatch is primed off the request path"""
+    _perf_metrics_kernel(1000.0, 0.5, 0.05)
+    _campaign_metrics_kernel(1000000, 1, 1000.0)
+    _creator_metrics_kernel(1000.0, 0.05)
+
+
+@dataclass(frozen=True, slots=True)
 class PerformanceMetrics:
     """Performance metrics prediction model"""
     estimated_reach: int
@@ -29,6 +227,50 @@ class PerformanceMetrics:
 
 
 @dataclass
+class PerformanceMetricsView:
+    """PerformanceMetrics for a batch stored as columns; rows are boxed only when accessed"""
+    estimated_reach: np.ndarray
+    estimated_impressions: np.ndarray
+    estimated_engagement_rate: np.ndarray
+    estimated_likes: np.ndarray
+    estimated_comments: np.ndarray
+    estimated_shares: np.ndarray
+    estimated_saves: np.ndarray
+    estimated_clicks: np.ndarray
+    estimated_conversions: np.ndarray
+    confidence_score: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.estimated_reach)
+    
+    def __getitem__(self, i: int) -> PerformanceMetrics:
+        return PerformanceMetrics(*(getattr(self, name)[i].item() for name in _METRIC_FIELDS))
+    
+    def to_records(self) -> List[PerformanceMetrics]:
+        """Materialize every row as a PerformanceMetrics"""
+        columns = [getattr(self, name).tolist() for name in _METRIC_FIELDS]
+        return [PerformanceMetrics(*row) for row in zip(*columns)]
+
+
+_METRIC_FIELDS = tuple(f.name for f in fields(PerformanceMetrics))
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignMetrics:
+    """Campaign metrics prediction model"""
+    estimated_total_reach: int
+    estimated_total_impressions: int
+    estimated_engagement_rate: float
+    estimated_clicks: int
+    estimated_conversions: int
+    estimated_roi: float
+    estimated_cpm: float
+    estimated_cpc: float
+    estimated_cpa: float
+    confidence_score: float
+
+
+@dataclass(frozen=True, slots=True)
 class OptimalTiming:
     """Optimal timing prediction model"""
     best_posting_time: str
@@ -39,25 +281,146 @@ class OptimalTiming:
     expected_performance_boost: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContentOptimization:
     """Content optimization suggestions model"""
-    hashtag_suggestions: List[str]
-    caption_improvements: List[str]
-    content_format_suggestions: List[str]
-    visual_elements: List[str]
-    call_to_action_suggestions: List[str]
+    hashtag_suggestions: Tuple[str, ...]
+    caption_improvements: Tuple[str, ...]
+    content_format_suggestions: Tuple[str, ...]
+    visual_elements: Tuple[str, ...]
+    call_to_action_suggestions: Tuple[str, ...]
     expected_improvement: float
 
 
+# Column index of each platform in per-platform creator arrays
+PLATFORM_IDS = {"instagram": 0, "youtube": 1, "tiktok": 2, "twitter": 3}
+
+
+@dataclass(frozen=True, slots=True)
+class CreatorStats:
+    """Creator profile with per-platform numbers held as arrays indexed by PLATFORM_IDS"""
+    profile: Dict[str, Any]
+    follower_count: np.ndarray  # int64, 0 where the creator is not on the platform
+    engagement_rate: np.ndarray  # float64, NaN where the creator is not on the platform
+    
+    @classmethod
+    def from_profile(cls, profile: Dict[str, Any]) -> "CreatorStats":
+        follower_count = np.zeros(len(PLATFORM_IDS), dtype=np.int64)
+        engagement_rate = np.full(len(PLATFORM_IDS), np.nan)
+        for platform, count in profile.get("follower_count", {}).items():
+            if platform in PLATFORM_IDS:
+                follower_count[PLATFORM_IDS[platform]] = count
+        for platform, rate in profile.get("engagement_rate", {}).items():
+            if platform in PLATFORM_IDS:
+                engagement_rate[PLATFORM_IDS[platform]] = rate
+        return cls(profile, follower_count, engagement_rate)
+    
+    def followers(self, platform: str) -> int:
+        pid = PLATFORM_IDS.get(platform)
+        return 0 if pid is None else int(self.follower_count[pid])
+    
+    def engagement(self, platform: str, default: float) -> float:
+        pid = PLATFORM_IDS.get(platform)
+        if pid is None or np.isnan(self.engagement_rate[pid]):
+            return default
+        return float(self.engagement_rate[pid])
+
+
+@dataclass
+class HistoricalSeries:
+    """Historical performance as columns (one array per metric) rather than per-day rows"""
+    platform: str
+    content_type: str
+    date: np.ndarray  # datetime64[us]
+    reach: np.ndarray
+    engagement_rate: np.ndarray
+    likes: np.ndarray
+    comments: np.ndarray
+    shares: np.ndarray
+    clicks: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.date)
+    
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Materialize per-day row dicts for callers that need them"""
+        # Format every date in one vectorized pass rather than per row
+        columns = zip(
+            np.datetime_as_string(self.date, unit="us").tolist(),
+            self.reach.tolist(),
+            self.engagement_rate.tolist(),
+            self.likes.tolist(),
+            self.comments.tolist(),
+            self.shares.tolist(),
+            self.clicks.tolist()
+        )
+        return [
+            {
+                "date": date,
+                "platform": self.platform,
+                "content_type": self.content_type,
+                "reach": reach,
+                "engagement_rate": engagement_rate,
+                "likes": likes,
+                "comments": comments,
+                "shares": shares,
+                "clicks": clicks
+            }
+            for date, reach, engagement_rate, likes, comments, shares, clicks in columns
+        ]
+
+
 class PerformancePredictionService:
     """Service for predicting content and campaign performance"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.rag_service = RAGService()
         self.nlp_service = NLPService()
-        self.prediction_cache = {}  # In production, this would be Redis
-        self.historical_data = {}   # In production, this would be a real database
+        self.prediction_cache = _prediction_cache  # In production, this would be Redis
+        # Columnar history (Arrow IPC, memory-mapped); None falls back to mock data
+        self._history = _load_history_table(settings.historical_data_path)
+        # Per-instance generator; scalar draws come from a pre-drawn buffer
+        self._rng = np.random.default_rng(seed)
+        self._rand_buf: List[float] = []
+        self._rand_idx = 0
+        _warmup_kernels()
+    
+    async def _cached_computation(self, cache: TTLCache, key: Any, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a result through a TTL cache, computing at most once per key concurrently
+        
+        Callers get their own deep copy, so mutating a result never alters the cached one.
+        """
+        result = cache.get(key)
+        if result is not None:
+            return copy.deepcopy(result)
+        
+        lock = _prediction_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            _prediction_locks[key] = lock
+        
+        async with lock:
+            # Another request may have filled the cache while we waited
+            result = cache.get(key)
+            if result is None:
+                result = await compute()
+                if result is not None:
+                    cache[key] = result
+        return copy.deepcopy(result)
+    
+    async def _cached_prediction(self, key: bytes, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Serve a prediction from the shared cache, computing it on a miss"""
+        return await self._cached_computation(self.prediction_cache, key, compute)
+    
+    def _rand(self) -> float:
+        """Next uniform [0, 1) draw, refilling the buffer in one batch when exhausted"""
+        if self._rand_idx >= len(self._rand_buf):
+            self._rand_buf = self._rng.random(_RAND_BUFFER_SIZE).tolist()
+            self._rand_idx = 0
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return value
         
     async def predict_content_performance(
         self,
@@ -90,6 +453,37 @@ class PerformancePredictionService:
         Returns:
             Performance prediction results
         """
+        args = {
+            "content_type": content_type,
+            "platform": platform,
+            "content_description": content_description,
+            "hashtags": hashtags,
+            "caption": caption,
+            "posting_time": posting_time,
+            "target_audience": target_audience,
+            "campaign_goals": campaign_goals,
+            "budget": budget,
+            "creator_profile": creator_profile
+        }
+        return await self._cached_prediction(
+            _prediction_key("content", args),
+            lambda: self._predict_content_performance(**args)
+        )
+    
+    async def _predict_content_performance(
+        self,
+        content_type: str,
+        platform: str,
+        content_description: str,
+        hashtags: List[str] = None,
+        caption: str = None,
+        posting_time: str = None,
+        target_audience: str = None,
+        campaign_goals: List[str] = None,
+        budget: float = None,
+        creator_profile: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Uncached predict_content_performance"""
         try:
             ai_logger.logger.info(
                 "Starting content performance prediction",
@@ -102,24 +496,21 @@ class PerformancePredictionService:
                 content_type, platform, content_description, hashtags, caption
             )
             
-            # Predict performance metrics
-            performance_metrics = await self._predict_performance_metrics(
-                content_analysis, platform, target_audience, creator_profile
-            )
-            
-            # Calculate optimal timing
-            optimal_timing = await self._calculate_optimal_timing(
-                platform, target_audience, content_type, posting_time
-            )
-            
-            # Generate content optimization suggestions
-            content_optimization = await self._generate_content_optimization(
-                content_analysis, platform, target_audience, campaign_goals
-            )
-            
-            # Assess risk factors
-            risk_factors = await self._assess_content_risk_factors(
-                content_analysis, platform, target_audience
+            # Predict metrics, timing, optimization suggestions and risk factors;
+            # each depends only on the content analysis, so they run concurrently
+            performance_metrics, optimal_timing, content_optimization, risk_factors = await asyncio.gather(
+                self._predict_performance_metrics(
+                    content_analysis, platform, target_audience, creator_profile
+                ),
+                self._calculate_optimal_timing(
+                    platform, target_audience, content_type, posting_time
+                ),
+                self._generate_content_optimization(
+                    content_analysis, platform, target_audience, campaign_goals
+                ),
+                self._assess_content_risk_factors(
+                    content_analysis, platform, target_audience
+                )
             )
             
             # Calculate success probability
@@ -178,6 +569,33 @@ class PerformancePredictionService:
         Returns:
             Campaign performance prediction
         """
+        args = {
+            "campaign_id": campaign_id,
+            "campaign_type": campaign_type,
+            "platforms": platforms,
+            "budget": budget,
+            "duration_days": duration_days,
+            "target_audience": target_audience,
+            "content_strategy": content_strategy,
+            "creator_requirements": creator_requirements
+        }
+        return await self._cached_prediction(
+            _prediction_key("campaign", args),
+            lambda: self._predict_campaign_performance(**args)
+        )
+    
+    async def _predict_campaign_performance(
+        self,
+        campaign_id: str,
+        campaign_type: str,
+        platforms: List[str],
+        budget: float,
+        duration_days: int,
+        target_audience: Dict[str, Any],
+        content_strategy: Dict[str, Any],
+        creator_requirements: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Uncached predict_campaign_performance"""
         try:
             ai_logger.logger.info(
                 "Starting campaign performance prediction",
@@ -192,14 +610,17 @@ class PerformancePredictionService:
                 campaign_type, platforms, budget, duration_days, target_audience
             )
             
-            # Predict campaign metrics
-            campaign_metrics = await self._predict_campaign_metrics(
-                campaign_analysis, platforms, budget, duration_days
-            )
-            
-            # Calculate platform breakdown
-            platform_breakdown = await self._calculate_platform_breakdown(
-                platforms, budget, target_audience, content_strategy
+            # Predict campaign metrics, platform breakdown and risks concurrently
+            campaign_metrics, platform_breakdown, risk_assessment = await asyncio.gather(
+                self._predict_campaign_metrics(
+                    campaign_analysis, platforms, budget, duration_days
+                ),
+                self._calculate_platform_breakdown(
+                    platforms, budget, target_audience, content_strategy
+                ),
+                self._assess_campaign_risks(
+                    campaign_analysis, platforms, target_audience
+                )
             )
             
             # Optimize budget allocation
@@ -207,11 +628,6 @@ class PerformancePredictionService:
                 platforms, budget, campaign_metrics
             )
             
-            # Assess campaign risks
-            risk_assessment = await self._assess_campaign_risks(
-                campaign_analysis, platforms, target_audience
-            )
-            
             # Calculate success probability
             success_probability = await self._calculate_campaign_success_probability(
                 campaign_metrics, risk_assessment
@@ -220,7 +636,7 @@ class PerformancePredictionService:
             ai_logger.logger.info(
                 "Campaign performance prediction completed",
                 campaign_id=campaign_id,
-            estimated_roi=(campaign_metrics.get("estimated_roi") if isinstance(campaign_metrics, dict) else getattr(campaign_metrics, "estimated_roi", None)),
+                estimated_roi=campaign_metrics.estimated_roi,
                 success_probability=success_probability
             )
             
@@ -264,6 +680,31 @@ class PerformancePredictionService:
         Returns:
             Creator performance prediction
         """
+        args = {
+            "creator_id": creator_id,
+            "brand_id": brand_id,
+            "campaign_type": campaign_type,
+            "platform": platform,
+            "content_type": content_type,
+            "budget": budget,
+            "target_audience": target_audience
+        }
+        return await self._cached_prediction(
+            _prediction_key("creator", args),
+            lambda: self._predict_creator_performance(**args)
+        )
+    
+    async def _predict_creator_performance(
+        self,
+        creator_id: str,
+        brand_id: str,
+        campaign_type: str,
+        platform: str,
+        content_type: str,
+        budget: float,
+        target_audience: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Uncached predict_creator_performance"""
         try:
             ai_logger.logger.info(
                 "Starting creator performance prediction",
@@ -282,19 +723,17 @@ class PerformancePredictionService:
                 creator_profile, platform, content_type
             )
             
-            # Predict performance metrics
-            predicted_performance = await self._predict_creator_metrics(
-                creator_analysis, platform, content_type, budget, target_audience
-            )
-            
-            # Calculate compatibility score
-            compatibility_score = await self._calculate_creator_compatibility(
-                creator_profile, brand_id, target_audience
-            )
-            
-            # Assess risk factors
-            risk_factors = await self._assess_creator_risk_factors(
-                creator_profile, campaign_type, platform
+            # Predict metrics, compatibility and risk factors concurrently
+            predicted_performance, compatibility_score, risk_factors = await asyncio.gather(
+                self._predict_creator_metrics(
+                    creator_analysis, platform, content_type, budget, target_audience
+                ),
+                self._calculate_creator_compatibility(
+                    creator_profile, brand_id, target_audience
+                ),
+                self._assess_creator_risk_factors(
+                    creator_profile, campaign_type, platform
+                )
             )
             
             # Generate recommendations
@@ -323,6 +762,93 @@ class PerformancePredictionService:
             })
             raise PerformancePredictionError(f"Failed to predict creator performance: {str(e)}")
     
+    async def predict_content_performance_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict performance for many content variants at once
+        
+        Args:
+            items: Keyword arguments for predict_content_performance, one dict per variant
+            
+        Returns:
+            Performance prediction results, in input order
+        """
+        try:
+            if not items:
+                return []
+            
+            ai_logger.logger.info("Starting batch content performance prediction", count=len(items))
+            
+            analyses = await asyncio.gather(*(
+                self._analyze_content_characteristics(
+                    item["content_type"], item["platform"], item["content_description"],
+                    item.get("hashtags"), item.get("caption")
+                )
+                for item in items
+            ))
+            
+            # Stack per-item inputs and draw all random terms at once
+            n = len(items)
+            base_reach = np.fromiter((10000 if item.get("creator_profile") else 1000 for item in items), dtype=np.float64, count=n)
+            trending = np.fromiter((analysis["trending_potential"] for analysis in analyses), dtype=np.float64, count=n)
+            engagement_rates = 0.05 + self._rng.random(n) * 0.05
+            confidence_scores = 0.7 + self._rng.random(n) * 0.3
+            
+            performance_metrics = PerformanceMetricsView(
+                **_perf_metrics_batch(base_reach, trending, engagement_rates),
+                estimated_engagement_rate=engagement_rates,
+                confidence_score=confidence_scores
+            ).to_records()
+            all_risk_factors = _content_risks_batch(
+                np.fromiter((analysis["hashtag_count"] for analysis in analyses), dtype=np.int64, count=n),
+                np.fromiter((analysis["description_length"] for analysis in analyses), dtype=np.int64, count=n),
+                trending
+            )
+            success_probabilities = _success_prob_batch(
+                confidence_scores,
+                np.fromiter(map(len, all_risk_factors), dtype=np.int64, count=n),
+                _RISK_PENALTY_CONTENT
+            ).tolist()
+            
+            async def finish(
+                item: Dict[str, Any],
+                analysis: Dict[str, Any],
+                metrics: PerformanceMetrics,
+                risk_factors: List[str],
+                success_probability: float
+            ) -> Dict[str, Any]:
+                platform = item["platform"]
+                target_audience = item.get("target_audience")
+                optimal_timing, content_optimization = await asyncio.gather(
+                    self._calculate_optimal_timing(platform, target_audience, item["content_type"], item.get("posting_time")),
+                    self._generate_content_optimization(analysis, platform, target_audience, item.get("campaign_goals"))
+                )
+                return {
+                    "performance_metrics": metrics,
+                    "optimal_timing": optimal_timing,
+                    "content_optimization": content_optimization,
+                    "risk_factors": risk_factors,
+                    "success_probability": success_probability
+                }
+            
+            results = await asyncio.gather(*(
+                finish(*args)
+                for args in zip(items, analyses, performance_metrics, all_risk_factors, success_probabilities)
+            ))
+            
+            ai_logger.logger.info("Batch content performance prediction completed", count=n)
+            
+            return list(results)
+            
+        except Exception as e:
+            ai_logger.log_error(e, {
+                "count": len(items),
+                "operation": "predict_content_performance_batch"
+            })
+            raise PerformancePredictionError(f"Failed to predict content performance batch: {str(e)}")
+    
     async def get_historical_performance(
         self,
         user_id: str,
@@ -342,25 +868,47 @@ class PerformancePredictionService:
         Returns:
             Historical performance data
         """
+        series = await self.get_historical_series(user_id, platform, content_type, days)
+        return series.to_rows()
+    
+    async def get_historical_series(
+        self,
+        user_id: str,
+        platform: Optional[str] = None,
+        content_type: Optional[str] = None,
+        days: int = 30
+    ) -> HistoricalSeries:
+        """
+        Get historical performance data as columns
+        
+        Args:
+            user_id: User ID
+            platform: Optional platform filter
+            content_type: Optional content type filter
+            days: Number of days to look back
+            
+        Returns:
+            Historical performance series, most recent day first
+        """
         try:
+            if self._history is not None:
+                return self._history_series(user_id, platform, content_type, days)
+            
             # Mock implementation - in production, this would query a real database
-            historical_data = []
-            
-            for i in range(min(days, 30)):
-                data_point = {
-                    "date": (datetime.now() - timedelta(days=i)).isoformat(),
-                    "platform": platform or "instagram",
-                    "content_type": content_type or "post",
-                    "reach": 1000 + i * 100,
-                    "engagement_rate": 0.05 + i * 0.001,
-                    "likes": 50 + i * 5,
-                    "comments": 10 + i,
-                    "shares": 5 + i,
-                    "clicks": 20 + i * 2
-                }
-                historical_data.append(data_point)
+            idx = np.arange(max(min(days, 30), 0))
+            now = np.datetime64(datetime.now(), "us")
             
-            return historical_data
+            return HistoricalSeries(
+                platform=platform or "instagram",
+                content_type=content_type or "post",
+                date=now - idx.astype("timedelta64[D]"),
+                reach=1000 + idx * 100,
+                engagement_rate=0.05 + idx * 0.001,
+                likes=50 + idx * 5,
+                comments=10 + idx,
+                shares=5 + idx,
+                clicks=20 + idx * 2
+            )
             
         except Exception as e:
             ai_logger.log_error(e, {
@@ -369,6 +917,38 @@ class PerformancePredictionService:
             })
             raise PerformancePredictionError(f"Failed to get historical performance: {str(e)}")
     
+    def _history_series(
+        self,
+        user_id: str,
+        platform: Optional[str],
+        content_type: Optional[str],
+        days: int
+    ) -> HistoricalSeries:
+        """Filter the memory-mapped history table down to one user's recent rows"""
+        table = self._history
+        cutoff = pa.scalar(np.datetime64(datetime.now(), "us") - np.timedelta64(days, "D"), pa.timestamp("us"))
+        mask = pc.and_(pc.equal(table["user_id"], user_id), pc.greater_equal(table["date"], cutoff))
+        if platform:
+            mask = pc.and_(mask, pc.equal(table["platform"], platform))
+        if content_type:
+            mask = pc.and_(mask, pc.equal(table["content_type"], content_type))
+        rows = table.filter(mask).sort_by([("date", "descending")])
+        
+        def column(name: str, dtype: Any) -> np.ndarray:
+            return rows[name].to_numpy().astype(dtype, copy=False)
+        
+        return HistoricalSeries(
+            platform=platform or "all",
+            content_type=content_type or "all",
+            date=column("date", "datetime64[us]"),
+            reach=column("reach", np.int64),
+            engagement_rate=column("engagement_rate", np.float64),
+            likes=column("likes", np.int64),
+            comments=column("comments", np.int64),
+            shares=column("shares", np.int64),
+            clicks=column("clicks", np.int64)
+        )
+    
     async def _analyze_content_characteristics(
         self,
         content_type: str,
@@ -384,9 +964,9 @@ class PerformancePredictionService:
             "description_length": len(content_description),
             "hashtag_count": len(hashtags) if hashtags else 0,
             "caption_length": len(caption) if caption else 0,
-            "complexity_score": 0.5 + np.random.random() * 0.5,
-            "trending_potential": 0.3 + np.random.random() * 0.7,
-            "engagement_potential": 0.4 + np.random.random() * 0.6
+            "complexity_score": 0.5 + self._rand() * 0.5,
+            "trending_potential": 0.3 + self._rand() * 0.7,
+            "engagement_potential": 0.4 + self._rand() * 0.6
         }
     
     async def _predict_performance_metrics(
@@ -399,16 +979,12 @@ class PerformancePredictionService:
         """Predict performance metrics"""
         # Base metrics calculation
         base_reach = 10000 if creator_profile else 1000
-        engagement_rate = 0.05 + np.random.random() * 0.05
+        engagement_rate = 0.05 + self._rand() * 0.05
         
-        estimated_reach = int(base_reach * content_analysis["trending_potential"])
-        estimated_impressions = int(estimated_reach * 1.5)
-        estimated_likes = int(estimated_reach * engagement_rate)
-        estimated_comments = int(estimated_likes * 0.1)
-        estimated_shares = int(estimated_likes * 0.05)
-        estimated_saves = int(estimated_likes * 0.02)
-        estimated_clicks = int(estimated_reach * 0.02)
-        estimated_conversions = int(estimated_clicks * 0.1)
+        (
+            estimated_reach, estimated_impressions, estimated_likes, estimated_comments,
+            estimated_shares, estimated_saves, estimated_clicks, estimated_conversions
+        ) = _perf_metrics_kernel(base_reach, float(content_analysis["trending_potential"]), engagement_rate)
         
         return PerformanceMetrics(
             estimated_reach=estimated_reach,
@@ -420,7 +996,7 @@ class PerformancePredictionService:
             estimated_saves=estimated_saves,
             estimated_clicks=estimated_clicks,
             estimated_conversions=estimated_conversions,
-            confidence_score=0.7 + np.random.random() * 0.3
+            confidence_score=0.7 + self._rand() * 0.3
         )
     
     async def _calculate_optimal_timing(
@@ -431,23 +1007,15 @@ class PerformancePredictionService:
         posting_time: str
     ) -> OptimalTiming:
         """Calculate optimal posting timing"""
-        # Platform-specific optimal times
-        optimal_times = {
-            "instagram": ["18:00-20:00", "12:00-14:00"],
-            "youtube": ["19:00-21:00", "14:00-16:00"],
-            "tiktok": ["18:00-20:00", "21:00-23:00"],
-            "twitter": ["12:00-14:00", "17:00-19:00"]
-        }
-        
-        best_time = optimal_times.get(platform, ["18:00-20:00"])[0]
+        best_time, alternative_times, reasoning = _timing_for(platform)
         
         return OptimalTiming(
             best_posting_time=best_time,
             best_posting_day="Friday",
-            alternative_times=optimal_times.get(platform, ["18:00-20:00"]),
+            alternative_times=list(alternative_times),
             timezone="UTC",
-            reasoning=f"Optimal for {platform} audience engagement",
-            expected_performance_boost=0.2 + np.random.random() * 0.3
+            reasoning=reasoning,
+            expected_performance_boost=0.2 + self._rand() * 0.3
         )
     
     async def _generate_content_optimization(
@@ -459,12 +1027,12 @@ class PerformancePredictionService:
     ) -> ContentOptimization:
         """Generate content optimization suggestions"""
         return ContentOptimization(
-            hashtag_suggestions=[f"#{platform}_trending_{i}" for i in range(5)],
-            caption_improvements=["Add call-to-action", "Include emojis", "Ask questions"],
-            content_format_suggestions=["Use carousel posts", "Add stories", "Create reels"],
-            visual_elements=["High-quality images", "Brand colors", "Clear text overlay"],
-            call_to_action_suggestions=["Follow for more", "Tag friends", "Share your thoughts"],
-            expected_improvement=0.15 + np.random.random() * 0.25
+            hashtag_suggestions=_hashtag_suggestions(platform),
+            caption_improvements=_CAPTION_IMPROVEMENTS,
+            content_format_suggestions=_FORMAT_SUGGESTIONS,
+            visual_elements=_VISUAL_ELEMENTS,
+            call_to_action_suggestions=_CTA_SUGGESTIONS,
+            expected_improvement=0.15 + self._rand() * 0.25
         )
     
     async def _assess_content_risk_factors(
@@ -474,16 +1042,17 @@ class PerformancePredictionService:
         target_audience: str
     ) -> List[str]:
         """Assess content risk factors"""
+        too_many_hashtags, short_description, low_trending = _CONTENT_RISK_MESSAGES
         risk_factors = []
         
         if content_analysis["hashtag_count"] > 30:
-            risk_factors.append("Too many hashtags may reduce reach")
+            risk_factors.append(too_many_hashtags)
         
         if content_analysis["description_length"] < 50:
-            risk_factors.append("Short descriptions may reduce engagement")
+            risk_factors.append(short_description)
         
         if content_analysis["trending_potential"] < 0.3:
-            risk_factors.append("Low trending potential")
+            risk_factors.append(low_trending)
         
         return risk_factors
     
@@ -494,9 +1063,7 @@ class PerformancePredictionService:
         risk_factors: List[str]
     ) -> float:
         """Calculate success probability"""
-        base_probability = performance_metrics.confidence_score
-        risk_penalty = len(risk_factors) * 0.05
-        return max(0.1, base_probability - risk_penalty)
+        return max(_MIN_PROB, performance_metrics.confidence_score - len(risk_factors) * _RISK_PENALTY_CONTENT)
     
     async def _analyze_campaign_parameters(
         self,
@@ -512,7 +1079,7 @@ class PerformancePredictionService:
             "platform_count": len(platforms),
             "budget_per_day": budget / duration_days,
             "audience_size": target_audience.get("size", 1000000),
-            "complexity_score": 0.5 + np.random.random() * 0.5
+            "complexity_score": 0.5 + self._rand() * 0.5
         }
     
     async def _predict_campaign_metrics(
@@ -521,42 +1088,32 @@ class PerformancePredictionService:
         platforms: List[str],
         budget: float,
         duration_days: int
-    ) -> Dict[str, Any]:
+    ) -> CampaignMetrics:
         """Predict campaign metrics"""
-        audience_size = max(int(campaign_analysis.get("audience_size", 0)), 0)
-        base_reach = int(audience_size * 0.1)
+        audience_size = min(max(int(campaign_analysis.get("audience_size", 0)), 0), _MAX_AUDIENCE_SIZE)
         num_platforms = max(len(platforms or []), 1)
-        estimated_total_reach = max(int(base_reach * num_platforms), 0)
-        estimated_total_impressions = max(int(estimated_total_reach * 1.5), 0)
-        estimated_engagement_rate = float(0.05 + float(np.random.random()) * 0.05)
-        estimated_clicks = max(int(estimated_total_reach * 0.02), 0)
-        estimated_conversions = max(int(estimated_clicks * 0.1), 0)
+        estimated_engagement_rate = 0.05 + self._rand() * 0.05
         safe_budget = float(budget or 0.0)
+        
+        # The kernel already returns Python ints and floats, so the results
+        # are stored as-is
+        (
+            estimated_total_reach, estimated_total_impressions, estimated_clicks, estimated_conversions,
+            estimated_roi, estimated_cpm, estimated_cpc, estimated_cpa
+        ) = _campaign_metrics_kernel(audience_size, num_platforms, safe_budget)
 
-        # Guard against division by zero/NaN and return 0 when invalid
-        def safe_div(n: float, d: float) -> float:
-            try:
-                return float(n) / float(d) if d not in (0, 0.0) else 0.0
-            except Exception:
-                return 0.0
-
-        estimated_roi = safe_div(estimated_conversions * 50.0, safe_budget) if safe_budget > 0 else 0.0
-        estimated_cpm = safe_div(safe_budget, (estimated_total_impressions / 1000.0)) if estimated_total_impressions > 0 else 0.0
-        estimated_cpc = safe_div(safe_budget, estimated_clicks) if estimated_clicks > 0 else 0.0
-        estimated_cpa = safe_div(safe_budget, estimated_conversions) if estimated_conversions > 0 else 0.0
-
-        return {
-            "estimated_total_reach": int(estimated_total_reach),
-            "estimated_total_impressions": int(estimated_total_impressions),
-            "estimated_engagement_rate": float(estimated_engagement_rate),
-            "estimated_clicks": int(estimated_clicks),
-            "estimated_conversions": int(estimated_conversions),
-            "estimated_roi": float(estimated_roi),
-            "estimated_cpm": float(estimated_cpm),
-            "estimated_cpc": float(estimated_cpc),
-            "estimated_cpa": float(estimated_cpa),
-            "confidence_score": float(0.7 + float(np.random.random()) * 0.3)
-        }
+        return CampaignMetrics(
+            estimated_total_reach=estimated_total_reach,
+            estimated_total_impressions=estimated_total_impressions,
+            estimated_engagement_rate=estimated_engagement_rate,
+            estimated_clicks=estimated_clicks,
+            estimated_conversions=estimated_conversions,
+            estimated_roi=estimated_roi,
+            estimated_cpm=estimated_cpm,
+            estimated_cpc=estimated_cpc,
+            estimated_cpa=estimated_cpa,
+            confidence_score=0.7 + self._rand() * 0.3
+        )
     
     async def _calculate_platform_breakdown(
         self,
@@ -568,14 +1125,22 @@ class PerformancePredictionService:
         """Calculate platform breakdown"""
         breakdown = {}
         budget_per_platform = budget / len(platforms)
+        engagement_rates = (0.05 + self._rng.random(len(platforms)) * 0.05).tolist()
+        
+        # Only the engagement draw varies per platform; the audience-derived
+        # counts are the same for every entry, so compute them once
+        audience_size = target_audience.get("size", 1000000)
+        estimated_reach = int(audience_size * 0.1)
+        estimated_clicks = int(audience_size * 0.01)
+        estimated_conversions = int(audience_size * 0.001)
         
-        for platform in platforms:
+        for platform, engagement_rate in zip(platforms, engagement_rates):
             breakdown[platform] = {
                 "allocated_budget": budget_per_platform,
-                "estimated_reach": int(target_audience.get("size", 1000000) * 0.1),
-                "estimated_engagement_rate": 0.05 + np.random.random() * 0.05,
-                "estimated_clicks": int(target_audience.get("size", 1000000) * 0.01),
-                "estimated_conversions": int(target_audience.get("size", 1000000) * 0.001)
+                "estimated_reach": estimated_reach,
+                "estimated_engagement_rate": engagement_rate,
+                "estimated_clicks": estimated_clicks,
+                "estimated_conversions": estimated_conversions
             }
         
         return breakdown
@@ -584,17 +1149,12 @@ class PerformancePredictionService:
         self,
         platforms: List[str],
         budget: float,
-        campaign_metrics: Dict[str, Any]
+        campaign_metrics: CampaignMetrics
     ) -> Dict[str, float]:
         """Optimize budget allocation across platforms"""
         # Simple equal allocation for now
-        allocation = {}
         budget_per_platform = budget / len(platforms)
-        
-        for platform in platforms:
-            allocation[platform] = budget_per_platform
-        
-        return allocation
+        return dict.fromkeys(platforms, budget_per_platform)
     
     async def _assess_campaign_risks(
         self,
@@ -612,17 +1172,23 @@ class PerformancePredictionService:
     
     async def _calculate_campaign_success_probability(
         self,
-        campaign_metrics: Dict[str, Any],
+        campaign_metrics: CampaignMetrics,
         risk_assessment: Dict[str, Any]
     ) -> float:
         """Calculate campaign success probability"""
-        base_probability = campaign_metrics["confidence_score"]
         risk_count = sum(1 for risk in risk_assessment.values() if risk == "High")
-        risk_penalty = risk_count * 0.1
-        return max(0.1, base_probability - risk_penalty)
+        return max(_MIN_PROB, campaign_metrics.confidence_score - risk_count * _RISK_PENALTY_CAMPAIGN)
+    
+    async def _get_creator_profile(self, creator_id: str) -> Optional[CreatorStats]:
+        """Get creator profile, served from cache when fresh"""
+        async def load() -> Optional[CreatorStats]:
+            profile = await self._fetch_creator_profile(creator_id)
+            return CreatorStats.from_profile(profile) if profile else None
+        
+        return await self._cached_computation(_creator_profile_cache, ("creator", creator_id), load)
     
-    async def _get_creator_profile(self, creator_id: str) -> Optional[Dict[str, Any]]:
-        """Get creator profile"""
+    async def _fetch_creator_profile(self, creator_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch creator profile"""
         # Mock implementation
         return {
             "creator_id": creator_id,
@@ -640,17 +1206,17 @@ class PerformancePredictionService:
     
     async def _analyze_creator_capabilities(
         self,
-        creator_profile: Dict[str, Any],
+        creator_profile: CreatorStats,
         platform: str,
         content_type: str
     ) -> Dict[str, Any]:
         """Analyze creator capabilities"""
         return {
-            "platform_experience": creator_profile["platforms"],
-            "audience_size": creator_profile["follower_count"].get(platform, 0),
-            "engagement_rate": creator_profile["engagement_rate"].get(platform, 0.03),
-            "content_expertise": creator_profile["content_categories"],
-            "style_match": 0.7 + np.random.random() * 0.3
+            "platform_experience": creator_profile.profile["platforms"],
+            "audience_size": creator_profile.followers(platform),
+            "engagement_rate": creator_profile.engagement(platform, 0.03),
+            "content_expertise": creator_profile.profile["content_categories"],
+            "style_match": 0.7 + self._rand() * 0.3
         }
     
     async def _predict_creator_metrics(
@@ -665,36 +1231,40 @@ class PerformancePredictionService:
         base_reach = creator_analysis["audience_size"]
         engagement_rate = creator_analysis["engagement_rate"]
         
+        estimated_reach, estimated_engagement, estimated_clicks, estimated_conversions = _creator_metrics_kernel(
+            float(base_reach), float(engagement_rate)
+        )
+        
         return {
-            "estimated_reach": int(base_reach * 0.8),
-            "estimated_engagement": int(base_reach * engagement_rate),
-            "estimated_clicks": int(base_reach * 0.02),
-            "estimated_conversions": int(base_reach * 0.001),
-            "estimated_roi": (int(base_reach * 0.001) * 50) / budget
+            "estimated_reach": estimated_reach,
+            "estimated_engagement": estimated_engagement,
+            "estimated_clicks": estimated_clicks,
+            "estimated_conversions": estimated_conversions,
+            "estimated_roi": (estimated_conversions * 50) / budget
         }
     
     async def _calculate_creator_compatibility(
         self,
-        creator_profile: Dict[str, Any],
+        creator_profile: CreatorStats,
         brand_id: str,
         target_audience: Dict[str, Any]
     ) -> float:
         """Calculate creator compatibility score"""
-        return 0.7 + np.random.random() * 0.3
+        return 0.7 + self._rand() * 0.3
     
     async def _assess_creator_risk_factors(
         self,
-        creator_profile: Dict[str, Any],
+        creator_profile: CreatorStats,
         campaign_type: str,
         platform: str
     ) -> List[str]:
         """Assess creator risk factors"""
         risk_factors = []
         
-        if creator_profile["follower_count"].get(platform, 0) < 10000:
+        if creator_profile.followers(platform) < 10000:
             risk_factors.append("Low follower count")
         
-        if creator_profile["engagement_rate"].get(platform, 0) < 0.03:
+        if creator_profile.engagement(platform, 0.0) < 0.03:
             risk_factors.append("Low engagement rate")
         
         return risk_factors
@@ -1,26 +1,343 @@
 """
 RAG (Retrieval-Augmented Generation) service for AI-powered insights
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union, Awaitable, Callable, Set
 import asyncio
-import time
+import hashlib
+import re
+import weakref
+from time import perf_counter_ns
 from dataclasses import dataclass
+from functools import lru_cache
+import json
+import numpy as np
+from cachetools import LRUCache
+
+# Optional orjson import for fast compact serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from src.core.config import settings
 from src.core.logger import ai_logger, log_ai_model_call
 from src.core.exceptions import AIServiceException, EmbeddingError, VectorDatabaseError
-from src.models.multi_llm_client import MultiLLMClient
+from src.models.multi_llm_client import MultiLLMClient, AIResponse
 from src.models.embedding_model import EmbeddingModel
 from src.models.vector_store import get_vector_store
+from src.models.prompt_cache import get_prompt_cache
 from src.utils.helpers import clean_text, extract_keywords
 
 
+# Recommendation prompt templates and static fallbacks, by recommendation kind
+_RECOMMENDATION_PROMPTS = {
+    "trend": "Provide 5 concise, actionable social media recommendations based on this trend analysis: \n%s\nReturn a bullet list.",
+    "performance": "Provide 5 concise recommendations to improve predicted performance: \n%s\nReturn a bullet list.",
+    "campaign": "Provide 5 concise campaign recommendations based on this analysis: \n%s\nReturn a bullet list."
+}
+_RECOMMENDATION_FALLBACKS = {
+    "trend": (
+        "Focus on consistent posting during peak times.",
+        "Leverage trending hashtags with relevance.",
+        "Experiment with 2-3 content formats from trending content.",
+    ),
+    "performance": (
+        "Refine caption with a strong CTA.",
+        "Test posting at the top predicted time.",
+        "Reduce number of hashtags to most relevant.",
+    ),
+    "campaign": (
+        "Allocate budget to top-performing platform.",
+        "Iterate creatives weekly based on metrics.",
+        "Monitor frequency caps to avoid fatigue.",
+    )
+}
+
+# Generic suggestions served without RAG when no content is given; (hashtag, category, estimated reach)
+_GENERIC_HASHTAG_SEEDS = {
+    "instagram": (("#instagood", "general", 50000), ("#photooftheday", "general", 40000), ("#reels", "format", 30000)),
+    "twitter": (("#trending", "general", 20000), ("#thread", "format", 8000), ("#news", "general", 15000)),
+    "linkedin": (("#leadership", "business", 12000), ("#careers", "business", 9000), ("#innovation", "business", 10000)),
+    "tiktok": (("#fyp", "general", 80000), ("#foryou", "general", 70000), ("#viral", "general", 60000)),
+    "youtube": (("#shorts", "format", 40000), ("#youtube", "general", 25000), ("#tutorial", "format", 15000)),
+    "facebook": (("#community", "general", 10000), ("#family", "lifestyle", 8000), ("#local", "general", 6000)),
+}
+_GENERIC_HASHTAGS_BY_PLATFORM: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    platform: tuple(
+        {
+            "hashtag": tag,
+            "popularity_score": 0.7,
+            "relevance_score": 0.5,
+            "competition_level": "high",
+            "estimated_reach": reach,
+            "category": category
+        }
+        for tag, category, reach in seeds
+    )
+    for platform, seeds in _GENERIC_HASHTAG_SEEDS.items()
+}
+_GENERIC_CAPTION_TEXTS = {
+    "professional": ("Here is what we learned this week.", "Key insights worth sharing with your network."),
+    "casual": ("Just dropping this here.", "A little something for your feed today."),
+    "humorous": ("Not saying this is genius, but it kind of is.", "Plot twist: it actually worked."),
+    "inspirational": ("Every big result starts with a small step.", "Keep going, progress adds up."),
+    "educational": ("Three things you should know about this.", "A quick guide to getting started."),
+    "friendly": ("Hope this brightens your day!", "We made this with you in mind."),
+    "authoritative": ("Here is the definitive take on this.", "The data is clear on what works."),
+}
+_GENERIC_CAPTIONS_BY_TONE: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    tone: tuple(
+        {
+            "caption": text,
+            "tone": tone,
+            "length": len(text),
+            "engagement_potential": 0.5,
+            "readability_score": 0.9,
+            "emoji_count": 0
+        }
+        for text in texts
+    )
+    for tone, texts in _GENERIC_CAPTION_TEXTS.items()
+}
+_GENERIC_ENGAGEMENT = {
+    "predicted_likes": 500,
+    "predicted_comments": 20,
+    "predicted_shares": 10,
+    "predicted_reach": 2500,
+    "confidence_score": 0.3,
+    "tokens_used": 0
+}
+
+# Bounds concurrent LLM requests across the process
+_llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+# In-flight LLM calls by request digest, so concurrent identical requests share one call
+_inflight_llm: Dict[bytes, "asyncio.Future[AIResponse]"] = {}
+
+# Retrieval-query embeddings keyed by text digest; the (content_type, platform,
+# audience) combinations behind these queries recur constantly
+_query_embedding_cache = LRUCache(maxsize=4096)
+
+# Documents retrieved per context query
+_CONTEXT_TOP_K = 5
+
+# Retrieval searches arriving within this window are sent to the store as one batch
+_SEARCH_BATCH_WINDOW = 0.005
+_SEARCH_MAX_BATCH = 32
+
+
+class _SearchCoalescer:
+    """Collects concurrent vector searches against one store and runs them as a batch"""
+    
+    def __init__(self, vector_store):
+        self.vector_store = vector_store
+        self._pending: List[Tuple[np.ndarray, int, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Running flushes; the loop only keeps weak references to tasks
+        self._flushes: Set[asyncio.Task] = set()
+    
+    async def search(self, query_vector: np.ndarray, k: int) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query_vector, k, future))
+        if len(self._pending) >= _SEARCH_MAX_BATCH:
+            self._schedule_flush(loop, 0)
+        elif self._timer is None:
+            self._schedule_flush(loop, _SEARCH_BATCH_WINDOW)
+        return await future
+    
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_later(delay, self._start_flush, loop)
+    
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending[:_SEARCH_MAX_BATCH], self._pending[_SEARCH_MAX_BATCH:]
+        self._timer = None
+        if self._pending:
+            self._schedule_flush(asyncio.get_running_loop(), 0)
+        if not batch:
+            return
+        # One query matrix searched at the largest k; each caller keeps its own top k
+        max_k = max(k for _, k, _ in batch)
+        try:
+            results = await self.vector_store.search_batch(np.stack([vector for vector, _, _ in batch]), max_k)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, k, future), hits in zip(batch, results):
+            if not future.done():
+                future.set_result(hits[:k])
+
+
+_search_coalescers: "weakref.WeakKeyDictionary[Any, _SearchCoalescer]" = weakref.WeakKeyDictionary()
+
+
+def _compact_dump(obj: Any, limit: int = 2000) -> str:
+    """Compact JSON of obj for prompts, truncated to limit characters"""
+    if ORJSON_AVAILABLE:
+        try:
+            text = orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode("utf-8", errors="replace")
+            return text[:limit]
+        except TypeError:
+            pass
+    try:
+        return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False)[:limit]
+    except (TypeError, ValueError):
+        return str(obj)[:limit]
+
+
+# One non-blank line of a bullet list, without its bullet marker and padding
+_BULLET_RE = re.compile(r"^[ \t\-*\u2022\u00b7]*([^\s\-*\u2022\u00b7].*?)[ \t\r]*$", re.M)
+
+
+def _parse_bullets(text: str, limit: int = 5) -> List[str]:
+    """Items of a bullet list, at most limit"""
+    return _BULLET_RE.findall(text)[:limit]
+
+
+def _truncate_at_word(text: str, max_length: int) -> str:
+    """Cut text at the last space within max_length and mark the cut with an ellipsis"""
+    cut = text.rfind(" ", 0, max_length)
+    return text[:cut if cut >= 0 else max_length] + "..."
+
+
+def _top_by_score(items: List[Dict[str, Any]], scores: np.ndarray, k: int) -> List[Dict[str, Any]]:
+    """The k items with the highest scores, best first"""
+    if k <= 0:
+        return []
+    if k < len(items):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(items))
+    idx = idx[np.argsort(-scores[idx], kind="stable")]
+    return [items[i] for i in idx.tolist()]
+
+
+def _truncate_or_default(text: Optional[str], n: int, default: str = "No content provided") -> str:
+    """First n characters of text, or default when text is empty"""
+    return text[:n] if text else default
+
+
+@lru_cache(maxsize=2048)
+def _hashtag_query(
+    content_head: str,
+    content_type: str,
+    platform: str,
+    target_audience: Optional[str],
+    goals: Tuple[str, ...]
+) -> str:
+    """Hashtag generation query; arguments are pre-truncated and hashable so repeats are cache hits"""
+    query_parts = [
+        f"Generate hashtag suggestions for {content_type} content on {platform}",
+        f"Content: {content_head}",
+        f"Target audience: {target_audience or 'General audience'}",
+        f"Goals: {', '.join(goals) if goals else 'General engagement'}"
+    ]
+    return ". ".join(query_parts)
+
+
+@lru_cache(maxsize=2048)
+def _caption_query(
+    content_head: str,
+    content_type: str,
+    platform: str,
+    tone: str,
+    target_audience: Optional[str],
+    goals: Tuple[str, ...]
+) -> str:
+    """Caption generation query"""
+    query_parts = [
+        f"Generate caption suggestions for {content_type} content on {platform}",
+        f"Tone: {tone}",
+        f"Content: {content_head}",
+        f"Target audience: {target_audience or 'General audience'}",
+        f"Goals: {', '.join(goals) if goals else 'General engagement'}"
+    ]
+    return ". ".join(query_parts)
+
+
+@lru_cache(maxsize=2048)
+def _rewrite_query(
+    field: str,
+    content_head: str,
+    platform: str,
+    content_type: str,
+    tone: str,
+    goals: Tuple[str, ...],
+    max_length: int
+) -> str:
+    """Content rewriting query"""
+    query_parts = [
+        f"Rewrite the {field} for a {content_type} on {platform}",
+        f"Current content: {content_head}",
+        f"Tone: {tone}",
+        f"Platform: {platform}",
+        f"Maximum length: {max_length} characters",
+        f"Goals: {', '.join(goals) if goals else 'General engagement'}",
+        f"Make it more engaging, platform-appropriate, and aligned with the specified tone"
+    ]
+    return ". ".join(query_parts)
+
+
 @dataclass
+class ContextBatch:
+    """Context documents as parallel columns, so ranking runs on contiguous arrays"""
+    contents: List[str]
+    metadatas: List[Dict[str, Any]]
+    embeddings: Optional[np.ndarray]  # (n, d) float32, None when not embedded
+    scores: np.ndarray  # (n,) float32
+    
+    def __len__(self) -> int:
+        return len(self.contents)
+    
+    @classmethod
+    def empty(cls) -> "ContextBatch":
+        return cls([], [], None, np.empty(0, dtype=np.float32))
+    
+    def take(self, idx: np.ndarray) -> "ContextBatch":
+        """Rows at the given positions, in that order"""
+        positions = idx.tolist()
+        return ContextBatch(
+            [self.contents[i] for i in positions],
+            [self.metadatas[i] for i in positions],
+            self.embeddings[idx] if self.embeddings is not None else None,
+            self.scores[idx]
+        )
+    
+    def top_k(self, k: int) -> "ContextBatch":
+        """The k highest-scoring documents, best first"""
+        if k <= 0:
+            return ContextBatch.empty()
+        if k < len(self):
+            idx = np.argpartition(self.scores, -k)[-k:]
+        else:
+            idx = np.arange(len(self))
+        return self.take(idx[np.argsort(-self.scores[idx], kind="stable")])
+    
+    def to_documents(self) -> List[Dict[str, Any]]:
+        """Materialize per-document dicts"""
+        return [
+            {"content": content, "metadata": metadata, "score": score}
+            for content, metadata, score in zip(self.contents, self.metadatas, self.scores.tolist())
+        ]
+
+
+@dataclass(frozen=True, slots=True)
 class RAGContext:
     """Context for RAG operations"""
     user_id: str
     query: str
-    context_documents: List[Dict[str, Any]]
+    context_documents: Union[List[Dict[str, Any]], ContextBatch]
     max_tokens: int = 4000
     temperature: float = 0.7
 
@@ -43,10 +360,16 @@ class RAGService:
             from src.models.vector_store import FAISSVectorStore
             self.vector_store = FAISSVectorStore()
         self.logger = ai_logger
+        self._vector_store_lock = asyncio.Lock()
     
     async def _ensure_vector_store(self):
-        """Ensure vector store is initialized"""
-        if self.vector_store is None:
+        """Ensure vector store is initialized, once even under concurrent callers"""
+        if self.vector_store is not None:
+            return
+        
+        async with self._vector_store_lock:
+            if self.vector_store is not None:
+                return
             try:
                 self.vector_store = await get_vector_store()
             except Exception as e:
@@ -55,6 +378,94 @@ class RAGService:
                 from src.models.vector_store import FAISSVectorStore
                 self.vector_store = FAISSVectorStore()
     
+    async def _generate_text_cached(self, prompt: str, semantic: bool = False, **kwargs) -> AIResponse:
+        """
+        LLM call served from the shared prompt cache when the same prompt was seen, or with
+        semantic, a near-identical one. Only opt in to semantic where the answer does not hinge
+        on exact wording or numbers: "20% off" and "30% off" embed as near duplicates, and so do
+        two campaigns' data dumps that differ only in budget or reach.
+        """
+        async def generate() -> AIResponse:
+            return await self._generate_deduplicated(prompt, **kwargs)
+        
+        if not settings.enable_prompt_cache:
+            return await generate()
+        
+        embed = self.embedding_model.embed_text if semantic and self.embedding_model else None
+        return await get_prompt_cache().get_or_compute(prompt, kwargs, generate, embed)
+    
+    async def _generate_deduplicated(self, prompt: str, **kwargs) -> AIResponse:
+        """LLM call joined with any identical call already in flight"""
+        payload = json.dumps({"prompt": prompt, **kwargs}, sort_keys=True, default=str)
+        key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+        
+        task = _inflight_llm.get(key)
+        if task is None:
+            async def call() -> AIResponse:
+                async with _llm_semaphore:
+                    return await self.llm_client.generate_text(prompt=prompt, **kwargs)
+            
+            task = asyncio.ensure_future(call())
+            _inflight_llm[key] = task
+            task.add_done_callback(lambda _: _inflight_llm.pop(key, None))
+        # Shielded so one caller's cancellation does not cancel the others' call
+        return await asyncio.shield(task)
+    
+    async def _embed_cached(self, text: str) -> Optional[np.ndarray]:
+        """Embedding of a retrieval query, memoized in a process-wide LRU; None without an embedding model"""
+        if self.embedding_model is None:
+            return None
+        
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        vector = _query_embedding_cache.get(key)
+        if vector is None:
+            vector = np.asarray(await self.embedding_model.embed_text(text), dtype=np.float32)
+            _query_embedding_cache[key] = vector
+        return vector
+    
+    async def _search_context(self, query: str, top_k: int = _CONTEXT_TOP_K) -> ContextBatch:
+        """Vector store documents most similar to a retrieval query"""
+        try:
+            await self._ensure_vector_store()
+            # Skip the embedding call while there is nothing to search
+            if await self.vector_store.get_document_count() == 0:
+                return ContextBatch.empty()
+            
+            query_vector = await self._embed_cached(query)
+            if query_vector is None:
+                return ContextBatch.empty()
+            
+            coalescer = _search_coalescers.get(self.vector_store)
+            if coalescer is None:
+                coalescer = _search_coalescers[self.vector_store] = _SearchCoalescer(self.vector_store)
+            results = await coalescer.search(query_vector, top_k)
+            return ContextBatch(
+                contents=[result.document.content for result in results],
+                metadatas=[result.document.metadata or {} for result in results],
+                embeddings=None,
+                scores=np.fromiter((result.score for result in results), dtype=np.float32, count=len(results))
+            )
+        except Exception as e:
+            # Generation proceeds without retrieved context
+            self.logger.log_error(e, {"operation": "search_context"})
+            return ContextBatch.empty()
+    
+    async def _query_with_context(
+        self,
+        build_query: Callable[[], str],
+        retrieval: Awaitable[ContextBatch]
+    ) -> Tuple[str, ContextBatch]:
+        """Start retrieval, build the generation query while it is in flight, and return both"""
+        task = asyncio.ensure_future(retrieval)
+        # Yield once so retrieval issues its embedding and search before the query is built
+        await asyncio.sleep(0)
+        try:
+            query = build_query()
+        except BaseException:
+            task.cancel()
+            raise
+        return query, await task
+    
     async def generate_competitor_insights(
         self, 
         analysis_results: Dict[str, Any],
@@ -62,10 +473,10 @@ class RAGService:
     ) -> Dict[str, Any]:
         """Generate AI-powered insights from competitor analysis results"""
         try:
-            start_time = time.time()
+            t0 = perf_counter_ns()
             
             # Prepare context for RAG
-            context_documents = self._prepare_competitor_context(analysis_results)
+            context_documents = self._prepare_competitor_context_batch(analysis_results)
             
             # Create RAG context
             rag_context = RAGContext(
@@ -77,7 +488,7 @@ class RAGService:
             # Generate insights using RAG
             insights = await self._generate_insights_with_rag(rag_context)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="competitor_insights_generation",
                 model=settings.primary_ai_provider,
@@ -102,15 +513,17 @@ class RAGService:
         max_suggestions: int = 10
     ) -> List[Dict[str, Any]]:
         """Generate hashtag suggestions using RAG"""
+        if not content:
+            generic = _GENERIC_HASHTAGS_BY_PLATFORM.get(platform, _GENERIC_HASHTAGS_BY_PLATFORM["instagram"])
+            return [dict(entry) for entry in generic[:max_suggestions]]
+        
         try:
-            start_time = time.time()
-            
-            # Prepare query for hashtag generation
-            query = self._build_hashtag_query(content, content_type, platform, target_audience, goals)
+            t0 = perf_counter_ns()
             
-            # Retrieve relevant context from vector store
-            context_documents = await self._retrieve_hashtag_context(
-                content_type, platform, target_audience
+            # Build the hashtag query while relevant context is retrieved from the vector store
+            query, context_documents = await self._query_with_context(
+                lambda: self._build_hashtag_query(content, content_type, platform, target_audience, goals),
+                self._retrieve_hashtag_context(content_type, platform, target_audience)
             )
             
             # Create RAG context
@@ -124,7 +537,7 @@ class RAGService:
             # Generate hashtag suggestions
             suggestions = await self._generate_hashtag_suggestions_with_rag(rag_context, max_suggestions)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="hashtag_suggestions_generation",
                 model=settings.primary_ai_provider,
@@ -133,7 +546,7 @@ class RAGService:
                 success=True
             )
             
-            return suggestions.get("hashtags", [])
+            return _top_by_score(suggestions["hashtags"], suggestions["_scores"], max_suggestions)
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "generate_hashtag_suggestions"})
@@ -150,15 +563,17 @@ class RAGService:
         max_suggestions: int = 10
     ) -> List[Dict[str, Any]]:
         """Generate caption suggestions using RAG"""
+        if not content:
+            generic = _GENERIC_CAPTIONS_BY_TONE.get(tone, _GENERIC_CAPTIONS_BY_TONE["professional"])
+            return [dict(entry) for entry in generic[:max_suggestions]]
+        
         try:
-            start_time = time.time()
+            t0 = perf_counter_ns()
             
-            # Prepare query for caption generation
-            query = self._build_caption_query(content, content_type, platform, tone, target_audience, goals)
-            
-            # Retrieve relevant context
-            context_documents = await self._retrieve_caption_context(
-                content_type, platform, tone, target_audience
+            # Build the caption query while relevant context is retrieved
+            query, context_documents = await self._query_with_context(
+                lambda: self._build_caption_query(content, content_type, platform, tone, target_audience, goals),
+                self._retrieve_caption_context(content_type, platform, tone, target_audience)
             )
             
             # Create RAG context
@@ -172,7 +587,7 @@ class RAGService:
             # Generate caption suggestions
             suggestions = await self._generate_caption_suggestions_with_rag(rag_context, max_suggestions)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="caption_suggestions_generation",
                 model=settings.primary_ai_provider,
@@ -196,7 +611,7 @@ class RAGService:
     ) -> Dict[str, Any]:
         """Generate optimal posting time suggestions"""
         try:
-            start_time = time.time()
+            t0 = perf_counter_ns()
             
             # Retrieve user's historical posting data and platform-specific insights
             context_documents = await self._retrieve_posting_time_context(
@@ -214,7 +629,7 @@ class RAGService:
             # Generate posting time suggestions
             suggestions = await self._generate_posting_time_suggestions_with_rag(rag_context)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="posting_time_suggestions_generation",
                 model=settings.primary_ai_provider,
@@ -240,7 +655,7 @@ class RAGService:
     ) -> List[Dict[str, Any]]:
         """Generate content ideas using RAG"""
         try:
-            start_time = time.time()
+            t0 = perf_counter_ns()
             
             # Retrieve trending content and successful content patterns
             context_documents = await self._retrieve_content_ideas_context(
@@ -258,7 +673,7 @@ class RAGService:
             # Generate content ideas
             ideas = await self._generate_content_ideas_with_rag(rag_context, max_suggestions)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="content_ideas_generation",
                 model=settings.primary_ai_provider,
@@ -267,7 +682,7 @@ class RAGService:
                 success=True
             )
             
-            return ideas.get("content_ideas", [])
+            return _top_by_score(ideas["content_ideas"], ideas["_scores"], max_suggestions)
             
         except Exception as e:
             self.logger.log_error(e, {"operation": "generate_content_ideas"})
@@ -282,8 +697,11 @@ class RAGService:
         target_audience: Optional[str]
     ) -> Dict[str, Any]:
         """Predict engagement for content using RAG"""
+        if not content and not hashtags:
+            return dict(_GENERIC_ENGAGEMENT)
+        
         try:
-            start_time = time.time()
+            t0 = perf_counter_ns()
             
             # Retrieve similar content performance data
             context_documents = await self._retrieve_engagement_context(
@@ -301,7 +719,7 @@ class RAGService:
             # Generate engagement prediction
             prediction = await self._generate_engagement_prediction_with_rag(rag_context)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="engagement_prediction",
                 model=settings.primary_ai_provider,
@@ -343,20 +761,7 @@ class RAGService:
         user_id: str
     ) -> List[str]:
         """Generate simple recommendations based on trend analysis using the active LLM."""
-        try:
-            prompt = (
-                "Provide 5 concise, actionable social media recommendations based on this trend analysis: \n"
-                f"{str(trend_analysis)[:2000]}\nReturn a bullet list."
-            )
-            result = await self.llm_client.generate_text(prompt=prompt, provider="gemini", max_tokens=300)
-            lines = [line.strip("- ") for line in result.get("content", "").splitlines() if line.strip()]
-            return lines[:5] or ["Focus on consistent posting during peak times.", "Leverage trending hashtags with relevance."]
-        except Exception:
-            return [
-                "Focus on consistent posting during peak times.",
-                "Leverage trending hashtags with relevance.",
-                "Experiment with 2-3 content formats from trending content.",
-            ]
+        return await self._generate_recommendations("trend", trend_analysis)
 
     async def generate_performance_recommendations(
         self,
@@ -364,20 +769,7 @@ class RAGService:
         user_id: str
     ) -> List[str]:
         """Generate simple recommendations based on performance prediction."""
-        try:
-            prompt = (
-                "Provide 5 concise recommendations to improve predicted performance: \n"
-                f"{str(prediction)[:2000]}\nReturn a bullet list."
-            )
-            result = await self.llm_client.generate_text(prompt=prompt, provider="gemini", max_tokens=300)
-            lines = [line.strip("- ") for line in result.get("content", "").splitlines() if line.strip()]
-            return lines[:5] or ["Refine caption with a strong CTA.", "Test posting at the top predicted time."]
-        except Exception:
-            return [
-                "Refine caption with a strong CTA.",
-                "Test posting at the top predicted time.",
-                "Reduce number of hashtags to most relevant.",
-            ]
+        return await self._generate_recommendations("performance", prediction)
 
     async def generate_campaign_recommendations(
         self,
@@ -385,20 +777,31 @@ class RAGService:
         user_id: str
     ) -> List[str]:
         """Generate simple recommendations for campaigns."""
+        return await self._generate_recommendations("campaign", prediction)
+    
+    async def generate_all_recommendations(
+        self,
+        trend_analysis: Dict[str, Any],
+        prediction: Dict[str, Any],
+        user_id: str
+    ) -> Dict[str, List[str]]:
+        """Generate trend, performance and campaign recommendations with concurrent LLM calls"""
+        trend, performance, campaign = await asyncio.gather(
+            self._generate_recommendations("trend", trend_analysis),
+            self._generate_recommendations("performance", prediction),
+            self._generate_recommendations("campaign", prediction)
+        )
+        return {"trend": trend, "performance": performance, "campaign": campaign}
+    
+    async def _generate_recommendations(self, kind: str, data: Dict[str, Any]) -> List[str]:
+        """Bullet-list recommendations from the LLM, with static fallbacks"""
+        fallback = _RECOMMENDATION_FALLBACKS[kind]
         try:
-            prompt = (
-                "Provide 5 concise campaign recommendations based on this analysis: \n"
-                f"{str(prediction)[:2000]}\nReturn a bullet list."
-            )
-            result = await self.llm_client.generate_text(prompt=prompt, provider="gemini", max_tokens=300)
-            lines = [line.strip("- ") for line in result.get("content", "").splitlines() if line.strip()]
-            return lines[:5] or ["Allocate budget to top-performing platform.", "Iterate creatives weekly based on metrics."]
+            prompt = _RECOMMENDATION_PROMPTS[kind] % _compact_dump(data)
+            result = await self._generate_text_cached(prompt, provider="gemini", max_tokens=300)
+            return _parse_bullets(result.get("content", "")) or list(fallback[:2])
         except Exception:
-            return [
-                "Allocate budget to top-performing platform.",
-                "Iterate creatives weekly based on metrics.",
-                "Monitor frequency caps to avoid fatigue.",
-            ]
+            return list(fallback)
     
     # Private helper methods
     
@@ -409,12 +812,24 @@ class RAGService:
         for competitor, data in analysis_results.items():
             if isinstance(data, dict):
                 context_documents.append({
-                    "content": f"Competitor {competitor}: {str(data)}",
+                    "content": f"Competitor {competitor}: {_compact_dump(data, 4000)}",
                     "metadata": {"type": "competitor_analysis", "competitor": competitor}
                 })
         
         return context_documents
     
+    def _prepare_competitor_context_batch(self, analysis_results: Dict[str, Any]) -> ContextBatch:
+        """Competitor context as a ContextBatch"""
+        context_documents = self._prepare_competitor_context(analysis_results)
+        # Not embedded: nothing downstream reads the vectors, so the embedding
+        # request would only add latency; embed_texts batches them when needed
+        return ContextBatch(
+            contents=[doc["content"] for doc in context_documents],
+            metadatas=[doc["metadata"] for doc in context_documents],
+            embeddings=None,
+            scores=np.zeros(len(context_documents), dtype=np.float32)
+        )
+    
     def _build_hashtag_query(
         self,
         content: Optional[str],
@@ -424,13 +839,8 @@ class RAGService:
         goals: List[str]
     ) -> str:
         """Build query for hashtag generation"""
-        query_parts = [
-            f"Generate hashtag suggestions for {content_type} content on {platform}",
-            f"Content: {content[:200] if content else 'No content provided'}",
-            f"Target audience: {target_audience or 'General audience'}",
-            f"Goals: {', '.join(goals) if goals else 'General engagement'}"
-        ]
-        return ". ".join(query_parts)
+        head = _truncate_or_default(content, 200)
+        return _hashtag_query(head, content_type, platform, target_audience, tuple(goals or ()))
     
     def _build_caption_query(
         self,
@@ -442,25 +852,19 @@ class RAGService:
         goals: List[str]
     ) -> str:
         """Build query for caption generation"""
-        query_parts = [
-            f"Generate caption suggestions for {content_type} content on {platform}",
-            f"Tone: {tone}",
-            f"Content: {content[:200] if content else 'No content provided'}",
-            f"Target audience: {target_audience or 'General audience'}",
-            f"Goals: {', '.join(goals) if goals else 'General engagement'}"
-        ]
-        return ". ".join(query_parts)
+        head = _truncate_or_default(content, 200)
+        return _caption_query(head, content_type, platform, tone, target_audience, tuple(goals or ()))
     
     async def _retrieve_hashtag_context(
         self,
         content_type: str,
         platform: str,
         target_audience: Optional[str]
-    ) -> List[Dict[str, Any]]:
+    ) -> ContextBatch:
         """Retrieve relevant context for hashtag generation"""
-        # This would typically query the vector store for relevant hashtag data
-        # For now, return empty list
-        return []
+        return await self._search_context(
+            f"Hashtags for {content_type} content on {platform} for {target_audience or 'general audience'}"
+        )
     
     async def _retrieve_caption_context(
         self,
@@ -468,10 +872,11 @@ class RAGService:
         platform: str,
         tone: str,
         target_audience: Optional[str]
-    ) -> List[Dict[str, Any]]:
+    ) -> ContextBatch:
         """Retrieve relevant context for caption generation"""
-        # This would typically query the vector store for relevant caption data
-        return []
+        return await self._search_context(
+            f"{tone} captions for {content_type} content on {platform} for {target_audience or 'general audience'}"
+        )
     
     async def _retrieve_posting_time_context(
         self,
@@ -479,10 +884,11 @@ class RAGService:
         content_type: str,
         target_audience: Optional[str],
         user_id: str
-    ) -> List[Dict[str, Any]]:
+    ) -> ContextBatch:
         """Retrieve relevant context for posting time suggestions"""
-        # This would typically query the vector store for posting time data
-        return []
+        return await self._search_context(
+            f"Posting times for {content_type} content on {platform} for {target_audience or 'general audience'}"
+        )
     
     async def _retrieve_content_ideas_context(
         self,
@@ -490,20 +896,23 @@ class RAGService:
         platform: str,
         target_audience: Optional[str],
         goals: List[str]
-    ) -> List[Dict[str, Any]]:
+    ) -> ContextBatch:
         """Retrieve relevant context for content ideas generation"""
-        # This would typically query the vector store for content ideas data
-        return []
+        return await self._search_context(
+            f"Content ideas for {content_type} on {platform} for {target_audience or 'general audience'}. "
+            f"Goals: {', '.join(goals) if goals else 'General engagement'}"
+        )
     
     async def _retrieve_engagement_context(
         self,
         content_type: str,
         platform: str,
         target_audience: Optional[str]
-    ) -> List[Dict[str, Any]]:
+    ) -> ContextBatch:
         """Retrieve relevant context for engagement prediction"""
-        # This would typically query the vector store for engagement data
-        return []
+        return await self._search_context(
+            f"Engagement of {content_type} content on {platform} for {target_audience or 'general audience'}"
+        )
     
     async def _generate_insights_with_rag(self, rag_context: RAGContext) -> Dict[str, Any]:
         """Generate insights using RAG"""
@@ -521,17 +930,20 @@ class RAGService:
     ) -> Dict[str, Any]:
         """Generate hashtag suggestions using RAG"""
         # This would implement the actual RAG pipeline for hashtags
+        hashtags = [
+            {
+                "hashtag": "#example",
+                "popularity_score": 0.8,
+                "relevance_score": 0.9,
+                "competition_level": "medium",
+                "estimated_reach": 10000,
+                "category": "general"
+            }
+        ]
         return {
-            "hashtags": [
-                {
-                    "hashtag": "#example",
-                    "popularity_score": 0.8,
-                    "relevance_score": 0.9,
-                    "competition_level": "medium",
-                    "estimated_reach": 10000,
-                    "category": "general"
-                }
-            ],
+            "hashtags": hashtags,
+            # Columnar copy of the ranking score for vectorized top-k
+            "_scores": np.fromiter((h["relevance_score"] for h in hashtags), dtype=np.float32, count=len(hashtags)),
             "tokens_used": 500
         }
     
@@ -577,18 +989,21 @@ class RAGService:
     ) -> Dict[str, Any]:
         """Generate content ideas using RAG"""
         # This would implement the actual RAG pipeline for content ideas
+        ideas = [
+            {
+                "title": "Example Content Idea",
+                "description": "A creative content idea description",
+                "format": "post",
+                "estimated_engagement": 0.7,
+                "difficulty": "medium",
+                "time_to_create": "2-3 hours",
+                "trending_potential": 0.6
+            }
+        ]
         return {
-            "content_ideas": [
-                {
-                    "title": "Example Content Idea",
-                    "description": "A creative content idea description",
-                    "format": "post",
-                    "estimated_engagement": 0.7,
-                    "difficulty": "medium",
-                    "time_to_create": "2-3 hours",
-                    "trending_potential": 0.6
-                }
-            ],
+            "content_ideas": ideas,
+            # Columnar copy of the ranking score for vectorized top-k
+            "_scores": np.fromiter((i["estimated_engagement"] for i in ideas), dtype=np.float32, count=len(ideas)),
             "tokens_used": 1200
         }
     
@@ -620,16 +1035,14 @@ class RAGService:
     ) -> str:
         """Rewrite content for a specific field and platform using RAG"""
         try:
-            start_time = time.time()
-            
-            # Prepare query for content rewriting
-            query = self._build_rewrite_query(
-                field, current_content, platform, content_type, tone, goals, max_length
-            )
+            t0 = perf_counter_ns()
             
-            # Retrieve relevant context from vector store
-            context_documents = await self._retrieve_rewrite_context(
-                field, platform, content_type, tone, user_id
+            # Build the rewrite query while relevant context is retrieved from the vector store
+            query, context_documents = await self._query_with_context(
+                lambda: self._build_rewrite_query(
+                    field, current_content, platform, content_type, tone, goals, max_length
+                ),
+                self._retrieve_rewrite_context(field, platform, content_type, tone, user_id)
             )
             
             # Create RAG context
@@ -644,11 +1057,11 @@ class RAGService:
             # Generate rewritten content using RAG
             rewritten_content = await self._generate_rewrite_with_rag(rag_context, max_length)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = (perf_counter_ns() - t0) // 1_000_000
             self.logger.log_ai_operation(
                 operation="content_rewrite",
                 model=settings.primary_ai_provider,
-                tokens_used=len(rewritten_content.split()) * 1.3,  # Rough estimate
+                tokens_used=(len(rewritten_content) + 3) >> 2,  # ~4 characters per token
                 duration_ms=processing_time,
                 success=True
             )
@@ -670,16 +1083,8 @@ class RAGService:
         max_length: int
     ) -> str:
         """Build query for content rewriting"""
-        query_parts = [
-            f"Rewrite the {field} for a {content_type} on {platform}",
-            f"Current content: {current_content[:300]}",
-            f"Tone: {tone}",
-            f"Platform: {platform}",
-            f"Maximum length: {max_length} characters",
-            f"Goals: {', '.join(goals) if goals else 'General engagement'}",
-            f"Make it more engaging, platform-appropriate, and aligned with the specified tone"
-        ]
-        return ". ".join(query_parts)
+        head = _truncate_or_default(current_content, 300, "")
+        return _rewrite_query(field, head, platform, content_type, tone, tuple(goals or ()), max_length)
     
     async def _retrieve_rewrite_context(
         self,
@@ -688,11 +1093,9 @@ class RAGService:
         content_type: str,
         tone: str,
         user_id: Optional[str]
-    ) -> List[Dict[str, Any]]:
+    ) -> ContextBatch:
         """Retrieve relevant context for content rewriting"""
-        # This would typically query the vector store for relevant content examples
-        # For now, return empty list
-        return []
+        return await self._search_context(f"{tone} {field} examples for {content_type} content on {platform}")
     
     async def _generate_rewrite_with_rag(
         self, 
@@ -720,8 +1123,8 @@ class RAGService:
             """
             
             # Generate content using the LLM client
-            response = await self.llm_client.generate_text(
-                prompt=prompt,
+            response = await self._generate_text_cached(
+                prompt,
                 max_tokens=min(max_length * 2, 2000),  # Allow some buffer
                 temperature=0.7
             )
@@ -731,7 +1134,7 @@ class RAGService:
             
             # Ensure it doesn't exceed the maximum length
             if len(rewritten_content) > max_length:
-                rewritten_content = rewritten_content[:max_length].rsplit(' ', 1)[0] + "..."
+                rewritten_content = _truncate_at_word(rewritten_content, max_length)
             
             return rewritten_content
             
@@ -751,6 +1154,6 @@ class RAGService:
         
         # Ensure it fits within the limit
         if len(improved) > max_length:
-            improved = improved[:max_length].rsplit(' ', 1)[0] + "..."
+            improved = _truncate_at_word(improved, max_length)
         
         return improved
\ No newline at end of file
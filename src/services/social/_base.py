@@ -0,0 +1,55 @@
+"""
+Base class of the social media services
+"""
+from typing import Any
+import asyncio
+import aiohttp
+
+from src.core.config import settings
+from src.core.logger import ai_logger
+from src.core.exceptions import ExternalServiceError
+from src.services.social._http import get_session, request_json
+
+
+class BaseSocialService:
+    """
+    Shared setup of the social media services
+    
+    Subclasses set service_name and declare their API calls with external_call, which
+    relies on the _concurrency semaphore created here.
+    """
+    
+    service_name = "Social"
+    
+    # Set on each subclass once its first instance has initialized, so later instances skip the log line
+    _initialized = False
+    
+    def __init__(self):
+        self.logger = ai_logger
+        # Caps in-flight API calls; the token buckets cap their rate
+        self._concurrency = asyncio.Semaphore(settings.social_max_concurrency)
+        self._initialize_client()
+    
+    def _initialize_client(self):
+        """Initialize the service client"""
+        service = type(self)
+        try:
+            # API calls go through the shared pooled session (see session)
+            if not service._initialized:
+                self.logger.logger.info("{} service initialized", self.service_name)
+                service._initialized = True
+        except Exception as e:
+            self.logger.log_error(e, {"operation": f"initialize_{self.service_name.lower()}_client"})
+            raise ExternalServiceError(
+                self.service_name,
+                message=f"Failed to initialize {self.service_name} client: {str(e)}"
+            )
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Pooled HTTP session shared by all social services on this event loop"""
+        return get_session()
+    
+    async def _get_json(self, url: str, **kwargs) -> Any:
+        """GET url over the shared clients and return the decoded JSON body"""
+        return await request_json("GET", url, **kwargs)
@@ -0,0 +1,85 @@
+"""
+Micro-batching of per-id social media API requests into provider batch calls
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import asyncio
+
+from src.core.exceptions import ExternalServiceError
+
+
+class BatchQueue:
+    """
+    Queues single-id requests and resolves them with one batched fetch
+    
+    A batch is sent once max_batch distinct ids are queued or max_wait_ms after the
+    first one arrives. fetch maps ids to results; an id missing from its result, or
+    mapped to an exception, fails only that id's callers.
+    """
+    
+    def __init__(
+        self,
+        service: str,
+        fetch: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        max_batch: int = 50,
+        max_wait_ms: float = 10
+    ):
+        self.service = service
+        self.fetch = fetch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        # Insertion-ordered, so batches go out first come first served
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Running flushes; the loop only keeps weak references to tasks
+        self._flushes: Set[asyncio.Task] = set()
+    
+    async def submit(self, key: str) -> Any:
+        """Queue an id and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        if len(self._pending) >= self.max_batch:
+            self._schedule_flush(loop, 0)
+        elif self._timer is None:
+            self._schedule_flush(loop, self.max_wait)
+        return await future
+    
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_later(delay, self._start_flush, loop)
+    
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self) -> None:
+        keys = list(self._pending)[:self.max_batch]
+        batch = {key: self._pending.pop(key) for key in keys}
+        self._timer = None
+        if self._pending:
+            self._schedule_flush(asyncio.get_running_loop(), 0)
+        if not batch:
+            return
+        
+        try:
+            results = await self.fetch(keys)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        for key, futures in batch.items():
+            result = results.get(key)
+            if result is None:
+                result = ExternalServiceError(self.service, message=f"No result for '{key}' in batch response")
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -0,0 +1,92 @@
+"""
+TTL response cache for read-mostly social media API calls
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+import asyncio
+import functools
+from cachetools import LRUCache, TTLCache
+
+from src.core.logger import ai_logger
+from src.core.exceptions import ExternalServiceError
+
+
+def async_ttl_cache(ttl_seconds: float, maxsize: int = 1024, stale_ok: bool = True, stale_ttl_seconds: float = 0):
+    """
+    Cache an async service method's results for ttl_seconds
+    
+    Concurrent misses for the same key share one upstream call. With stale_ok, an
+    ExternalServiceError is answered with the last value seen for the key, if any.
+    With stale_ttl_seconds, an expired value younger than that is returned at once
+    while a single background task refreshes it (stale-while-revalidate).
+    Keys are (service class, method name, arguments), so all instances of a service share entries.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        fresh = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        servable = TTLCache(maxsize=maxsize, ttl=stale_ttl_seconds) if stale_ttl_seconds else None
+        last_good = LRUCache(maxsize=maxsize)
+        # key -> [lock, number of callers holding or waiting on it]
+        locks: Dict[Hashable, List[Any]] = {}
+        refreshing: Dict[Hashable, asyncio.Task] = {}
+        
+        async def load(key: Hashable, self, args, kwargs):
+            entry = locks.get(key)
+            if entry is None:
+                entry = locks[key] = [asyncio.Lock(), 0]
+            entry[1] += 1
+            try:
+                async with entry[0]:
+                    try:
+                        return fresh[key]
+                    except KeyError:
+                        pass
+                    try:
+                        value = await func(self, *args, **kwargs)
+                    except ExternalServiceError as e:
+                        if stale_ok and key in last_good:
+                            ai_logger.logger.warning("Serving stale {} response: {}", func.__name__, e)
+                            return last_good[key]
+                        raise
+                    fresh[key] = value
+                    last_good[key] = value
+                    if servable is not None:
+                        servable[key] = value
+                    return value
+            finally:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    locks.pop(key, None)
+        
+        def refresh_done(key: Hashable, task: asyncio.Task) -> None:
+            refreshing.pop(key, None)
+            # Failures were already logged by the wrapped call
+            if not task.cancelled():
+                task.exception()
+        
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (type(self).__name__, func.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                return fresh[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable arguments are not cached
+                return await func(self, *args, **kwargs)
+            
+            if servable is not None:
+                try:
+                    value = servable[key]
+                except KeyError:
+                    pass
+                else:
+                    if key not in refreshing:
+                        task = asyncio.create_task(load(key, self, args, kwargs))
+                        refreshing[key] = task
+                        task.add_done_callback(functools.partial(refresh_done, key))
+                    return value
+            
+            return await load(key, self, args, kwargs)
+        
+        return wrapper
+    
+    return decorator
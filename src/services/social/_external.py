@@ -0,0 +1,110 @@
+"""
+Common wrapper for social media API calls: caching, rate limiting, error handling and metrics
+"""
+from typing import Any, Awaitable, Callable, Optional
+import functools
+import inspect
+from time import perf_counter
+
+from src.core.logger import ai_logger
+from src.core.exceptions import ExternalServiceError
+from src.services.social._cache import async_ttl_cache
+from src.services.social._ratelimit import AsyncTokenBucket, rate_limited
+from src.services.social._retry import retrying
+
+# Optional Prometheus import for call latency metrics
+try:
+    from prometheus_client import Gauge, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+if PROMETHEUS_AVAILABLE:
+    _CALL_SECONDS = Histogram(
+        "social_api_call_duration_seconds",
+        "Duration of social media API calls",
+        ["service", "operation", "outcome"]
+    )
+    _IN_FLIGHT = Gauge(
+        "social_api_in_flight_requests",
+        "Social media API calls currently holding a concurrency slot",
+        ["service"]
+    )
+
+
+def external_call(
+    service_name: str,
+    cache_ttl: float = 0,
+    limiter: Optional[AsyncTokenBucket] = None,
+    cost: float = 1,
+    op: Optional[str] = None,
+    stale_ttl: float = 0,
+    attempts: int = 4
+):
+    """
+    Decorate an async social service method as an external API call
+    
+    Args:
+        service_name: Provider name used in errors and metrics
+        cache_ttl: Seconds to cache results for; 0 disables caching
+        limiter: Token bucket charged cost tokens per uncached call
+        cost: Tokens charged per call
+        op: Operation name; defaults to the method name
+        stale_ttl: Seconds an expired cached result may still be served while it is
+            refreshed in the background; 0 disables stale-while-revalidate
+        attempts: Tries per uncached call; transient failures are retried with backoff
+    
+    Each try is charged to limiter and holds a slot of the service's _concurrency
+    semaphore while it runs. Failures left after retrying are logged with the call
+    arguments and re-raised as ExternalServiceError.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        operation = op or func.__name__
+        description = operation.replace("_", " ")
+        signature = inspect.signature(func)
+        
+        async def timed(self, *args, **kwargs):
+            start = perf_counter()
+            try:
+                result = await func(self, *args, **kwargs)
+            except Exception:
+                if PROMETHEUS_AVAILABLE:
+                    _CALL_SECONDS.labels(service_name, operation, "error").observe(perf_counter() - start)
+                raise
+            if PROMETHEUS_AVAILABLE:
+                _CALL_SECONDS.labels(service_name, operation, "success").observe(perf_counter() - start)
+            return result
+        
+        async def bounded(self, *args, **kwargs):
+            async with self._concurrency:
+                if not PROMETHEUS_AVAILABLE:
+                    return await timed(self, *args, **kwargs)
+                _IN_FLIGHT.labels(service_name).inc()
+                try:
+                    return await timed(self, *args, **kwargs)
+                finally:
+                    _IN_FLIGHT.labels(service_name).dec()
+        
+        attempt = bounded
+        if limiter is not None:
+            attempt = rate_limited(limiter, cost)(attempt)
+        if attempts > 1:
+            attempt = retrying(attempts)(attempt)
+        
+        @functools.wraps(func)
+        async def call(self, *args, **kwargs):
+            try:
+                return await attempt(self, *args, **kwargs)
+            except Exception as e:
+                arguments = signature.bind(self, *args, **kwargs).arguments
+                arguments.pop("self", None)
+                ai_logger.log_error(e, {"operation": operation, **arguments})
+                raise ExternalServiceError(service_name, message=f"Failed to {description}: {str(e)}")
+        
+        wrapped = call
+        if cache_ttl:
+            wrapped = async_ttl_cache(cache_ttl, stale_ttl_seconds=stale_ttl)(wrapped)
+        return wrapped
+    
+    return decorator
@@ -0,0 +1,118 @@
+"""
+Shared pooled HTTP session for social media API calls
+"""
+from typing import Any
+import asyncio
+import weakref
+from urllib.parse import urlsplit
+import aiohttp
+
+from src.core.logger import ai_logger
+
+# Optional HTTP/2 client (httpx with the h2 package)
+try:
+    import h2
+    import httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# One session per event loop; connections are kept alive and reused across services
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+_CONNECTION_LIMIT = 200
+_CONNECTION_LIMIT_PER_HOST = 32
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 75
+_REQUEST_TIMEOUT = 30
+
+# Hosts that serve HTTP/2; concurrent requests to them share one multiplexed connection
+_HTTP2_HOSTS = frozenset({"www.googleapis.com", "youtube.googleapis.com", "api.twitter.com"})
+_http2_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_HTTP2_KEEPALIVE_CONNECTIONS = 100
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get or create the pooled session for the running event loop"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=_CONNECTION_LIMIT,
+                limit_per_host=_CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT
+            ),
+            timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT)
+        )
+        _sessions[loop] = session
+    
+    return session
+
+
+def _get_http2_client() -> "httpx.AsyncClient":
+    """Get or create the HTTP/2 client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _http2_clients.get(loop)
+    
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_CONNECTION_LIMIT,
+                max_keepalive_connections=_HTTP2_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=_KEEPALIVE_TIMEOUT
+            ),
+            timeout=_REQUEST_TIMEOUT
+        )
+        _http2_clients[loop] = client
+    
+    return client
+
+
+def uses_http2(url: str) -> bool:
+    """Whether requests to url go over the multiplexed HTTP/2 client"""
+    return HTTP2_AVAILABLE and urlsplit(url).hostname in _HTTP2_HOSTS
+
+
+async def request_json(method: str, url: str, **kwargs) -> Any:
+    """
+    Send a request over the pooled client for url's host and return the decoded JSON body
+    
+    Args:
+        method: HTTP method
+        url: Absolute request URL
+        **kwargs: params, headers or json, passed through to the client
+    
+    Returns:
+        Decoded JSON response
+    """
+    if uses_http2(url):
+        response = await _get_http2_client().request(method, url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+    
+    async with get_session().request(method, url, **kwargs) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def close_session() -> None:
+    """Close the pooled session and HTTP/2 client of the running event loop, if any"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        try:
+            await session.close()
+        except Exception as e:
+            ai_logger.log_error(e, {"operation": "close_http_session"})
+    
+    client = _http2_clients.pop(loop, None) if HTTP2_AVAILABLE else None
+    if client is not None and not client.is_closed:
+        try:
+            await client.aclose()
+        except Exception as e:
+            ai_logger.log_error(e, {"operation": "close_http2_client"})
@@ -0,0 +1,57 @@
+"""
+Client-side rate limiting of social media API calls
+"""
+from typing import Any, Awaitable, Callable
+import asyncio
+import functools
+from time import monotonic
+
+from src.core.config import settings
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket refilled at rate tokens per second up to capacity
+    
+    Callers reserve tokens up front, so the balance may go negative; each caller then
+    sleeps until its reservation is covered. Waiters are therefore served in arrival
+    order without a lock, and bursts up to capacity pass without waiting. A caller
+    cancelled while waiting refunds its reservation.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+    
+    async def acquire(self, cost: float = 1) -> None:
+        """Take cost tokens, sleeping until the bucket can cover them"""
+        if cost > self.capacity:
+            raise ValueError(f"Cost {cost} exceeds bucket capacity {self.capacity}")
+        
+        now = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= cost
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self.rate)
+            except asyncio.CancelledError:
+                # A cancelled waiter never makes its call, so hand its reservation back
+                self._tokens += cost
+                raise
+
+
+def rate_limited(bucket: AsyncTokenBucket, cost: float = 1):
+    """Charge cost tokens from bucket before each call of an async service method"""
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if settings.social_rate_limits_enabled:
+                await bucket.acquire(cost)
+            return await func(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
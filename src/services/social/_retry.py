@@ -0,0 +1,85 @@
+"""
+Retries of transient social media API failures with exponential backoff and full jitter
+"""
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import asyncio
+import functools
+import random
+from time import monotonic
+import aiohttp
+
+from src.core.exceptions import RateLimitExceededError, ServiceUnavailableError
+
+# Optional httpx import; the HTTP/2 client raises httpx errors
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+# Timeouts, throttling and server errors; any other 4xx is permanent
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _classify(error: Exception) -> Tuple[bool, Optional[float]]:
+    """Whether error is transient, and how long the server asked us to wait, if it did"""
+    if isinstance(error, (RateLimitExceededError, ServiceUnavailableError)):
+        return True, error.retry_after
+    if isinstance(error, aiohttp.ClientResponseError):
+        headers = error.headers or {}
+        return error.status in _RETRY_STATUSES, _parse_retry_after(headers.get("Retry-After"))
+    if isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+        return True, None
+    if HTTPX_AVAILABLE:
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+            return response.status_code in _RETRY_STATUSES, _parse_retry_after(response.headers.get("Retry-After"))
+        if isinstance(error, httpx.TransportError):
+            return True, None
+    return False, None
+
+
+def retrying(attempts: int = 4, initial: float = 0.2, max_delay: float = 4, deadline: float = 15):
+    """
+    Retry an async call on transient failures
+    
+    Waits a random time up to initial * 2**n (capped at max_delay) before retry n, or the
+    server's Retry-After when it gives one. Gives up after attempts tries, or sooner when
+    the next wait would end past deadline seconds from the first try.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            give_up_at = monotonic() + deadline
+            for attempt in range(attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    transient, retry_after = _classify(e)
+                    if not transient or attempt == attempts - 1:
+                        raise
+                    delay = retry_after if retry_after is not None else random.uniform(0, min(max_delay, initial * 2 ** attempt))
+                    if monotonic() + delay > give_up_at:
+                        raise
+                    await asyncio.sleep(delay)
+        
+        return wrapper
+    
+    return decorator
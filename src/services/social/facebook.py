@@ -2,129 +2,176 @@
 Facebook service for social media data collection
 """
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
+import asyncio
 from src.core.config import settings
-from src.core.logger import ai_logger
-from src.core.exceptions import ExternalServiceError
+from src.services.social._base import BaseSocialService
+from src.services.social._ratelimit import AsyncTokenBucket
+from src.services.social._external import external_call
+from src.services.social._batch import BatchQueue
+from src.services.social.models import (
+    FacebookPage, FacebookPageInsights, FacebookPost, FacebookPostAnalytics, FacebookSearchPost
+)
 
 
-class FacebookService:
+# Graph API: 200 calls per hour per user; a batch request counts each sub-request
+_GRAPH_LIMIT = AsyncTokenBucket(rate=200 / 3600, capacity=50)
+
+# Mock pages hold at most _MOCK_PAGE_SIZE records, all stamped with _MOCK_TIMESTAMP
+_MOCK_PAGE_SIZE = 10
+_MOCK_TIMESTAMP = "2024-01-01T12:00:00Z"
+
+# Invariant fields of mock records, passed as keyword arguments alongside the varying ones
+_PAGE_POST_TEMPLATE = {
+    "created_at": _MOCK_TIMESTAMP,
+    "content_type": "post",
+    "hashtags": ("#facebook", "#social")
+}
+_SEARCH_POST_TEMPLATE = {
+    "created_at": _MOCK_TIMESTAMP
+}
+
+
+class FacebookService(BaseSocialService):
     """Facebook API service for data collection"""
     
-    def __init__(self):
-        self.app_id = settings.facebook_app_id
-        self.app_secret = settings.facebook_app_secret
-        self.logger = ai_logger
-        self.client = None
-        self._initialize_client()
+    service_name = "Facebook"
     
-    def _initialize_client(self):
-        """Initialize Facebook client"""
-        try:
-            # This would initialize the actual Facebook API client
-            # For now, we'll use a placeholder
-            self.client = None
-            self.logger.logger.info("Facebook service initialized")
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "initialize_facebook_client"})
-            raise ExternalServiceError("Facebook", message=f"Failed to initialize Facebook client: {str(e)}")
+    def __init__(self):
+        # Credentials are optional; Settings no longer declares them since the backend collects data
+        self.app_id = getattr(settings, "facebook_app_id", None)
+        self.app_secret = getattr(settings, "facebook_app_secret", None)
+        self._post_analytics_batch = BatchQueue("Facebook", self._fetch_post_analytics_batch)
+        super().__init__()
     
-    async def get_page_info(self, page_id: str) -> Dict[str, Any]:
+    @external_call("Facebook", cache_ttl=60, limiter=_GRAPH_LIMIT)
+    async def get_page_info(self, page_id: str) -> FacebookPage:
         """Get page information"""
-        try:
-            # This would make actual API calls to Facebook
-            # For now, return mock data
-            return {
-                "page_id": page_id,
-                "name": "Sample Page",
-                "followers": 15000,
-                "likes": 12000,
-                "posts_count": 300,
-                "description": "Sample page description",
-                "category": "Business",
-                "website": "https://example.com"
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_page_info", "page_id": page_id})
-            raise ExternalServiceError("Facebook", message=f"Failed to get page info: {str(e)}")
+        # This would make actual API calls to Facebook
+        # For now, return mock data
+        return FacebookPage(
+            page_id=page_id,
+            name="Sample Page",
+            followers=15000,
+            likes=12000,
+            posts_count=300,
+            description="Sample page description",
+            category="Business",
+            website="https://example.com"
+        )
     
+    @external_call("Facebook", limiter=_GRAPH_LIMIT)
     async def get_page_posts(
         self, 
         page_id: str, 
         limit: int = 50, 
         days_back: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> List[FacebookPost]:
         """Get page posts"""
-        try:
-            # This would make actual API calls to Facebook
-            # For now, return mock data
-            posts = []
-            for i in range(min(limit, 10)):
-                posts.append({
-                    "post_id": f"post_{i}",
-                    "message": f"Sample Facebook post {i}",
-                    "likes": 30 + i * 3,
-                    "comments": 8 + i,
-                    "shares": 5 + i,
-                    "created_at": "2024-01-01T12:00:00Z",
-                    "content_type": "post",
-                    "hashtags": ["#facebook", "#social"]
-                })
-            return posts
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_page_posts", "page_id": page_id})
-            raise ExternalServiceError("Facebook", message=f"Failed to get page posts: {str(e)}")
+        # This would make actual API calls to Facebook
+        # For now, return mock data
+        return [
+            FacebookPost(
+                **_PAGE_POST_TEMPLATE,
+                post_id=f"post_{i}",
+                message=f"Sample Facebook post {i}",
+                likes=30 + i * 3,
+                comments=8 + i,
+                shares=5 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_post_analytics(self, post_id: str) -> Dict[str, Any]:
+    @external_call("Facebook")
+    async def get_post_analytics(self, post_id: str) -> FacebookPostAnalytics:
         """Get post analytics"""
-        try:
-            # This would make actual API calls to Facebook
-            # For now, return mock data
-            return {
-                "post_id": post_id,
-                "likes": 75,
-                "comments": 15,
-                "shares": 10,
-                "reach": 1000,
-                "impressions": 1200,
-                "engagement_rate": 10.0
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_post_analytics", "post_id": post_id})
-            raise ExternalServiceError("Facebook", message=f"Failed to get post analytics: {str(e)}")
+        # Concurrent requests are coalesced into one batched API call
+        return await self._post_analytics_batch.submit(post_id)
     
-    async def search_posts(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+    async def _fetch_post_analytics_batch(self, post_ids: List[str]) -> Dict[str, FacebookPostAnalytics]:
+        """Fetch analytics for up to 50 posts in one batched API call"""
+        # This would POST one Graph API request with
+        # batch=[{"method": "GET", "relative_url": f"{post_id}/insights"}, ...] and map each
+        # sub-response to its post id, or to an ExternalServiceError when it carries an error
+        if settings.social_rate_limits_enabled:
+            await _GRAPH_LIMIT.acquire(len(post_ids))
+        # For now, return mock data
+        return {
+            post_id: FacebookPostAnalytics(
+                post_id=post_id,
+                likes=75,
+                comments=15,
+                shares=10,
+                reach=1000,
+                impressions=1200,
+                engagement_rate=10.0
+            )
+            for post_id in post_ids
+        }
+    
+    @external_call("Facebook", limiter=_GRAPH_LIMIT)
+    async def search_posts(self, query: str, limit: int = 50) -> List[FacebookSearchPost]:
         """Search posts by query"""
-        try:
-            # This would make actual API calls to Facebook
-            # For now, return mock data
-            posts = []
-            for i in range(min(limit, 10)):
-                posts.append({
-                    "post_id": f"search_post_{i}",
-                    "message": f"Facebook post about {query}",
-                    "page_name": f"Page {i}",
-                    "likes": 20 + i * 2,
-                    "comments": 5 + i,
-                    "created_at": "2024-01-01T12:00:00Z"
-                })
-            return posts
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "search_posts", "query": query})
-            raise ExternalServiceError("Facebook", message=f"Failed to search posts: {str(e)}")
+        # This would make actual API calls to Facebook
+        # For now, return mock data
+        message = f"Facebook post about {query}"
+        return [
+            FacebookSearchPost(
+                **_SEARCH_POST_TEMPLATE,
+                post_id=f"search_post_{i}",
+                message=message,
+                page_name=f"Page {i}",
+                likes=20 + i * 2,
+                comments=5 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_page_insights(self, page_id: str) -> Dict[str, Any]:
+    @external_call("Facebook", cache_ttl=30, limiter=_GRAPH_LIMIT)
+    async def get_page_insights(self, page_id: str) -> FacebookPageInsights:
         """Get page insights"""
-        try:
-            # This would make actual API calls to Facebook
-            # For now, return mock data
-            return {
-                "page_id": page_id,
-                "total_reach": 50000,
-                "total_impressions": 75000,
-                "total_engagement": 5000,
-                "follower_growth": 100,
-                "engagement_rate": 10.0
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_page_insights", "page_id": page_id})
-            raise ExternalServiceError("Facebook", message=f"Failed to get page insights: {str(e)}")
+        # This would make actual API calls to Facebook
+        # For now, return mock data
+        return FacebookPageInsights(
+            page_id=page_id,
+            total_reach=50000,
+            total_impressions=75000,
+            total_engagement=5000,
+            follower_growth=100,
+            engagement_rate=10.0
+        )
+    
+    async def get_page_bundle(self, page_id: str, limit: int = 50) -> Dict[str, Any]:
+        """Get page, posts and per-post analytics with independent calls issued concurrently"""
+        page, posts = await asyncio.gather(self.get_page_info(page_id), self.get_page_posts(page_id, limit))
+        results = await asyncio.gather(
+            *(self.get_post_analytics(post.post_id) for post in posts), return_exceptions=True
+        )
+        
+        # Failed analytics calls leave a None in place of that post's analytics
+        analytics = []
+        for post, result in zip(posts, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(result, {"operation": "get_page_bundle", "post_id": post.post_id})
+                result = None
+            analytics.append(result)
+        
+        return {"page": page, "posts": posts, "analytics": analytics}
+    
+    async def get_pages_bundle(self, page_ids: List[str]) -> Dict[str, Optional[FacebookPage]]:
+        """Get information for many pages concurrently; pages that fail map to None"""
+        results = await asyncio.gather(*(self.get_page_info(page_id) for page_id in page_ids), return_exceptions=True)
+        
+        pages = {}
+        for page_id, result in zip(page_ids, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(result, {"operation": "get_pages_bundle", "page_id": page_id})
+                result = None
+            pages[page_id] = result
+        return pages
+
+
+@lru_cache(maxsize=1)
+def get_facebook_service() -> FacebookService:
+    """Get the shared Facebook service instance"""
+    return FacebookService()
@@ -2,132 +2,153 @@
 Instagram service for social media data collection
 """
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
 import asyncio
 from src.core.config import settings
-from src.core.logger import ai_logger
-from src.core.exceptions import ExternalServiceError
+from src.services.social._base import BaseSocialService
+from src.services.social._ratelimit import AsyncTokenBucket
+from src.services.social._external import external_call
+from src.services.social.models import (
+    InstagramHashtagPost, InstagramPost, InstagramPostAnalytics, InstagramProfile, InstagramTrendingHashtag
+)
 
 
-class InstagramService:
+# Graph API: 200 calls per hour per user; hashtag search: 30 unique hashtags per 7 days
+_GRAPH_LIMIT = AsyncTokenBucket(rate=200 / 3600, capacity=50)
+_HASHTAG_SEARCH_LIMIT = AsyncTokenBucket(rate=30 / 604800, capacity=30)
+
+# Mock pages hold at most _MOCK_PAGE_SIZE records, all stamped with _MOCK_TIMESTAMP
+_MOCK_PAGE_SIZE = 10
+_MOCK_TIMESTAMP = "2024-01-01T12:00:00Z"
+
+# Invariant fields of mock records, passed as keyword arguments alongside the varying ones
+_USER_POST_TEMPLATE = {
+    "posted_at": _MOCK_TIMESTAMP,
+    "content_type": "post",
+    "hashtags": ("#sample", "#test"),
+    "mentions": ("@user1", "@user2")
+}
+_HASHTAG_POST_TEMPLATE = {
+    "posted_at": _MOCK_TIMESTAMP
+}
+
+
+class InstagramService(BaseSocialService):
     """Instagram API service for data collection"""
     
-    def __init__(self):
-        self.username = settings.instagram_username
-        self.password = settings.instagram_password
-        self.logger = ai_logger
-        self.client = None
-        self._initialize_client()
+    service_name = "Instagram"
     
-    def _initialize_client(self):
-        """Initialize Instagram client"""
-        try:
-            # This would initialize the actual Instagram API client
-            # For now, we'll use a placeholder
-            self.client = None
-            self.logger.logger.info("Instagram service initialized")
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "initialize_instagram_client"})
-            raise ExternalServiceError("Instagram", message=f"Failed to initialize Instagram client: {str(e)}")
+    def __init__(self):
+        # Credentials are optional; Settings no longer declares them since the backend collects data
+        self.username = getattr(settings, "instagram_username", None)
+        self.password = getattr(settings, "instagram_password", None)
+        super().__init__()
     
-    async def get_user_profile(self, username: str) -> Dict[str, Any]:
+    @external_call("Instagram", cache_ttl=60, limiter=_GRAPH_LIMIT)
+    async def get_user_profile(self, username: str) -> InstagramProfile:
         """Get user profile information"""
-        try:
-            # This would make actual API calls to Instagram
-            # For now, return mock data
-            return {
-                "username": username,
-                "followers": 10000,
-                "following": 500,
-                "posts_count": 150,
-                "bio": "Sample bio",
-                "verified": False,
-                "profile_pic_url": "https://example.com/profile.jpg",
-                "category": "Personal"
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_user_profile", "username": username})
-            raise ExternalServiceError("Instagram", message=f"Failed to get user profile: {str(e)}")
+        # This would make actual API calls to Instagram
+        # For now, return mock data
+        return InstagramProfile(
+            username=username,
+            followers=10000,
+            following=500,
+            posts_count=150,
+            bio="Sample bio",
+            verified=False,
+            profile_pic_url="https://example.com/profile.jpg",
+            category="Personal"
+        )
     
+    @external_call("Instagram", limiter=_GRAPH_LIMIT)
     async def get_user_posts(
         self, 
         username: str, 
         limit: int = 50, 
         days_back: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> List[InstagramPost]:
         """Get user posts"""
-        try:
-            # This would make actual API calls to Instagram
-            # For now, return mock data
-            posts = []
-            for i in range(min(limit, 10)):  # Mock 10 posts
-                posts.append({
-                    "id": f"post_{i}",
-                    "caption": f"Sample post {i}",
-                    "likes": 100 + i * 10,
-                    "comments": 10 + i,
-                    "shares": 5 + i,
-                    "views": 1000 + i * 100,
-                    "posted_at": "2024-01-01T12:00:00Z",
-                    "content_type": "post",
-                    "hashtags": ["#sample", "#test"],
-                    "mentions": ["@user1", "@user2"]
-                })
-            return posts
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_user_posts", "username": username})
-            raise ExternalServiceError("Instagram", message=f"Failed to get user posts: {str(e)}")
+        # This would make actual API calls to Instagram
+        # For now, return mock data
+        return [
+            InstagramPost(
+                **_USER_POST_TEMPLATE,
+                id=f"post_{i}",
+                caption=f"Sample post {i}",
+                likes=100 + i * 10,
+                comments=10 + i,
+                shares=5 + i,
+                views=1000 + i * 100
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_post_analytics(self, post_id: str) -> Dict[str, Any]:
+    @external_call("Instagram", limiter=_GRAPH_LIMIT)
+    async def get_post_analytics(self, post_id: str) -> InstagramPostAnalytics:
         """Get post analytics"""
-        try:
-            # This would make actual API calls to Instagram
-            # For now, return mock data
-            return {
-                "post_id": post_id,
-                "likes": 150,
-                "comments": 25,
-                "shares": 10,
-                "views": 2000,
-                "reach": 1800,
-                "engagement_rate": 5.2
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_post_analytics", "post_id": post_id})
-            raise ExternalServiceError("Instagram", message=f"Failed to get post analytics: {str(e)}")
+        # This would make actual API calls to Instagram
+        # For now, return mock data
+        return InstagramPostAnalytics(
+            post_id=post_id,
+            likes=150,
+            comments=25,
+            shares=10,
+            views=2000,
+            reach=1800,
+            engagement_rate=5.2
+        )
     
-    async def search_hashtag(self, hashtag: str, limit: int = 50) -> List[Dict[str, Any]]:
+    @external_call("Instagram", limiter=_HASHTAG_SEARCH_LIMIT)
+    async def search_hashtag(self, hashtag: str, limit: int = 50) -> List[InstagramHashtagPost]:
         """Search posts by hashtag"""
-        try:
-            # This would make actual API calls to Instagram
-            # For now, return mock data
-            posts = []
-            for i in range(min(limit, 10)):
-                posts.append({
-                    "id": f"hashtag_post_{i}",
-                    "username": f"user_{i}",
-                    "caption": f"Post with #{hashtag}",
-                    "likes": 50 + i * 5,
-                    "comments": 5 + i,
-                    "posted_at": "2024-01-01T12:00:00Z"
-                })
-            return posts
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "search_hashtag", "hashtag": hashtag})
-            raise ExternalServiceError("Instagram", message=f"Failed to search hashtag: {str(e)}")
+        # This would make actual API calls to Instagram
+        # For now, return mock data
+        caption = f"Post with #{hashtag}"
+        return [
+            InstagramHashtagPost(
+                **_HASHTAG_POST_TEMPLATE,
+                id=f"hashtag_post_{i}",
+                username=f"user_{i}",
+                caption=caption,
+                likes=50 + i * 5,
+                comments=5 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_trending_hashtags(self, limit: int = 20) -> List[Dict[str, Any]]:
+    @external_call("Instagram", cache_ttl=60, stale_ttl=600, limiter=_GRAPH_LIMIT)
+    async def get_trending_hashtags(self, limit: int = 20) -> List[InstagramTrendingHashtag]:
         """Get trending hashtags"""
-        try:
-            # This would make actual API calls to Instagram
-            # For now, return mock data
-            hashtags = []
-            for i in range(min(limit, 10)):
-                hashtags.append({
-                    "hashtag": f"trending{i}",
-                    "post_count": 1000 + i * 100,
-                    "engagement_rate": 3.5 + i * 0.1
-                })
-            return hashtags
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_trending_hashtags"})
-            raise ExternalServiceError("Instagram", message=f"Failed to get trending hashtags: {str(e)}")
+        # This would make actual API calls to Instagram
+        # For now, return mock data
+        return [
+            InstagramTrendingHashtag(
+                hashtag=f"trending{i}",
+                post_count=1000 + i * 100,
+                engagement_rate=3.5 + i * 0.1
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
+    
+    async def get_user_bundle(self, username: str, limit: int = 50) -> Dict[str, Any]:
+        """Get profile, posts and per-post analytics with independent calls issued concurrently"""
+        profile, posts = await asyncio.gather(self.get_user_profile(username), self.get_user_posts(username, limit))
+        results = await asyncio.gather(
+            *(self.get_post_analytics(post.id) for post in posts), return_exceptions=True
+        )
+        
+        # Failed analytics calls leave a None in place of that post's analytics
+        analytics = []
+        for post, result in zip(posts, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(result, {"operation": "get_user_bundle", "post_id": post.id})
+                result = None
+            analytics.append(result)
+        
+        return {"profile": profile, "posts": posts, "analytics": analytics}
+
+
+@lru_cache(maxsize=1)
+def get_instagram_service() -> InstagramService:
+    """Get the shared Instagram service instance"""
+    return InstagramService()
@@ -2,129 +2,150 @@
 LinkedIn service for social media data collection
 """
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
+import asyncio
 from src.core.config import settings
-from src.core.logger import ai_logger
-from src.core.exceptions import ExternalServiceError
+from src.services.social._base import BaseSocialService
+from src.services.social._ratelimit import AsyncTokenBucket
+from src.services.social._external import external_call
+from src.services.social.models import (
+    LinkedInCompany, LinkedInPost, LinkedInPostAnalytics, LinkedInProfile, LinkedInSearchPost
+)
 
 
-class LinkedInService:
+# Member-level daily API limit
+_API_LIMIT = AsyncTokenBucket(rate=500 / 86400, capacity=100)
+
+# Mock pages hold at most _MOCK_PAGE_SIZE records, all stamped with _MOCK_TIMESTAMP
+_MOCK_PAGE_SIZE = 10
+_MOCK_TIMESTAMP = "2024-01-01T12:00:00Z"
+
+# Invariant fields of mock records, passed as keyword arguments alongside the varying ones
+_USER_POST_TEMPLATE = {
+    "created_at": _MOCK_TIMESTAMP,
+    "content_type": "post",
+    "hashtags": ("#linkedin", "#professional")
+}
+_SEARCH_POST_TEMPLATE = {
+    "created_at": _MOCK_TIMESTAMP
+}
+
+
+class LinkedInService(BaseSocialService):
     """LinkedIn API service for data collection"""
     
-    def __init__(self):
-        self.client_id = settings.linkedin_client_id
-        self.client_secret = settings.linkedin_client_secret
-        self.logger = ai_logger
-        self.client = None
-        self._initialize_client()
+    service_name = "LinkedIn"
     
-    def _initialize_client(self):
-        """Initialize LinkedIn client"""
-        try:
-            # This would initialize the actual LinkedIn API client
-            # For now, we'll use a placeholder
-            self.client = None
-            self.logger.logger.info("LinkedIn service initialized")
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "initialize_linkedin_client"})
-            raise ExternalServiceError("LinkedIn", message=f"Failed to initialize LinkedIn client: {str(e)}")
+    def __init__(self):
+        # Credentials are optional; Settings no longer declares them since the backend collects data
+        self.client_id = getattr(settings, "linkedin_client_id", None)
+        self.client_secret = getattr(settings, "linkedin_client_secret", None)
+        super().__init__()
     
-    async def get_user_profile(self, username: str) -> Dict[str, Any]:
+    @external_call("LinkedIn", cache_ttl=60, limiter=_API_LIMIT)
+    async def get_user_profile(self, username: str) -> LinkedInProfile:
         """Get user profile information"""
-        try:
-            # This would make actual API calls to LinkedIn
-            # For now, return mock data
-            return {
-                "username": username,
-                "followers": 5000,
-                "connections": 500,
-                "posts_count": 100,
-                "headline": "Sample LinkedIn headline",
-                "summary": "Sample LinkedIn summary",
-                "location": "San Francisco, CA",
-                "industry": "Technology",
-                "company": "Sample Company"
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_user_profile", "username": username})
-            raise ExternalServiceError("LinkedIn", message=f"Failed to get user profile: {str(e)}")
+        # This would make actual API calls to LinkedIn
+        # For now, return mock data
+        return LinkedInProfile(
+            username=username,
+            followers=5000,
+            connections=500,
+            posts_count=100,
+            headline="Sample LinkedIn headline",
+            summary="Sample LinkedIn summary",
+            location="San Francisco, CA",
+            industry="Technology",
+            company="Sample Company"
+        )
     
+    @external_call("LinkedIn", limiter=_API_LIMIT)
     async def get_user_posts(
         self, 
         username: str, 
         limit: int = 50, 
         days_back: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> List[LinkedInPost]:
         """Get user posts"""
-        try:
-            # This would make actual API calls to LinkedIn
-            # For now, return mock data
-            posts = []
-            for i in range(min(limit, 10)):
-                posts.append({
-                    "post_id": f"post_{i}",
-                    "text": f"Sample LinkedIn post {i}",
-                    "likes": 20 + i * 2,
-                    "comments": 5 + i,
-                    "shares": 3 + i,
-                    "created_at": "2024-01-01T12:00:00Z",
-                    "content_type": "post",
-                    "hashtags": ["#linkedin", "#professional"]
-                })
-            return posts
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_user_posts", "username": username})
-            raise ExternalServiceError("LinkedIn", message=f"Failed to get user posts: {str(e)}")
+        # This would make actual API calls to LinkedIn
+        # For now, return mock data
+        return [
+            LinkedInPost(
+                **_USER_POST_TEMPLATE,
+                post_id=f"post_{i}",
+                text=f"Sample LinkedIn post {i}",
+                likes=20 + i * 2,
+                comments=5 + i,
+                shares=3 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_post_analytics(self, post_id: str) -> Dict[str, Any]:
+    @external_call("LinkedIn", limiter=_API_LIMIT)
+    async def get_post_analytics(self, post_id: str) -> LinkedInPostAnalytics:
         """Get post analytics"""
-        try:
-            # This would make actual API calls to LinkedIn
-            # For now, return mock data
-            return {
-                "post_id": post_id,
-                "likes": 50,
-                "comments": 10,
-                "shares": 5,
-                "views": 500,
-                "engagement_rate": 13.0
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_post_analytics", "post_id": post_id})
-            raise ExternalServiceError("LinkedIn", message=f"Failed to get post analytics: {str(e)}")
+        # This would make actual API calls to LinkedIn
+        # For now, return mock data
+        return LinkedInPostAnalytics(
+            post_id=post_id,
+            likes=50,
+            comments=10,
+            shares=5,
+            views=500,
+            engagement_rate=13.0
+        )
     
-    async def search_posts(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+    @external_call("LinkedIn", limiter=_API_LIMIT)
+    async def search_posts(self, query: str, limit: int = 50) -> List[LinkedInSearchPost]:
         """Search posts by query"""
-        try:
-            # This would make actual API calls to LinkedIn
-            # For now, return mock data
-            posts = []
-            for i in range(min(limit, 10)):
-                posts.append({
-                    "post_id": f"search_post_{i}",
-                    "text": f"LinkedIn post about {query}",
-                    "author": f"user_{i}",
-                    "likes": 15 + i * 2,
-                    "comments": 3 + i,
-                    "created_at": "2024-01-01T12:00:00Z"
-                })
-            return posts
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "search_posts", "query": query})
-            raise ExternalServiceError("LinkedIn", message=f"Failed to search posts: {str(e)}")
+        # This would make actual API calls to LinkedIn
+        # For now, return mock data
+        text = f"LinkedIn post about {query}"
+        return [
+            LinkedInSearchPost(
+                **_SEARCH_POST_TEMPLATE,
+                post_id=f"search_post_{i}",
+                text=text,
+                author=f"user_{i}",
+                likes=15 + i * 2,
+                comments=3 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_company_info(self, company_id: str) -> Dict[str, Any]:
+    @external_call("LinkedIn", limiter=_API_LIMIT)
+    async def get_company_info(self, company_id: str) -> LinkedInCompany:
         """Get company information"""
-        try:
-            # This would make actual API calls to LinkedIn
-            # For now, return mock data
-            return {
-                "company_id": company_id,
-                "name": "Sample Company",
-                "followers": 10000,
-                "employees": 500,
-                "industry": "Technology",
-                "description": "Sample company description"
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_company_info", "company_id": company_id})
-            raise ExternalServiceError("LinkedIn", message=f"Failed to get company info: {str(e)}")
+        # This would make actual API calls to LinkedIn
+        # For now, return mock data
+        return LinkedInCompany(
+            company_id=company_id,
+            name="Sample Company",
+            followers=10000,
+            employees=500,
+            industry="Technology",
+            description="Sample company description"
+        )
+    
+    async def get_user_bundle(self, username: str, limit: int = 50) -> Dict[str, Any]:
+        """Get profile, posts and per-post analytics with independent calls issued concurrently"""
+        profile, posts = await asyncio.gather(self.get_user_profile(username), self.get_user_posts(username, limit))
+        results = await asyncio.gather(
+            *(self.get_post_analytics(post.post_id) for post in posts), return_exceptions=True
+        )
+        
+        # Failed analytics calls leave a None in place of that post's analytics
+        analytics = []
+        for post, result in zip(posts, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(result, {"operation": "get_user_bundle", "post_id": post.post_id})
+                result = None
+            analytics.append(result)
+        
+        return {"profile": profile, "posts": posts, "analytics": analytics}
+
+
+@lru_cache(maxsize=1)
+def get_linkedin_service() -> LinkedInService:
+    """Get the shared LinkedIn service instance"""
+    return LinkedInService()
@@ -0,0 +1,314 @@
+"""
+Typed records returned by the social media services
+"""
+from typing import Any, Dict, Tuple
+from dataclasses import asdict, dataclass
+
+
+class _Record:
+    """Base for social API records"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy for consumers that still expect dicts"""
+        return asdict(self)
+
+
+# Facebook
+@dataclass(frozen=True, slots=True)
+class FacebookPage(_Record):
+    """Facebook page profile"""
+    page_id: str
+    name: str
+    followers: int
+    likes: int
+    posts_count: int
+    description: str
+    category: str
+    website: str
+
+
+@dataclass(frozen=True, slots=True)
+class FacebookPageInsights(_Record):
+    """Facebook page-level insights"""
+    page_id: str
+    total_reach: int
+    total_impressions: int
+    total_engagement: int
+    follower_growth: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class FacebookPost(_Record):
+    """Post published by a Facebook page"""
+    post_id: str
+    message: str
+    likes: int
+    comments: int
+    shares: int
+    created_at: str
+    content_type: str
+    hashtags: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FacebookPostAnalytics(_Record):
+    """Facebook post analytics"""
+    post_id: str
+    likes: int
+    comments: int
+    shares: int
+    reach: int
+    impressions: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class FacebookSearchPost(_Record):
+    """Facebook post search hit"""
+    post_id: str
+    message: str
+    page_name: str
+    likes: int
+    comments: int
+    created_at: str
+
+
+# Instagram
+@dataclass(frozen=True, slots=True)
+class InstagramPostAnalytics(_Record):
+    """Instagram post analytics"""
+    post_id: str
+    likes: int
+    comments: int
+    shares: int
+    views: int
+    reach: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class InstagramTrendingHashtag(_Record):
+    """Trending Instagram hashtag"""
+    hashtag: str
+    post_count: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class InstagramPost(_Record):
+    """Post published by an Instagram account"""
+    id: str
+    caption: str
+    likes: int
+    comments: int
+    shares: int
+    views: int
+    posted_at: str
+    content_type: str
+    hashtags: Tuple[str, ...]
+    mentions: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class InstagramProfile(_Record):
+    """Instagram account profile"""
+    username: str
+    followers: int
+    following: int
+    posts_count: int
+    bio: str
+    verified: bool
+    profile_pic_url: str
+    category: str
+
+
+@dataclass(frozen=True, slots=True)
+class InstagramHashtagPost(_Record):
+    """Instagram post found by hashtag"""
+    id: str
+    username: str
+    caption: str
+    likes: int
+    comments: int
+    posted_at: str
+
+
+# LinkedIn
+@dataclass(frozen=True, slots=True)
+class LinkedInCompany(_Record):
+    """LinkedIn company page"""
+    company_id: str
+    name: str
+    followers: int
+    employees: int
+    industry: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedInPostAnalytics(_Record):
+    """LinkedIn post analytics"""
+    post_id: str
+    likes: int
+    comments: int
+    shares: int
+    views: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedInPost(_Record):
+    """Post published by a LinkedIn member"""
+    post_id: str
+    text: str
+    likes: int
+    comments: int
+    shares: int
+    created_at: str
+    content_type: str
+    hashtags: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedInProfile(_Record):
+    """LinkedIn member profile"""
+    username: str
+    followers: int
+    connections: int
+    posts_count: int
+    headline: str
+    summary: str
+    location: str
+    industry: str
+    company: str
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedInSearchPost(_Record):
+    """LinkedIn post search hit"""
+    post_id: str
+    text: str
+    author: str
+    likes: int
+    comments: int
+    created_at: str
+
+
+# Twitter
+@dataclass(frozen=True, slots=True)
+class TwitterTrendingTopic(_Record):
+    """Trending Twitter topic"""
+    topic: str
+    tweet_count: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class TweetAnalytics(_Record):
+    """Tweet analytics"""
+    tweet_id: str
+    likes: int
+    retweets: int
+    replies: int
+    impressions: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class TwitterProfile(_Record):
+    """Twitter account profile"""
+    username: str
+    followers: int
+    following: int
+    tweets_count: int
+    bio: str
+    verified: bool
+    profile_pic_url: str
+    location: str
+
+
+@dataclass(frozen=True, slots=True)
+class Tweet(_Record):
+    """Tweet published by an account"""
+    tweet_id: str
+    text: str
+    likes: int
+    retweets: int
+    replies: int
+    created_at: str
+    content_type: str
+    hashtags: Tuple[str, ...]
+    mentions: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TwitterSearchTweet(_Record):
+    """Tweet search hit"""
+    tweet_id: str
+    text: str
+    username: str
+    likes: int
+    retweets: int
+    created_at: str
+
+
+# YouTube
+@dataclass(frozen=True, slots=True)
+class YouTubeChannel(_Record):
+    """YouTube channel profile"""
+    channel_id: str
+    title: str
+    subscribers: int
+    videos_count: int
+    views: int
+    description: str
+    country: str
+    created_at: str
+
+
+@dataclass(frozen=True, slots=True)
+class YouTubeVideo(_Record):
+    """Video published by a YouTube channel"""
+    video_id: str
+    title: str
+    description: str
+    views: int
+    likes: int
+    comments: int
+    published_at: str
+    duration: str
+    tags: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class YouTubeTrendingVideo(_Record):
+    """Trending YouTube video"""
+    video_id: str
+    title: str
+    views: int
+    likes: int
+    published_at: str
+
+
+@dataclass(frozen=True, slots=True)
+class YouTubeVideoAnalytics(_Record):
+    """YouTube video analytics"""
+    video_id: str
+    views: int
+    likes: int
+    comments: int
+    shares: int
+    watch_time: int
+    engagement_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class YouTubeSearchVideo(_Record):
+    """YouTube video search hit"""
+    video_id: str
+    title: str
+    channel_title: str
+    views: int
+    published_at: str
@@ -2,131 +2,154 @@
 Twitter service for social media data collection
 """
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
+import asyncio
 from src.core.config import settings
-from src.core.logger import ai_logger
-from src.core.exceptions import ExternalServiceError
+from src.services.social._base import BaseSocialService
+from src.services.social._ratelimit import AsyncTokenBucket
+from src.services.social._external import external_call
+from src.services.social.models import (
+    Tweet, TweetAnalytics, TwitterProfile, TwitterSearchTweet, TwitterTrendingTopic
+)
 
 
-class TwitterService:
+# API v2 per 15-minute window: 900 lookups, 450 searches, 75 trend requests
+_LOOKUP_LIMIT = AsyncTokenBucket(rate=900 / 900, capacity=100)
+_SEARCH_LIMIT = AsyncTokenBucket(rate=450 / 900, capacity=50)
+_TRENDS_LIMIT = AsyncTokenBucket(rate=75 / 900, capacity=15)
+
+# Mock pages hold at most _MOCK_PAGE_SIZE records, all stamped with _MOCK_TIMESTAMP
+_MOCK_PAGE_SIZE = 10
+_MOCK_TIMESTAMP = "2024-01-01T12:00:00Z"
+
+# Invariant fields of mock records, passed as keyword arguments alongside the varying ones
+_USER_TWEET_TEMPLATE = {
+    "created_at": _MOCK_TIMESTAMP,
+    "content_type": "tweet",
+    "hashtags": ("#sample", "#test"),
+    "mentions": ("@user1", "@user2")
+}
+_SEARCH_TWEET_TEMPLATE = {
+    "created_at": _MOCK_TIMESTAMP
+}
+
+
+class TwitterService(BaseSocialService):
     """Twitter API service for data collection"""
     
-    def __init__(self):
-        self.api_key = settings.twitter_api_key
-        self.api_secret = settings.twitter_api_secret
-        self.access_token = settings.twitter_access_token
-        self.access_secret = settings.twitter_access_secret
-        self.logger = ai_logger
-        self.client = None
-        self._initialize_client()
+    service_name = "Twitter"
     
-    def _initialize_client(self):
-        """Initialize Twitter client"""
-        try:
-            # This would initialize the actual Twitter API client
-            # For now, we'll use a placeholder
-            self.client = None
-            self.logger.logger.info("Twitter service initialized")
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "initialize_twitter_client"})
-            raise ExternalServiceError("Twitter", message=f"Failed to initialize Twitter client: {str(e)}")
+    def __init__(self):
+        # Credentials are optional; Settings no longer declares them since the backend collects data
+        self.api_key = getattr(settings, "twitter_api_key", None)
+        self.api_secret = getattr(settings, "twitter_api_secret", None)
+        self.access_token = getattr(settings, "twitter_access_token", None)
+        self.access_secret = getattr(settings, "twitter_access_secret", None)
+        super().__init__()
     
-    async def get_user_profile(self, username: str) -> Dict[str, Any]:
+    @external_call("Twitter", cache_ttl=60, limiter=_LOOKUP_LIMIT)
+    async def get_user_profile(self, username: str) -> TwitterProfile:
         """Get user profile information"""
-        try:
-            # This would make actual API calls to Twitter
-            # For now, return mock data
-            return {
-                "username": username,
-                "followers": 25000,
-                "following": 1000,
-                "tweets_count": 500,
-                "bio": "Sample Twitter bio",
-                "verified": True,
-                "profile_pic_url": "https://example.com/profile.jpg",
-                "location": "New York, NY"
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_user_profile", "username": username})
-            raise ExternalServiceError("Twitter", message=f"Failed to get user profile: {str(e)}")
+        # This would make actual API calls to Twitter
+        # For now, return mock data
+        return TwitterProfile(
+            username=username,
+            followers=25000,
+            following=1000,
+            tweets_count=500,
+            bio="Sample Twitter bio",
+            verified=True,
+            profile_pic_url="https://example.com/profile.jpg",
+            location="New York, NY"
+        )
     
+    @external_call("Twitter", limiter=_LOOKUP_LIMIT)
     async def get_user_tweets(
         self, 
         username: str, 
         limit: int = 50, 
         days_back: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Tweet]:
         """Get user tweets"""
-        try:
-            # This would make actual API calls to Twitter
-            # For now, return mock data
-            tweets = []
-            for i in range(min(limit, 10)):
-                tweets.append({
-                    "tweet_id": f"tweet_{i}",
-                    "text": f"Sample tweet {i}",
-                    "likes": 50 + i * 5,
-                    "retweets": 10 + i,
-                    "replies": 5 + i,
-                    "created_at": "2024-01-01T12:00:00Z",
-                    "content_type": "tweet",
-                    "hashtags": ["#sample", "#test"],
-                    "mentions": ["@user1", "@user2"]
-                })
-            return tweets
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_user_tweets", "username": username})
-            raise ExternalServiceError("Twitter", message=f"Failed to get user tweets: {str(e)}")
+        # This would make actual API calls to Twitter
+        # For now, return mock data
+        return [
+            Tweet(
+                **_USER_TWEET_TEMPLATE,
+                tweet_id=f"tweet_{i}",
+                text=f"Sample tweet {i}",
+                likes=50 + i * 5,
+                retweets=10 + i,
+                replies=5 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_tweet_analytics(self, tweet_id: str) -> Dict[str, Any]:
+    @external_call("Twitter", limiter=_LOOKUP_LIMIT)
+    async def get_tweet_analytics(self, tweet_id: str) -> TweetAnalytics:
         """Get tweet analytics"""
-        try:
-            # This would make actual API calls to Twitter
-            # For now, return mock data
-            return {
-                "tweet_id": tweet_id,
-                "likes": 100,
-                "retweets": 25,
-                "replies": 15,
-                "impressions": 2000,
-                "engagement_rate": 7.0
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_tweet_analytics", "tweet_id": tweet_id})
-            raise ExternalServiceError("Twitter", message=f"Failed to get tweet analytics: {str(e)}")
+        # This would make actual API calls to Twitter
+        # For now, return mock data
+        return TweetAnalytics(
+            tweet_id=tweet_id,
+            likes=100,
+            retweets=25,
+            replies=15,
+            impressions=2000,
+            engagement_rate=7.0
+        )
     
-    async def search_tweets(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+    @external_call("Twitter", limiter=_SEARCH_LIMIT)
+    async def search_tweets(self, query: str, limit: int = 50) -> List[TwitterSearchTweet]:
         """Search tweets by query"""
-        try:
-            # This would make actual API calls to Twitter
-            # For now, return mock data
-            tweets = []
-            for i in range(min(limit, 10)):
-                tweets.append({
-                    "tweet_id": f"search_tweet_{i}",
-                    "text": f"Tweet about {query}",
-                    "username": f"user_{i}",
-                    "likes": 25 + i * 5,
-                    "retweets": 5 + i,
-                    "created_at": "2024-01-01T12:00:00Z"
-                })
-            return tweets
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "search_tweets", "query": query})
-            raise ExternalServiceError("Twitter", message=f"Failed to search tweets: {str(e)}")
+        # This would make actual API calls to Twitter
+        # For now, return mock data
+        text = f"Tweet about {query}"
+        return [
+            TwitterSearchTweet(
+                **_SEARCH_TWEET_TEMPLATE,
+                tweet_id=f"search_tweet_{i}",
+                text=text,
+                username=f"user_{i}",
+                likes=25 + i * 5,
+                retweets=5 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_trending_topics(self, limit: int = 20) -> List[Dict[str, Any]]:
+    @external_call("Twitter", cache_ttl=60, stale_ttl=600, limiter=_TRENDS_LIMIT)
+    async def get_trending_topics(self, limit: int = 20) -> List[TwitterTrendingTopic]:
         """Get trending topics"""
-        try:
-            # This would make actual API calls to Twitter
-            # For now, return mock data
-            topics = []
-            for i in range(min(limit, 10)):
-                topics.append({
-                    "topic": f"trending{i}",
-                    "tweet_count": 5000 + i * 500,
-                    "engagement_rate": 4.0 + i * 0.1
-                })
-            return topics
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_trending_topics"})
-            raise ExternalServiceError("Twitter", message=f"Failed to get trending topics: {str(e)}")
+        # This would make actual API calls to Twitter
+        # For now, return mock data
+        return [
+            TwitterTrendingTopic(
+                topic=f"trending{i}",
+                tweet_count=5000 + i * 500,
+                engagement_rate=4.0 + i * 0.1
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
+    
+    async def get_user_bundle(self, username: str, limit: int = 50) -> Dict[str, Any]:
+        """Get profile, tweets and per-tweet analytics with independent calls issued concurrently"""
+        profile, tweets = await asyncio.gather(self.get_user_profile(username), self.get_user_tweets(username, limit))
+        results = await asyncio.gather(
+            *(self.get_tweet_analytics(tweet.tweet_id) for tweet in tweets), return_exceptions=True
+        )
+        
+        # Failed analytics calls leave a None in place of that tweet's analytics
+        analytics = []
+        for tweet, result in zip(tweets, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(result, {"operation": "get_user_bundle", "tweet_id": tweet.tweet_id})
+                result = None
+            analytics.append(result)
+        
+        return {"profile": profile, "tweets": tweets, "analytics": analytics}
+
+
+@lru_cache(maxsize=1)
+def get_twitter_service() -> TwitterService:
+    """Get the shared Twitter service instance"""
+    return TwitterService()
@@ -2,130 +2,166 @@
 YouTube service for social media data collection
 """
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
+import asyncio
 from src.core.config import settings
-from src.core.logger import ai_logger
-from src.core.exceptions import ExternalServiceError
+from src.services.social._base import BaseSocialService
+from src.services.social._ratelimit import AsyncTokenBucket, rate_limited
+from src.services.social._external import external_call
+from src.services.social._batch import BatchQueue
+from src.services.social.models import (
+    YouTubeChannel, YouTubeSearchVideo, YouTubeTrendingVideo, YouTubeVideo, YouTubeVideoAnalytics
+)
 
 
-class YouTubeService:
+# Data API: 10,000 quota units per day; list calls cost 1 unit, searches 100
+_QUOTA_LIMIT = AsyncTokenBucket(rate=10000 / 86400, capacity=1000)
+
+# Mock pages hold at most _MOCK_PAGE_SIZE records, all stamped with _MOCK_TIMESTAMP
+_MOCK_PAGE_SIZE = 10
+_MOCK_TIMESTAMP = "2024-01-01T12:00:00Z"
+
+# Invariant fields of mock records, passed as keyword arguments alongside the varying ones
+_CHANNEL_VIDEO_TEMPLATE = {
+    "published_at": _MOCK_TIMESTAMP,
+    "duration": "5:30",
+    "tags": ("sample", "test")
+}
+_SEARCH_VIDEO_TEMPLATE = {
+    "published_at": _MOCK_TIMESTAMP
+}
+_TRENDING_VIDEO_TEMPLATE = {
+    "published_at": _MOCK_TIMESTAMP
+}
+
+
+class YouTubeService(BaseSocialService):
     """YouTube API service for data collection"""
     
-    def __init__(self):
-        self.api_key = settings.youtube_api_key
-        self.logger = ai_logger
-        self.client = None
-        self._initialize_client()
+    service_name = "YouTube"
     
-    def _initialize_client(self):
-        """Initialize YouTube client"""
-        try:
-            # This would initialize the actual YouTube API client
-            # For now, we'll use a placeholder
-            self.client = None
-            self.logger.logger.info("YouTube service initialized")
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "initialize_youtube_client"})
-            raise ExternalServiceError("YouTube", message=f"Failed to initialize YouTube client: {str(e)}")
+    def __init__(self):
+        # Credentials are optional; Settings no longer declares them since the backend collects data
+        self.api_key = getattr(settings, "youtube_api_key", None)
+        self._video_analytics_batch = BatchQueue("YouTube", self._fetch_video_analytics_batch)
+        super().__init__()
     
-    async def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
+    @external_call("YouTube", cache_ttl=60, limiter=_QUOTA_LIMIT)
+    async def get_channel_info(self, channel_id: str) -> YouTubeChannel:
         """Get channel information"""
-        try:
-            # This would make actual API calls to YouTube
-            # For now, return mock data
-            return {
-                "channel_id": channel_id,
-                "title": "Sample Channel",
-                "subscribers": 50000,
-                "videos_count": 200,
-                "views": 1000000,
-                "description": "Sample channel description",
-                "country": "US",
-                "created_at": "2020-01-01T00:00:00Z"
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_channel_info", "channel_id": channel_id})
-            raise ExternalServiceError("YouTube", message=f"Failed to get channel info: {str(e)}")
+        # This would make actual API calls to YouTube
+        # For now, return mock data
+        return YouTubeChannel(
+            channel_id=channel_id,
+            title="Sample Channel",
+            subscribers=50000,
+            videos_count=200,
+            views=1000000,
+            description="Sample channel description",
+            country="US",
+            created_at="2020-01-01T00:00:00Z"
+        )
     
+    @external_call("YouTube", limiter=_QUOTA_LIMIT)
     async def get_channel_videos(
         self, 
         channel_id: str, 
         limit: int = 50, 
         days_back: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> List[YouTubeVideo]:
         """Get channel videos"""
-        try:
-            # This would make actual API calls to YouTube
-            # For now, return mock data
-            videos = []
-            for i in range(min(limit, 10)):
-                videos.append({
-                    "video_id": f"video_{i}",
-                    "title": f"Sample Video {i}",
-                    "description": f"Sample video description {i}",
-                    "views": 1000 + i * 100,
-                    "likes": 50 + i * 5,
-                    "comments": 10 + i,
-                    "published_at": "2024-01-01T12:00:00Z",
-                    "duration": "5:30",
-                    "tags": ["sample", "test"]
-                })
-            return videos
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_channel_videos", "channel_id": channel_id})
-            raise ExternalServiceError("YouTube", message=f"Failed to get channel videos: {str(e)}")
+        # This would make actual API calls to YouTube
+        # For now, return mock data
+        return [
+            YouTubeVideo(
+                **_CHANNEL_VIDEO_TEMPLATE,
+                video_id=f"video_{i}",
+                title=f"Sample Video {i}",
+                description=f"Sample video description {i}",
+                views=1000 + i * 100,
+                likes=50 + i * 5,
+                comments=10 + i
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_video_analytics(self, video_id: str) -> Dict[str, Any]:
+    @external_call("YouTube")
+    async def get_video_analytics(self, video_id: str) -> YouTubeVideoAnalytics:
         """Get video analytics"""
-        try:
-            # This would make actual API calls to YouTube
-            # For now, return mock data
-            return {
-                "video_id": video_id,
-                "views": 5000,
-                "likes": 250,
-                "comments": 50,
-                "shares": 25,
-                "watch_time": 1200,
-                "engagement_rate": 6.5
-            }
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_video_analytics", "video_id": video_id})
-            raise ExternalServiceError("YouTube", message=f"Failed to get video analytics: {str(e)}")
+        # Concurrent requests are coalesced into one batched API call
+        return await self._video_analytics_batch.submit(video_id)
+    
+    @rate_limited(_QUOTA_LIMIT)
+    async def _fetch_video_analytics_batch(self, video_ids: List[str]) -> Dict[str, YouTubeVideoAnalytics]:
+        """Fetch analytics for up to 50 videos in one batched API call"""
+        # This would GET videos?part=statistics&id=id1,id2,... and map each returned item to
+        # its video id; ids the API leaves out fail individually
+        # For now, return mock data
+        return {
+            video_id: YouTubeVideoAnalytics(
+                video_id=video_id,
+                views=5000,
+                likes=250,
+                comments=50,
+                shares=25,
+                watch_time=1200,
+                engagement_rate=6.5
+            )
+            for video_id in video_ids
+        }
     
-    async def search_videos(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+    @external_call("YouTube", limiter=_QUOTA_LIMIT, cost=100)
+    async def search_videos(self, query: str, limit: int = 50) -> List[YouTubeSearchVideo]:
         """Search videos by query"""
-        try:
-            # This would make actual API calls to YouTube
-            # For now, return mock data
-            videos = []
-            for i in range(min(limit, 10)):
-                videos.append({
-                    "video_id": f"search_video_{i}",
-                    "title": f"Video about {query}",
-                    "channel_title": f"Channel {i}",
-                    "views": 500 + i * 50,
-                    "published_at": "2024-01-01T12:00:00Z"
-                })
-            return videos
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "search_videos", "query": query})
-            raise ExternalServiceError("YouTube", message=f"Failed to search videos: {str(e)}")
+        # This would make actual API calls to YouTube
+        # For now, return mock data
+        title = f"Video about {query}"
+        return [
+            YouTubeSearchVideo(
+                **_SEARCH_VIDEO_TEMPLATE,
+                video_id=f"search_video_{i}",
+                title=title,
+                channel_title=f"Channel {i}",
+                views=500 + i * 50
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
     
-    async def get_trending_videos(self, category: str = "all", limit: int = 20) -> List[Dict[str, Any]]:
+    @external_call("YouTube", cache_ttl=60, stale_ttl=600, limiter=_QUOTA_LIMIT)
+    async def get_trending_videos(self, category: str = "all", limit: int = 20) -> List[YouTubeTrendingVideo]:
         """Get trending videos"""
-        try:
-            # This would make actual API calls to YouTube
-            # For now, return mock data
-            videos = []
-            for i in range(min(limit, 10)):
-                videos.append({
-                    "video_id": f"trending_{i}",
-                    "title": f"Trending Video {i}",
-                    "views": 10000 + i * 1000,
-                    "likes": 500 + i * 50,
-                    "published_at": "2024-01-01T12:00:00Z"
-                })
-            return videos
-        except Exception as e:
-            self.logger.log_error(e, {"operation": "get_trending_videos"})
-            raise ExternalServiceError("YouTube", message=f"Failed to get trending videos: {str(e)}")
+        # This would make actual API calls to YouTube
+        # For now, return mock data
+        return [
+            YouTubeTrendingVideo(
+                **_TRENDING_VIDEO_TEMPLATE,
+                video_id=f"trending_{i}",
+                title=f"Trending Video {i}",
+                views=10000 + i * 1000,
+                likes=500 + i * 50
+            )
+            for i in range(min(limit, _MOCK_PAGE_SIZE))
+        ]
+    
+    async def get_channel_bundle(self, channel_id: str, limit: int = 50) -> Dict[str, Any]:
+        """Get channel, videos and per-video analytics with independent calls issued concurrently"""
+        channel, videos = await asyncio.gather(self.get_channel_info(channel_id), self.get_channel_videos(channel_id, limit))
+        results = await asyncio.gather(
+            *(self.get_video_analytics(video.video_id) for video in videos), return_exceptions=True
+        )
+        
+        # Failed analytics calls leave a None in place of that video's analytics
+        analytics = []
+        for video, result in zip(videos, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(result, {"operation": "get_channel_bundle", "video_id": video.video_id})
+                result = None
+            analytics.append(result)
+        
+        return {"channel": channel, "videos": videos, "analytics": analytics}
+
+
+@lru_cache(maxsize=1)
+def get_youtube_service() -> YouTubeService:
+    """Get the shared YouTube service instance"""
+    return YouTubeService()
@@ -3,7 +3,7 @@ Trend Analysis Service for Social Media Trends
 """
 import asyncio
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import numpy as np
 from datetime import datetime, timedelta
@@ -13,6 +13,13 @@ from src.services.rag_service import RAGService
 from src.services.nlp_utils import NLPService
 
 
+# Shared generator for mock trend data; each method draws all its values in one call per field
+_rng = np.random.default_rng()
+
+_COMPETITION_LEVELS = ["low", "medium", "high"]
+_TREND_DIRECTIONS = ["rising", "stable", "declining"]
+
+
 @dataclass
 class TrendingHashtag:
     """Trending hashtag data structure"""
@@ -385,24 +392,22 @@ class TrendAnalysisService:
         """Analyze trends for specific hashtags"""
         trending_hashtags = []
         
-        for hashtag in hashtags:
-            for platform in platforms:
-                trend_data = await self._get_hashtag_trend_data(
-                    hashtag, platform, time_period_days
-                )
-                
-                trending_hashtag = TrendingHashtag(
-                    hashtag=hashtag,
-                    current_volume=trend_data.get("volume", 1000),
-                    growth_rate=trend_data.get("growth_rate", 0.1),
-                    engagement_rate=trend_data.get("engagement_rate", 0.05),
-                    competition_level=trend_data.get("competition_level", "medium"),
-                    trend_direction=trend_data.get("trend_direction", "stable"),
-                    peak_time=trend_data.get("peak_time", "18:00-20:00"),
-                    related_hashtags=trend_data.get("related_hashtags", []),
-                    platform=platform
-                )
-                trending_hashtags.append(trending_hashtag)
+        pairs = [(hashtag, platform) for hashtag in hashtags for platform in platforms]
+        trend_data_batch = await self._get_hashtag_trend_data_batch(pairs, time_period_days)
+        
+        for (hashtag, platform), trend_data in zip(pairs, trend_data_batch):
+            trending_hashtag = TrendingHashtag(
+                hashtag=hashtag,
+                current_volume=trend_data.get("volume", 1000),
+                growth_rate=trend_data.get("growth_rate", 0.1),
+                engagement_rate=trend_data.get("engagement_rate", 0.05),
+                competition_level=trend_data.get("competition_level", "medium"),
+                trend_direction=trend_data.get("trend_direction", "stable"),
+                peak_time=trend_data.get("peak_time", "18:00-20:00"),
+                related_hashtags=trend_data.get("related_hashtags", []),
+                platform=platform
+            )
+            trending_hashtags.append(trending_hashtag)
         
         return trending_hashtags
     
@@ -417,16 +422,20 @@ class TrendAnalysisService:
         
         content_types = ["video", "image", "story", "reel", "post"]
         
-        for platform in platforms:
-            for content_type in content_types:
+        shape = (len(platforms), len(content_types))
+        engagement_scores = (0.7 + _rng.random(shape) * 0.3).tolist()
+        viral_potentials = (0.6 + _rng.random(shape) * 0.4).tolist()
+        
+        for i, platform in enumerate(platforms):
+            for j, content_type in enumerate(content_types):
                 if categories and not any(cat.lower() in content_type.lower() for cat in categories):
                     continue
                 
                 trending_content_item = TrendingContent(
                     content_type=content_type,
                     topic="general",
-                    engagement_score=0.7 + np.random.random() * 0.3,
-                    viral_potential=0.6 + np.random.random() * 0.4,
+                    engagement_score=engagement_scores[i][j],
+                    viral_potential=viral_potentials[i][j],
                     competition_level="medium",
                     optimal_posting_time="19:00-21:00",
                     target_audience=["18-34"],
@@ -447,19 +456,23 @@ class TrendAnalysisService:
         
         demographics = ["18-24", "25-34", "35-44", "45-54", "55+"]
         
-        for platform in platforms:
-            for demo in demographics:
+        shape = (len(platforms), len(demographics))
+        session_durations = (15 + _rng.integers(0, 10, shape)).tolist()
+        platform_preferences = (0.8 + _rng.random(shape) * 0.2).tolist()
+        
+        for i, platform in enumerate(platforms):
+            for j, demo in enumerate(demographics):
                 audience_trend = AudienceTrend(
                     demographic=demo,
                     interest_categories=["lifestyle", "fashion", "tech"],
                     engagement_patterns={
                         "peak_hours": "18:00-22:00",
                         "peak_days": ["Friday", "Saturday"],
-                        "avg_session_duration": 15 + np.random.randint(0, 10)
+                        "avg_session_duration": session_durations[i][j]
                     },
                     growth_trend="increasing",
                     platform_preferences={
-                        platform: 0.8 + np.random.random() * 0.2
+                        platform: platform_preferences[i][j]
                     },
                     content_preferences=["video", "image"]
                 )
@@ -492,16 +505,35 @@ class TrendAnalysisService:
         time_period_days: int
     ) -> Dict[str, Any]:
         """Get hashtag trend data"""
+        trend_data = await self._get_hashtag_trend_data_batch([(hashtag, platform)], time_period_days)
+        return trend_data[0]
+    
+    async def _get_hashtag_trend_data_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        time_period_days: int
+    ) -> List[Dict[str, Any]]:
+        """Get hashtag trend data for (hashtag, platform) pairs"""
         # Mock implementation
-        return {
-            "volume": 10000 + np.random.randint(0, 5000),
-            "growth_rate": 0.1 + np.random.random() * 0.2,
-            "engagement_rate": 0.05 + np.random.random() * 0.05,
-            "competition_level": np.random.choice(["low", "medium", "high"]),
-            "trend_direction": np.random.choice(["rising", "stable", "declining"]),
-            "peak_time": "18:00-20:00",
-            "related_hashtags": [f"#{hashtag}_related_{i}" for i in range(3)]
-        }
+        n = len(pairs)
+        volumes = (10000 + _rng.integers(0, 5000, n)).tolist()
+        growth_rates = (0.1 + _rng.random(n) * 0.2).tolist()
+        engagement_rates = (0.05 + _rng.random(n) * 0.05).tolist()
+        competition_levels = _rng.choice(_COMPETITION_LEVELS, n).tolist()
+        trend_directions = _rng.choice(_TREND_DIRECTIONS, n).tolist()
+        
+        return [
+            {
+                "volume": volumes[i],
+                "growth_rate": growth_rates[i],
+                "engagement_rate": engagement_rates[i],
+                "competition_level": competition_levels[i],
+                "trend_direction": trend_directions[i],
+                "peak_time": "18:00-20:00",
+                "related_hashtags": [f"#{hashtag}_related_{j}" for j in range(3)]
+            }
+            for i, (hashtag, _platform) in enumerate(pairs)
+        ]
     
     async def _get_related_hashtags(
         self,
@@ -530,9 +562,12 @@ class TrendAnalysisService:
     ) -> Dict[str, float]:
         """Predict engagement metrics"""
         # Mock implementation
+        likes, comments, shares, saves = (
+            np.array([0.05, 0.01, 0.005, 0.002]) + _rng.random(4) * np.array([0.05, 0.02, 0.01, 0.005])
+        ).tolist()
         return {
-            "likes": 0.05 + np.random.random() * 0.05,
-            "comments": 0.01 + np.random.random() * 0.02,
-            "shares": 0.005 + np.random.random() * 0.01,
-            "saves": 0.002 + np.random.random() * 0.005
+            "likes": likes,
+            "comments": comments,
+            "shares": shares,
+            "saves": saves
         }
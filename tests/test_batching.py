@@ -0,0 +1,172 @@
+"""
+Tests for request batching, search coalescing and vectorized scoring paths
+"""
+import pytest
+import asyncio
+import numpy as np
+from src.core.exceptions import ExternalServiceError
+from src.services.social._batch import BatchQueue
+from src.services.rag_service import _SearchCoalescer
+from src.services.matchmaking_service import CandidateGenerator
+from src.services.performance_prediction_service import (
+    PerformancePredictionService,
+    _perf_metrics_kernel,
+    _perf_metrics_batch,
+    _content_risks_batch
+)
+
+
+class TestBatchQueue:
+    """Test cases for BatchQueue"""
+    
+    @pytest.mark.asyncio
+    async def test_fan_out(self):
+        """Concurrent submits share batched fetches and each caller gets its own result"""
+        batches = []
+        
+        async def fetch(keys):
+            batches.append(list(keys))
+            return {key: key.upper() for key in keys}
+        
+        queue = BatchQueue("Test", fetch, max_batch=4, max_wait_ms=5)
+        keys = [f"id{i}" for i in range(10)] + ["id0"]
+        results = await asyncio.gather(*(queue.submit(key) for key in keys))
+        
+        assert results == [key.upper() for key in keys]
+        assert all(len(batch) <= 4 for batch in batches)
+        assert sorted(key for batch in batches for key in batch) == sorted(set(keys))
+    
+    @pytest.mark.asyncio
+    async def test_missing_id_fails_only_its_callers(self):
+        """An id absent from the batch response fails alone"""
+        async def fetch(keys):
+            return {key: key for key in keys if key != "bad"}
+        
+        queue = BatchQueue("Test", fetch, max_wait_ms=1)
+        good, bad = await asyncio.gather(queue.submit("good"), queue.submit("bad"), return_exceptions=True)
+        
+        assert good == "good"
+        assert isinstance(bad, ExternalServiceError)
+    
+    @pytest.mark.asyncio
+    async def test_per_id_exception(self):
+        """An exception mapped to an id is raised to that id's callers"""
+        async def fetch(keys):
+            return {key: ValueError(key) if key == "bad" else key for key in keys}
+        
+        queue = BatchQueue("Test", fetch, max_wait_ms=1)
+        good, bad = await asyncio.gather(queue.submit("good"), queue.submit("bad"), return_exceptions=True)
+        
+        assert good == "good"
+        assert isinstance(bad, ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_fetch_failure_fails_whole_batch(self):
+        """A failed batch fetch is raised to every caller in the batch"""
+        async def fetch(keys):
+            raise ConnectionError("down")
+        
+        queue = BatchQueue("Test", fetch, max_wait_ms=1)
+        results = await asyncio.gather(*(queue.submit(f"id{i}") for i in range(3)), return_exceptions=True)
+        
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert not queue._flushes
+
+
+class _FakeVectorStore:
+    """Vector store returning row index hits and recording batch sizes"""
+    
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+    
+    async def search_batch(self, query_vectors, k):
+        self.batches.append(len(query_vectors))
+        if self.fail:
+            raise RuntimeError("search failed")
+        return [[(row, rank) for rank in range(k)] for row in range(len(query_vectors))]
+
+
+class TestSearchCoalescer:
+    """Test cases for _SearchCoalescer"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_batch_and_keep_own_k(self):
+        """Concurrent searches go out as one batch; each caller gets its own top k"""
+        store = _FakeVectorStore()
+        coalescer = _SearchCoalescer(store)
+        results = await asyncio.gather(
+            coalescer.search(np.ones(4, dtype=np.float32), 1),
+            coalescer.search(np.ones(4, dtype=np.float32), 3)
+        )
+        
+        assert store.batches == [2]
+        assert [len(hits) for hits in results] == [1, 3]
+        assert results[0] == [(0, 0)] and results[1][0] == (1, 0)
+    
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller(self):
+        """A failed batch search is raised to every waiting caller"""
+        coalescer = _SearchCoalescer(_FakeVectorStore(fail=True))
+        results = await asyncio.gather(
+            *(coalescer.search(np.ones(4, dtype=np.float32), 2) for _ in range(3)),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestCandidateGenerator:
+    """Test cases for CandidateGenerator"""
+    
+    def test_returns_nearest_creators(self):
+        """The shortlist contains the creators closest to the query"""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((100, 32)).astype(np.float32)
+        generator = CandidateGenerator(embeddings)
+        
+        shortlist = generator.search(embeddings[42].tolist(), 5)
+        assert len(shortlist) == 5
+        assert 42 in shortlist
+    
+    def test_top_k_bounds(self):
+        """top_k is capped by the table size and non-positive top_k returns nothing"""
+        generator = CandidateGenerator(np.eye(3, dtype=np.float32))
+        
+        assert len(generator.search([1.0, 0.0, 0.0], 10)) == 3
+        assert len(generator.search([1.0, 0.0, 0.0], 0)) == 0
+
+
+class TestVectorizedPredictions:
+    """Vectorized prediction paths match their scalar counterparts"""
+    
+    def test_perf_metrics_batch_matches_kernel(self):
+        """_perf_metrics_batch gives the kernel's estimates for every row"""
+        rng = np.random.default_rng(0)
+        base_reach = rng.uniform(1000, 100000, 50)
+        trending = rng.uniform(0, 1, 50)
+        engagement = rng.uniform(0, 0.1, 50)
+        
+        batch = _perf_metrics_batch(base_reach, trending, engagement)
+        for i in range(50):
+            expected = _perf_metrics_kernel(base_reach[i], trending[i], engagement[i])
+            assert tuple(int(column[i]) for column in batch.values()) == tuple(expected)
+    
+    @pytest.mark.asyncio
+    async def test_content_risks_batch_matches_scalar(self):
+        """_content_risks_batch flags the same risks as _assess_content_risk_factors"""
+        service = PerformancePredictionService(seed=0)
+        cases = [(40, 10, 0.1), (5, 100, 0.9), (31, 49, 0.5), (30, 50, 0.3)]
+        
+        batch = _content_risks_batch(
+            np.array([case[0] for case in cases]),
+            np.array([case[1] for case in cases]),
+            np.array([case[2] for case in cases])
+        )
+        for (hashtags, length, trending), risks in zip(cases, batch):
+            expected = await service._assess_content_risk_factors(
+                {"hashtag_count": hashtags, "description_length": length, "trending_potential": trending},
+                "instagram",
+                "general"
+            )
+            assert risks == expected
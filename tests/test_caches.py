@@ -0,0 +1,226 @@
+"""
+Tests for the prompt, embedding and social response caches
+"""
+import pytest
+import asyncio
+import numpy as np
+from src.core.exceptions import ExternalServiceError
+from src.models import prompt_cache
+from src.models.prompt_cache import SemanticPromptCache
+from src.models.embedding_cache import EmbeddingCache
+from src.services.social._cache import async_ttl_cache
+from src.services.rag_service import RAGService
+
+
+def _counting_factory(value):
+    """Response factory that records how often it was called"""
+    calls = []
+    
+    async def factory():
+        calls.append(1)
+        return value
+    
+    return factory, calls
+
+
+class TestSemanticPromptCache:
+    """Test cases for SemanticPromptCache"""
+    
+    @pytest.mark.asyncio
+    async def test_exact_hit(self):
+        """Same prompt and parameters are served from the cache"""
+        cache = SemanticPromptCache(maxsize=8, threshold=0.95)
+        factory, calls = _counting_factory("response")
+        
+        assert await cache.get_or_compute("prompt", {"max_tokens": 10}, factory) == "response"
+        assert await cache.get_or_compute("prompt", {"max_tokens": 10}, factory) == "response"
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_parameters_must_match(self):
+        """A different parameter set is a miss even for the same prompt"""
+        cache = SemanticPromptCache(maxsize=8, threshold=0.95)
+        factory, calls = _counting_factory("response")
+        
+        await cache.get_or_compute("prompt", {"max_tokens": 10}, factory)
+        await cache.get_or_compute("prompt", {"max_tokens": 20}, factory)
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_near_duplicate_hit_and_distant_miss(self):
+        """Prompts embedding above the threshold share a response; others do not"""
+        vectors = {"a": [1.0, 0.0], "a2": [0.99, 0.01], "b": [0.0, 1.0]}
+        
+        async def embed(prompt):
+            return vectors[prompt]
+        
+        cache = SemanticPromptCache(maxsize=8, threshold=0.95)
+        factory, calls = _counting_factory("response")
+        
+        await cache.get_or_compute("a", {}, factory, embed)
+        await cache.get_or_compute("a2", {}, factory, embed)
+        assert len(calls) == 1
+        
+        await cache.get_or_compute("b", {}, factory, embed)
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_without_embedder_only_exact_hits(self):
+        """Without an embedder near-duplicate prompts are computed separately"""
+        cache = SemanticPromptCache(maxsize=8, threshold=0.0)
+        factory, calls = _counting_factory("response")
+        
+        await cache.get_or_compute("20% off", {}, factory)
+        await cache.get_or_compute("30% off", {}, factory)
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_eviction(self):
+        """Least recently used entries are evicted past maxsize"""
+        cache = SemanticPromptCache(maxsize=2, threshold=0.95)
+        factory, calls = _counting_factory("response")
+        
+        for prompt in ("one", "two", "three", "one"):
+            await cache.get_or_compute(prompt, {}, factory)
+        assert len(calls) == 4
+    
+    @pytest.mark.asyncio
+    async def test_recommendations_use_exact_matching(self, monkeypatch):
+        """Campaigns differing only in numbers never share cached recommendations"""
+        monkeypatch.setattr(prompt_cache, "_prompt_cache", SemanticPromptCache(maxsize=8, threshold=0.0))
+        
+        class _Embedder:
+            async def embed_text(self, text):
+                return [1.0, 0.0]
+        
+        service = RAGService()
+        service.embedding_model = _Embedder()
+        prompts = []
+        
+        async def generate(prompt, **kwargs):
+            prompts.append(prompt)
+            return {"content": f"- Spend {len(prompts)}"}
+        
+        monkeypatch.setattr(service, "_generate_deduplicated", generate)
+        first = await service.generate_campaign_recommendations({"budget": 1000}, "user")
+        second = await service.generate_campaign_recommendations({"budget": 5000}, "user")
+        
+        assert len(prompts) == 2
+        assert first != second
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache"""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Embedding cache in a temporary database"""
+        return EmbeddingCache(str(tmp_path / "embeddings.db"))
+    
+    def test_round_trip_is_lossless(self, cache):
+        """A hit returns exactly the float32 vector that was stored"""
+        vector = np.random.default_rng(0).random(16).astype(np.float32)
+        cache.put("Some Text", "model", vector)
+        
+        cached = cache.get("  some text ", "model")
+        assert cached is not None
+        assert cached.dtype == np.float32
+        np.testing.assert_array_equal(cached, vector)
+    
+    def test_miss_and_model_isolation(self, cache):
+        """Unknown texts and other models miss"""
+        cache.put("text", "model-a", [0.1, 0.2])
+        assert cache.get("other", "model-a") is None
+        assert cache.get("text", "model-b") is None
+    
+    def test_large_batch(self, cache):
+        """Batches beyond one query chunk are looked up completely and in order"""
+        texts = [f"text {i}" for i in range(1200)]
+        vectors = np.arange(1200 * 2, dtype=np.float32).reshape(1200, 2)
+        cache.put_many(texts, "model", vectors)
+        
+        cached = cache.get_many(texts + ["missing"], "model")
+        assert cached[-1] is None
+        np.testing.assert_array_equal(np.stack(cached[:-1]), vectors)
+    
+    def test_rows_with_mismatched_dim_miss(self, cache):
+        """Rows whose blob size disagrees with their dim are treated as misses"""
+        cache._conn.execute(
+            "INSERT INTO emb VALUES (?, ?, ?, ?)",
+            (cache._key("legacy"), "model", 4, np.zeros(4, dtype=np.float16).tobytes())
+        )
+        assert cache.get("legacy", "model") is None
+
+
+class _Service:
+    """Minimal service whose fetch method is cached"""
+    
+    def __init__(self, ttl=60, stale_ttl=0):
+        self.calls = 0
+        self.fail = False
+        
+        @async_ttl_cache(ttl, stale_ttl_seconds=stale_ttl)
+        async def fetch(service, key):
+            service.calls += 1
+            await asyncio.sleep(0.01)
+            if service.fail:
+                raise ExternalServiceError("Test", message="upstream down")
+            return f"{key}:{service.calls}"
+        
+        self._fetch = fetch
+    
+    async def fetch(self, key):
+        return await self._fetch(self, key)
+
+
+class TestAsyncTTLCache:
+    """Test cases for async_ttl_cache"""
+    
+    @pytest.mark.asyncio
+    async def test_hit_and_miss(self):
+        """Repeated keys hit the cache; new keys call upstream"""
+        service = _Service()
+        assert await service.fetch("a") == "a:1"
+        assert await service.fetch("a") == "a:1"
+        assert await service.fetch("b") == "b:2"
+        assert service.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        """Concurrent misses for one key make a single upstream call"""
+        service = _Service()
+        results = await asyncio.gather(*(service.fetch("a") for _ in range(10)))
+        assert set(results) == {"a:1"}
+        assert service.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_stale_value_served_on_error(self):
+        """An upstream error after expiry is answered with the last good value"""
+        service = _Service(ttl=0.02)
+        assert await service.fetch("a") == "a:1"
+        await asyncio.sleep(0.03)
+        
+        service.fail = True
+        assert await service.fetch("a") == "a:1"
+    
+    @pytest.mark.asyncio
+    async def test_error_without_previous_value_raises(self):
+        """Errors propagate when there is nothing to fall back to"""
+        service = _Service()
+        service.fail = True
+        with pytest.raises(ExternalServiceError):
+            await service.fetch("a")
+    
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """Within the stale window the old value returns at once and one refresh runs behind it"""
+        service = _Service(ttl=0.02, stale_ttl=1)
+        assert await service.fetch("a") == "a:1"
+        await asyncio.sleep(0.03)
+        
+        results = await asyncio.gather(*(service.fetch("a") for _ in range(5)))
+        assert set(results) == {"a:1"}
+        
+        await asyncio.sleep(0.03)
+        assert service.calls == 2
+        assert await service.fetch("a") == "a:2"
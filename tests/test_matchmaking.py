@@ -0,0 +1,136 @@
+"""
+Tests for retrieve-then-rerank creator matchmaking
+"""
+import pytest
+import numpy as np
+from src.services import matchmaking_service
+from src.services.matchmaking_service import (
+    MatchmakingService,
+    BrandProfile,
+    CreatorProfile,
+    CreatorTable,
+    _SHORTLIST_SIZE,
+    _quantize_embeddings,
+    _approximate_cosine_int8,
+    _cosine_similarities
+)
+
+_POOL_SIZE = 1000
+_DIMENSION = 16
+
+
+class _EmbeddedCreatorService(MatchmakingService):
+    """Matchmaking over a creator pool where every creator carries an embedding"""
+    
+    def __init__(self):
+        super().__init__(seed=0)
+        self.embeddings = np.random.default_rng(0).standard_normal((_POOL_SIZE, _DIMENSION)).astype(np.float32)
+        self.scored = 0
+    
+    def _creator_pool_size(self):
+        return _POOL_SIZE
+    
+    async def _fetch_creator_batch(self, rows):
+        return CreatorTable.from_profiles([
+            CreatorProfile(
+                creator_id=f"creator_{i}",
+                username=f"creator_{i}",
+                platforms=["instagram"],
+                follower_count={"instagram": 10000},
+                engagement_rate={"instagram": 0.05},
+                content_categories=["tech"],
+                audience_demographics={"age_range": "18-34"},
+                content_style="casual",
+                collaboration_history=[],
+                availability="available",
+                rates={"instagram": 1000},
+                embedding=self.embeddings[i].tolist()
+            )
+            for i in rows
+        ])
+    
+    def _make_scorer(self, brand_profile, budget_constraints=None):
+        scorer = super()._make_scorer(brand_profile, budget_constraints)
+        
+        def counting_scorer(creators):
+            self.scored += len(creators)
+            return scorer(creators)
+        
+        return counting_scorer
+
+
+def _brand(embedding=None):
+    """Brand profile with an optional embedding"""
+    return BrandProfile(
+        brand_id="brand",
+        name="Brand",
+        industry="Technology",
+        target_audience=["18-34"],
+        content_preferences=["tech"],
+        budget_range="medium",
+        campaign_goals=["engagement"],
+        brand_values=["innovation"],
+        preferred_content_types=["video"],
+        social_media_presence={"instagram": True},
+        embedding=embedding
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_candidate_generator():
+    """Each test builds its own candidate generator"""
+    matchmaking_service._candidate_generator_cache.clear()
+    yield
+    matchmaking_service._candidate_generator_cache.clear()
+
+
+class TestFindCompatibleCreators:
+    """Test cases for candidate generation inside find_compatible_creators"""
+    
+    @pytest.mark.asyncio
+    async def test_scores_only_shortlisted_creators(self):
+        """With a brand embedding only the shortlist is fully scored"""
+        service = _EmbeddedCreatorService()
+        matches = await service.find_compatible_creators(
+            _brand(service.embeddings[7].tolist()), max_matches=5, min_compatibility_score=0.0
+        )
+        
+        assert service.scored == _SHORTLIST_SIZE
+        assert len(matches) == 5
+    
+    @pytest.mark.asyncio
+    async def test_shortlist_contains_nearest_creator(self):
+        """The creator closest to the brand embedding survives retrieval"""
+        service = _EmbeddedCreatorService()
+        shortlist = await service._shortlist(_brand(service.embeddings[7].tolist()))
+        
+        assert len(shortlist) == _SHORTLIST_SIZE
+        assert 7 in shortlist
+    
+    @pytest.mark.asyncio
+    async def test_without_brand_embedding_scores_every_creator(self):
+        """Without a brand embedding there is nothing to retrieve on, so all creators are scored"""
+        service = _EmbeddedCreatorService()
+        await service.find_compatible_creators(_brand(), max_matches=5, min_compatibility_score=0.0)
+        
+        assert service.scored == _POOL_SIZE
+    
+    @pytest.mark.asyncio
+    async def test_small_pool_retrieves_with_int8_prefilter(self):
+        """Pools below the HNSW threshold are retrieved with the int8-quantized scan"""
+        service = _EmbeddedCreatorService()
+        await service._shortlist(_brand(service.embeddings[7].tolist()))
+        generator = await service._get_candidate_generator()
+        
+        assert generator.index is None
+        assert generator.codes.dtype == np.int8
+        assert generator.codes.shape == (_POOL_SIZE, _DIMENSION)
+    
+    def test_int8_cosine_tracks_exact_cosine(self):
+        """The int8 approximation stays close to the exact cosine similarity"""
+        embeddings = np.random.default_rng(1).standard_normal((100, _DIMENSION)).astype(np.float32)
+        codes, _ = _quantize_embeddings(embeddings)
+        
+        approximate = _approximate_cosine_int8(codes[0], codes)
+        exact = _cosine_similarities(embeddings[0], embeddings)
+        np.testing.assert_allclose(approximate, exact, atol=0.02)
@@ -0,0 +1,23 @@
+"""
+Tests for NLP content analysis
+"""
+import pytest
+from src.services.nlp_utils import NLPService
+
+
+class TestReadability:
+    """Test cases for readability scoring"""
+    
+    @pytest.mark.parametrize("content", [
+        "Big news! Our 2024 launch is live. Get 20% off today #sale #launch",
+        "Hello there. Don't miss another sentence here!",
+        "no terminator at all @someone https://example.com"
+    ])
+    def test_quality_report_matches_standalone_score(self, content):
+        """analyze_content_quality reports the same readability as calculate_readability_score"""
+        service = NLPService()
+        report = service.analyze_content_quality(content, "post", "instagram")
+        readability = service.calculate_readability_score(content)
+        
+        assert report["analysis"]["readability"] == readability
+        assert report["metrics"]["word_count"] == readability["words"]
@@ -0,0 +1,158 @@
+"""
+Tests for retry classification, retries and client-side rate limiting of social API calls
+"""
+import pytest
+import asyncio
+import aiohttp
+from yarl import URL
+from src.core.exceptions import RateLimitExceededError, ValidationError
+from src.services.social import _retry
+from src.services.social._retry import retrying, _classify, _parse_retry_after
+from src.services.social._ratelimit import AsyncTokenBucket
+
+
+def _response_error(status, retry_after=None):
+    """aiohttp response error with an optional Retry-After header"""
+    url = URL("https://api.example.com")
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return aiohttp.ClientResponseError(
+        aiohttp.RequestInfo(url, "GET", {}, url), (), status=status, headers=headers
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry waits instead of sleeping"""
+    recorded = []
+    
+    async def fake_sleep(delay):
+        recorded.append(delay)
+    
+    monkeypatch.setattr(_retry.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _flaky(errors, result="ok"):
+    """Async callable raising each of errors in turn, then returning result"""
+    calls = []
+    
+    async def call():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+    
+    return call, calls
+
+
+class TestClassify:
+    """Test cases for _classify and _parse_retry_after"""
+    
+    def test_transient_errors(self):
+        """Throttling, server errors, timeouts and connection errors are transient"""
+        assert _classify(_response_error(503)) == (True, None)
+        assert _classify(_response_error(429, "3")) == (True, 3.0)
+        assert _classify(asyncio.TimeoutError()) == (True, None)
+        assert _classify(aiohttp.ClientConnectionError()) == (True, None)
+        assert _classify(RateLimitExceededError("Test", retry_after=7)) == (True, 7)
+    
+    def test_permanent_errors(self):
+        """Other client errors and unrelated exceptions are not retried"""
+        assert _classify(_response_error(404)) == (False, None)
+        assert _classify(_response_error(401)) == (False, None)
+        assert _classify(ValidationError("field", None))[0] is False
+        assert _classify(ValueError())[0] is False
+    
+    def test_parse_retry_after(self):
+        """Retry-After is read as seconds or an HTTP date; junk is ignored"""
+        assert _parse_retry_after("2.5") == 2.5
+        assert _parse_retry_after("-1") == 0.0
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after(None) is None
+
+
+class TestRetrying:
+    """Test cases for the retrying decorator"""
+    
+    @pytest.mark.asyncio
+    async def test_transient_errors_retried(self, sleeps):
+        """Transient failures are retried until the call succeeds"""
+        call, calls = _flaky([_response_error(502), asyncio.TimeoutError()])
+        assert await retrying(attempts=4)(call)() == "ok"
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+    
+    @pytest.mark.asyncio
+    async def test_permanent_error_not_retried(self, sleeps):
+        """A 404 is raised at once"""
+        call, calls = _flaky([_response_error(404)])
+        with pytest.raises(aiohttp.ClientResponseError):
+            await retrying(attempts=4)(call)()
+        assert len(calls) == 1
+        assert sleeps == []
+    
+    @pytest.mark.asyncio
+    async def test_retry_after_honored(self, sleeps):
+        """The wait before a retry is the server's Retry-After when given"""
+        call, calls = _flaky([_response_error(429, "1.5")])
+        assert await retrying(attempts=2)(call)() == "ok"
+        assert sleeps == [1.5]
+    
+    @pytest.mark.asyncio
+    async def test_attempts_exhausted(self, sleeps):
+        """The last error is raised once all attempts fail"""
+        call, calls = _flaky([_response_error(503)] * 5)
+        with pytest.raises(aiohttp.ClientResponseError):
+            await retrying(attempts=3)(call)()
+        assert len(calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_deadline(self, sleeps):
+        """A wait that would end past the deadline is not taken"""
+        call, calls = _flaky([_response_error(429, "30")])
+        with pytest.raises(aiohttp.ClientResponseError):
+            await retrying(attempts=4, deadline=5)(call)()
+        assert len(calls) == 1
+        assert sleeps == []
+
+
+class TestAsyncTokenBucket:
+    """Test cases for AsyncTokenBucket"""
+    
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self):
+        """Up to capacity tokens are granted at once"""
+        bucket = AsyncTokenBucket(rate=1, capacity=5)
+        await asyncio.wait_for(asyncio.gather(*(bucket.acquire() for _ in range(5))), timeout=0.5)
+    
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        """Callers past capacity wait for the refill"""
+        bucket = AsyncTokenBucket(rate=100, capacity=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        assert loop.time() - start >= 0.015
+    
+    @pytest.mark.asyncio
+    async def test_cost_above_capacity_rejected(self):
+        """A cost the bucket can never cover is an error"""
+        bucket = AsyncTokenBucket(rate=1, capacity=2)
+        with pytest.raises(ValueError):
+            await bucket.acquire(3)
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_refunds(self):
+        """A waiter cancelled while sleeping hands its tokens back"""
+        bucket = AsyncTokenBucket(rate=1, capacity=1)
+        await bucket.acquire()
+        
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        assert bucket._tokens < 0
+        
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert bucket._tokens == pytest.approx(0, abs=0.1)
@@ -0,0 +1,67 @@
+"""
+Tests for the FAISS vector store
+"""
+import pytest
+import json
+import numpy as np
+import faiss
+from src.core.config import settings
+from src.models.vector_store import FAISSVectorStore, Document
+
+
+def _documents(count, dimension=8):
+    """Documents with random embeddings"""
+    rng = np.random.default_rng(0)
+    return [
+        Document(id=f"doc{i}", content=f"content {i}", embedding=rng.standard_normal(dimension).tolist())
+        for i in range(count)
+    ]
+
+
+class TestFAISSVectorStore:
+    """Test cases for FAISSVectorStore"""
+    
+    @pytest.mark.asyncio
+    async def test_empty_store_search(self, tmp_path):
+        """Searching an empty store returns no results"""
+        store = FAISSVectorStore(dimension=8, index_path=str(tmp_path / "index"))
+        await store.initialize()
+        
+        assert await store.search([0.1] * 8, k=5) == []
+        assert await store.search_batch(np.ones((2, 8), dtype=np.float32), k=5) == [[], []]
+    
+    @pytest.mark.asyncio
+    async def test_loaded_index_without_metadata_is_not_upgraded(self, tmp_path, monkeypatch):
+        """An index file with no metadata loads as is past the IVF threshold"""
+        index_path = str(tmp_path / "index")
+        index = faiss.IndexFlatIP(8)
+        index.add(np.random.default_rng(0).standard_normal((50, 8)).astype(np.float32))
+        faiss.write_index(index, f"{index_path}.index")
+        monkeypatch.setattr(settings, "faiss_ivf_threshold", 10)
+        
+        store = FAISSVectorStore(dimension=8, index_path=index_path)
+        await store.initialize()
+        
+        assert not isinstance(store.index, faiss.IndexIVF)
+        assert await store.get_document_count() == 50
+    
+    @pytest.mark.asyncio
+    async def test_loaded_index_with_partial_metadata_is_not_upgraded(self, tmp_path, monkeypatch):
+        """An index whose metadata misses some vectors loads as is past the IVF threshold"""
+        index_path = str(tmp_path / "index")
+        store = FAISSVectorStore(dimension=8, index_path=index_path)
+        await store.initialize()
+        await store.add_documents(_documents(50))
+        
+        with open(f"{index_path}.metadata.json") as f:
+            metadata = json.load(f)
+        del metadata["documents"]["7"]
+        with open(f"{index_path}.metadata.json", "w") as f:
+            json.dump(metadata, f)
+        monkeypatch.setattr(settings, "faiss_ivf_threshold", 10)
+        
+        reloaded = FAISSVectorStore(dimension=8, index_path=index_path)
+        await reloaded.initialize()
+        
+        assert not isinstance(reloaded.index, faiss.IndexIVF)
+        assert len(await reloaded.search(_documents(50)[3].embedding, k=1)) == 1